@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, Integer, String
+from sqlalchemy import DateTime, Enum, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.ai.gen.conversation.domain.models import Role
@@ -9,6 +9,7 @@ from core.db import Base
 
 class AIMessage(Base):
     __tablename__ = "twitch_messages"
+    __table_args__ = (Index("ix_twitch_messages_channel_created", "channel_name", "created_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, nullable=False)
     channel_name: Mapped[str] = mapped_column(String, nullable=False)
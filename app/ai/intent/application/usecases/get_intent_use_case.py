@@ -8,7 +8,7 @@ class GetIntentFromTextUseCase:
 
     async def get_intent_from_text(self, channel_name: str, text: str) -> Intent:
         with self._intent_uow_factory.create(read_only=True) as uow:
-            detected_intent = uow.intent_detector.extract_intent_from_text(text)
+            detected_intent = await uow.intent_detector.extract_intent_from_text(text)
             if detected_intent in (Intent.HELLO, Intent.DANKAR_CUT, Intent.JACKBOX):
                 return await uow.intent_detector.validate_intent_via_llm(channel_name, detected_intent, text, uow.llm_repository)
             return detected_intent
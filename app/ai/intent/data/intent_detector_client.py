@@ -1,30 +1,143 @@
-import requests
+import asyncio
+
+import httpx
 
 from app.ai.gen.conversation.domain.models import AIMessage, Role
 from app.ai.gen.llm.domain.llm_repository import LLMRepository
 from app.ai.gen.llm.domain.model.assistant import AIAssistant
+from app.ai.intent.domain.exceptions.intent_exceptions import IntentDetectorError
 from app.ai.intent.domain.intent_detector import IntentDetectorClient
 from app.ai.intent.domain.models import Intent
 
 
 class IntentDetectorClientImpl(IntentDetectorClient):
-    def __init__(self, intent_detector_host: str):
+    _TIMEOUT_SECONDS_DEFAULT = 5.0
+    _MAX_CONNECTIONS_DEFAULT = 10
+    _MAX_KEEP_ALIVE_CONNECTIONS_DEFAULT = 5
+    _BATCH_WINDOW_SECONDS_DEFAULT = 0.005
+    _MAX_BATCH_SIZE_DEFAULT = 32
+    _SINGLE_ENDPOINT = "/extract-intent"
+    _BATCH_ENDPOINT = "/extract-intents"
+
+    def __init__(
+        self,
+        intent_detector_host: str,
+        timeout_seconds: float = _TIMEOUT_SECONDS_DEFAULT,
+        batch_window_seconds: float = _BATCH_WINDOW_SECONDS_DEFAULT,
+        max_batch_size: int = _MAX_BATCH_SIZE_DEFAULT,
+    ):
         self._intent_detector_host = intent_detector_host
+        self._timeout_seconds = timeout_seconds
+        self._batch_window_seconds = batch_window_seconds
+        self._max_batch_size = max_batch_size
+        self._client: httpx.AsyncClient | None = None
+        self._pending: list[tuple[str, asyncio.Future[Intent]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task] = set()
+        self._batch_supported: bool | None = None
+
+    async def extract_intent_from_text(self, text: str) -> Intent:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Intent] = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._batch_window_seconds, self._flush)
+
+        try:
+            return await asyncio.wait_for(future, timeout=self._timeout_seconds)
+        except TimeoutError as exc:
+            raise IntentDetectorError(f"Детектор интентов не ответил за {self._timeout_seconds} с") from exc
+
+    async def close(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._flush()
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        if self._client is not None:
+            client = self._client
+            self._client = None
+            await client.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self._intent_detector_host,
+                timeout=httpx.Timeout(self._timeout_seconds),
+                limits=httpx.Limits(
+                    max_connections=self._MAX_CONNECTIONS_DEFAULT, max_keepalive_connections=self._MAX_KEEP_ALIVE_CONNECTIONS_DEFAULT
+                ),
+            )
+        return self._client
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
 
-    def extract_intent_from_text(self, text: str) -> Intent:
-        api_url = f"{self._intent_detector_host}/extract-intent"
-        payload = {"message": text}
+        batch = self._pending
+        self._pending = []
+        task = asyncio.get_running_loop().create_task(self._resolve_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
 
-        response = requests.post(api_url, json=payload)
-        if response.status_code == 200:
-            response_data = response.json()
-            intent_value = response_data["intent"]
-            for intent in Intent:
-                if intent.value == intent_value:
-                    return intent
-            return Intent.OTHER
+    async def _resolve_batch(self, batch: list[tuple[str, asyncio.Future[Intent]]]) -> None:
+        texts = [text for text, _ in batch]
+        try:
+            intents = await self._request_intents(texts)
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
 
-        raise Exception(f"Ошибка запроса: {response.status_code} - {response.text}")
+        for (_, future), intent in zip(batch, intents, strict=True):
+            if not future.done():
+                future.set_result(intent)
+
+    async def _request_intents(self, texts: list[str]) -> list[Intent]:
+        if len(texts) > 1 and self._batch_supported is not False:
+            response = await self._post(self._BATCH_ENDPOINT, {"messages": texts})
+            if response.status_code in (404, 405):
+                self._batch_supported = False
+            else:
+                self._batch_supported = True
+                intent_values = self._parse_response(response)["intents"]
+                if len(intent_values) != len(texts):
+                    raise IntentDetectorError(f"Детектор вернул {len(intent_values)} интентов на {len(texts)} сообщений")
+                return [self._to_intent(intent_value) for intent_value in intent_values]
+
+        return list(await asyncio.gather(*(self._request_intent(text) for text in texts)))
+
+    async def _request_intent(self, text: str) -> Intent:
+        response = await self._post(self._SINGLE_ENDPOINT, {"message": text})
+        return self._to_intent(self._parse_response(response)["intent"])
+
+    async def _post(self, url: str, payload: dict) -> httpx.Response:
+        try:
+            return await self._get_client().post(url, json=payload)
+        except httpx.RequestError as exc:
+            raise IntentDetectorError(f"Детектор интентов недоступен: {exc}") from exc
+
+    def _parse_response(self, response: httpx.Response) -> dict:
+        if response.status_code != 200:
+            raise IntentDetectorError(f"Ошибка запроса: {response.status_code} - {response.text}")
+        try:
+            return response.json()
+        except ValueError as exc:
+            raise IntentDetectorError("Детектор интентов вернул некорректный JSON") from exc
+
+    def _to_intent(self, intent_value: str) -> Intent:
+        for intent in Intent:
+            if intent.value == intent_value:
+                return intent
+        return Intent.OTHER
 
     async def validate_intent_via_llm(self, channel_name: str, detected_intent: Intent, text: str, llm_repository: LLMRepository) -> Intent:
         intent_descriptions = {
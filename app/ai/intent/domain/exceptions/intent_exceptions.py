@@ -0,0 +1,2 @@
+class IntentDetectorError(Exception):
+    """Ошибка клиента детектора интентов."""
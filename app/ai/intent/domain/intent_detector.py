@@ -5,8 +5,10 @@ from app.ai.intent.domain.models import Intent
 
 
 class IntentDetectorClient(Protocol):
-    def extract_intent_from_text(self, text: str) -> Intent: ...
+    async def extract_intent_from_text(self, text: str) -> Intent: ...
 
     async def validate_intent_via_llm(
         self, channel_name: str, detected_intent: Intent, text: str, llm_repository: LLMRepository
     ) -> Intent: ...
+
+    async def close(self) -> None: ...
@@ -4,12 +4,16 @@ from typing import Protocol
 
 from app.battle.domain.repo import BattleRepository
 from app.common.application.unit_of_work import UnitOfWork, UnitOfWorkFactory
+from app.game_stats.domain.repo import GameStatsRepository
 
 
 class BattleUseCaseUnitOfWork(UnitOfWork, Protocol):
     @property
     def battle_repo(self) -> BattleRepository: ...
 
+    @property
+    def game_stats_repo(self) -> GameStatsRepository: ...
+
 
 class BattleUseCaseUnitOfWorkFactory(UnitOfWorkFactory[BattleUseCaseUnitOfWork], Protocol):
     pass
@@ -18,6 +18,8 @@ class BattleUseCase:
     ):
         with self._battle_uow.create() as uow:
             uow.battle_repo.save_battle_history(channel_name, opponent_1, opponent_2, winner, result_text)
+            loser = opponent_2 if winner == opponent_1 else opponent_1
+            uow.game_stats_repo.record_battle(channel_name, winner=winner, loser=loser)
 
     def get_user_battles(self, channel_name: str, user_name: str) -> list[Battle]:
         with self._battle_uow.create(read_only=True) as uow:
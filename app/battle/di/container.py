@@ -10,15 +10,22 @@ from app.chat.application.usecase.chat_use_case import ChatUseCase
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
 from app.economy.domain.economy_policy import EconomyPolicy
 from app.equipment.application.get_user_equipment_use_case import GetUserEquipmentUseCase
+from app.game_stats.domain.repo import GameStatsRepository
 from app.platform.command.battle.application.battle_uow import BattleUnitOfWorkFactory
 from app.platform.command.battle.infrastructure.battle_uow import SqlAlchemyBattleUnitOfWorkFactory
 from core.types import SessionFactory
 
 
 class BattleContainer:
-    def __init__(self, session_factory_rw: SessionFactory, session_factory_ro: SessionFactory):
+    def __init__(
+        self,
+        session_factory_rw: SessionFactory,
+        session_factory_ro: SessionFactory,
+        game_stats_repository_factory: SessionScopedFactory[GameStatsRepository],
+    ):
         self._session_factory_rw = session_factory_rw
         self._session_factory_ro = session_factory_ro
+        self._game_stats_repository_factory = game_stats_repository_factory
         self._battle_repository_factory = SessionScopedFactory(self.battle_repository)
 
     def battle_repository(self, session: Session) -> BattleRepository:
@@ -29,6 +36,7 @@ class BattleContainer:
             session_factory_rw=self._session_factory_rw,
             session_factory_ro=self._session_factory_ro,
             battle_repository_factory=self._battle_repository_factory,
+            game_stats_repository_factory=self._game_stats_repository_factory,
         )
 
     def battle_use_case(self) -> BattleUseCase:
@@ -6,18 +6,24 @@ from app.battle.application.uow.battle_use_case_uow import BattleUseCaseUnitOfWo
 from app.battle.domain.repo import BattleRepository
 from app.common.infrastructure.sqlalchemy_uow import SqlAlchemyUnitOfWorkBase, SqlAlchemyUnitOfWorkFactory
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
+from app.game_stats.domain.repo import GameStatsRepository
 from core.types import SessionFactory
 
 
 class SqlAlchemyBattleUseCaseUnitOfWork(SqlAlchemyUnitOfWorkBase, BattleUseCaseUnitOfWork):
-    def __init__(self, session: Session, battle_repo: BattleRepository, read_only: bool):
+    def __init__(self, session: Session, battle_repo: BattleRepository, game_stats_repo: GameStatsRepository, read_only: bool):
         super().__init__(session=session, read_only=read_only)
         self._battle_repo = battle_repo
+        self._game_stats_repo = game_stats_repo
 
     @property
     def battle_repo(self) -> BattleRepository:
         return self._battle_repo
 
+    @property
+    def game_stats_repo(self) -> GameStatsRepository:
+        return self._game_stats_repo
+
 
 class SqlAlchemyBattleUseCaseUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[BattleUseCaseUnitOfWork], BattleUseCaseUnitOfWorkFactory):
     def __init__(
@@ -25,6 +31,7 @@ class SqlAlchemyBattleUseCaseUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[Battl
         session_factory_rw: SessionFactory,
         session_factory_ro: SessionFactory,
         battle_repository_factory: SessionScopedFactory[BattleRepository],
+        game_stats_repository_factory: SessionScopedFactory[GameStatsRepository],
     ):
         super().__init__(
             session_factory_rw=session_factory_rw,
@@ -32,10 +39,12 @@ class SqlAlchemyBattleUseCaseUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[Battl
             builder=self._build_uow,
         )
         self._battle_repository_factory = battle_repository_factory
+        self._game_stats_repository_factory = game_stats_repository_factory
 
     def _build_uow(self, db: Session, read_only: bool) -> BattleUseCaseUnitOfWork:
         return SqlAlchemyBattleUseCaseUnitOfWork(
             session=db,
             battle_repo=self._battle_repository_factory.get(db),
+            game_stats_repo=self._game_stats_repository_factory.get(db),
             read_only=read_only,
         )
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Integer, String
+from sqlalchemy import DateTime, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.db import Base
@@ -8,6 +8,11 @@ from core.db import Base
 
 class BattleHistory(Base):
     __tablename__ = "battle_history"
+    __table_args__ = (
+        Index("ix_battle_history_channel_created", "channel_name", "created_at"),
+        Index("ix_battle_history_channel_opponent_1", "channel_name", "opponent_1"),
+        Index("ix_battle_history_channel_opponent_2", "channel_name", "opponent_2"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, nullable=False)
     channel_name: Mapped[str] = mapped_column(String, nullable=False)
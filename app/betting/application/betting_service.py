@@ -3,6 +3,7 @@ from app.betting.domain.model.bet import Bet
 from app.betting.domain.model.rarity import RarityLevel
 from app.betting.domain.models import EmojiConfig
 from app.betting.domain.repo import BettingRepository
+from app.game_stats.domain.repo import GameStatsRepository
 
 
 class BettingService:
@@ -22,9 +23,10 @@ class BettingService:
         RarityLevel.MYTHICAL: 100,
     }
 
-    def __init__(self, repo: BettingRepository, rarity_identifier: RarityIdentifier):
+    def __init__(self, repo: BettingRepository, rarity_identifier: RarityIdentifier, game_stats_repo: GameStatsRepository):
         self._repo = repo
         self._rarity_identifier = rarity_identifier
+        self._game_stats_repo = game_stats_repo
 
     def determine_correct_rarity(self, slot_result: str, result_type: str) -> RarityLevel:
         emojis = EmojiConfig.parse_slot_result(slot_result)
@@ -32,6 +34,7 @@ class BettingService:
 
     def save_bet(self, channel_name: str, user_name: str, slot_result: str, result_type: str, rarity_level: RarityLevel):
         self._repo.save_bet_history(channel_name, user_name, slot_result, result_type, rarity_level)
+        self._game_stats_repo.record_bet(channel_name, user_name, jackpot=result_type == "jackpot")
 
     def get_user_bets(self, channel_name: str, user_name: str) -> list[Bet]:
         return self._repo.get_user_bets(channel_name, user_name)
@@ -5,10 +5,12 @@ from app.betting.application.rarity_identifier import RarityIdentifier
 from app.betting.domain.repo import BettingRepository
 from app.betting.infrastructure.betting_repository import BettingRepositoryImpl
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
+from app.game_stats.domain.repo import GameStatsRepository
 
 
 class BettingContainer:
-    def __init__(self):
+    def __init__(self, game_stats_repository_factory: SessionScopedFactory[GameStatsRepository]):
+        self._game_stats_repository_factory = game_stats_repository_factory
         self.betting_service_factory = SessionScopedFactory(self.betting_service)
 
     def betting_repository(self, session: Session) -> BettingRepository:
@@ -17,4 +19,4 @@ class BettingContainer:
     def betting_service(self, session: Session) -> BettingService:
         betting_repository = self.betting_repository(session)
         rarity_identifier = RarityIdentifier()
-        return BettingService(betting_repository, rarity_identifier)
+        return BettingService(betting_repository, rarity_identifier, self._game_stats_repository_factory.get(session))
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, Integer, String
+from sqlalchemy import DateTime, Enum, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.betting.domain.model.rarity import RarityLevel
@@ -9,6 +9,7 @@ from core.db import Base
 
 class BetHistory(Base):
     __tablename__ = "bet_history"
+    __table_args__ = (Index("ix_bet_history_channel_user", "channel_name", "user_name"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, nullable=False)
     channel_name: Mapped[str] = mapped_column(String, nullable=False)
@@ -1,11 +1,14 @@
 import asyncio
 from datetime import UTC, datetime
 
+from app.ai.intent.domain.intent_detector import IntentDetectorClient
 from app.bot.domain.model.status import BotStatus
 from app.bot.presentation.api.model.response.action import BotActionResultResponse
 from app.bot.presentation.api.model.response.status import BotStatusResponse
+from app.chat.application.port.chat_transcript_sink_port import ChatTranscriptSinkPort
 from app.core.logger.domain.logger import Logger
 from app.core.network.api.client import ApiClient
+from app.economy.application.activity_ledger import ActivityLedger
 from app.platform.auth.platform_auth import PlatformAuth
 from app.platform.chat.infrastructure.twitch_platform_client import TwitchPlatformChatClient
 from app.platform.domain.repository import PlatformRepository
@@ -23,8 +26,11 @@ class BotManager:
         platform_chat_client: TwitchPlatformChatClient,
         task_runner: BackgroundTaskRunner,
         api_client: ApiClient,
+        intent_detector: IntentDetectorClient,
         platform_repository: PlatformRepository,
         platform_auth: PlatformAuth,
+        chat_transcript_sink: ChatTranscriptSinkPort,
+        activity_ledger: ActivityLedger,
     ):
         self._logger = logger.create_child(__name__)
         self._viewer_cache = viewer_cache
@@ -32,8 +38,11 @@ class BotManager:
         self._platform_chat_client = platform_chat_client
         self._task_runner = task_runner
         self._api_client = api_client
+        self._intent_detector = intent_detector
         self._platform_repository = platform_repository
         self._platform_auth = platform_auth
+        self._chat_transcript_sink = chat_transcript_sink
+        self._activity_ledger = activity_ledger
 
         self._status: BotStatus = BotStatus.STOPPED
         self._started_at: datetime | None = None
@@ -90,11 +99,21 @@ class BotManager:
             try:
                 self._status: BotStatus = BotStatus.STOPPED
                 await self._api_client.close()
+                await self._intent_detector.close()
                 await self._task_runner.cancel_all()
                 await self._platform_chat_client.stop_chat()
             except asyncio.CancelledError:
                 self._logger.log_debug("Задача бота отменена")
             except Exception as e:
                 self._logger.log_exception("Error stopping bot", e)
+            finally:
+                await self._drain_buffers()
 
             return BotActionResultResponse(**self.get_status().model_dump(), message="Бот остановлен")
+
+    async def _drain_buffers(self) -> None:
+        for drain in (self._chat_transcript_sink.drain, self._activity_ledger.drain):
+            try:
+                await drain()
+            except Exception as e:
+                self._logger.log_exception("Ошибка при сохранении буферов бота", e)
@@ -2,18 +2,22 @@ from app.ai.gen.conversation.domain.conversation_service import ConversationServ
 from app.ai.gen.llm.application.usecase.generate_response_use_case import GenerateResponseUseCase
 from app.ai.gen.llm.domain.llm_repository import LLMRepository
 from app.ai.gen.prompt.domain.system_prompt_repository import SystemPromptRepository
-from app.battle.application.usecase.battle_use_case import BattleUseCase
+from app.ai.intent.domain.intent_detector import IntentDetectorClient
 from app.bot.bot_manager import BotManager
 from app.chat.application.job.chat_summarizer_job import ChatSummarizerJob
-from app.chat.application.model.chat_summary_state import ChatSummaryState
+from app.chat.application.port.chat_transcript_sink_port import ChatTranscriptSinkPort
 from app.chat.application.usecase.chat_use_case import ChatUseCase
 from app.chat.application.usecase.handle_chat_summarizer_use_case import HandleChatSummarizerUseCase
-from app.chat.domain.repo import ChatRepository
+from app.chat.application.usecase.incremental_chat_summary_use_case import IncrementalChatSummaryUseCase
+from app.chat.application.usecase.summarize_chat_use_case import SummarizeChatUseCase
+from app.chat.domain.repo import ChatRepository, ChatSummaryProgressRepository, SummarizerSettingsRepository
 from app.chat.infrastructure.uow.chat_summarizer_uow import SqlAlchemyChatSummarizerUnitOfWorkFactory
 from app.chat.infrastructure.uow.chat_use_case_uow import SqlAlchemyChatUseCaseUnitOfWorkFactory
+from app.core.common.session.async_session_scoped_factory import AsyncSessionScopedFactory
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
 from app.core.logger.domain.logger import Logger
 from app.core.network.api.client import ApiClient
+from app.economy.application.activity_ledger import ActivityLedger
 from app.economy.domain.economy_policy import EconomyPolicy
 from app.equipment.application.get_user_equipment_use_case import GetUserEquipmentUseCase
 from app.follow.application.usecases.handle_followers_sync_use_case import HandleFollowersSyncUseCase
@@ -41,19 +45,22 @@ from app.platform.auth.application.usecase.handle_token_checker_use_case import
 from app.platform.auth.platform_auth import PlatformAuth
 from app.platform.chat.infrastructure.twitch_platform_client import TwitchPlatformChatClient
 from app.platform.domain.repository import PlatformRepository
+from app.retention.application.job.partition_maintenance_job import PartitionMaintenanceJob
+from app.retention.application.usecase.maintain_partitions_use_case import MaintainPartitionsUseCase
 from app.stream.application.job.stream_status_job import StreamStatusJob
+from app.stream.application.port.active_stream_registry_port import ActiveStreamRegistryPort
 from app.stream.application.usecase.handle_restore_stream_context_use_case import HandleRestoreStreamContextUseCase
 from app.stream.application.usecase.handle_stream_status_use_case import HandleStreamStatusUseCase
-from app.stream.domain.repo import StreamRepository
+from app.stream.domain.repo import AsyncStreamRepository, StreamRepository, StreamStatisticsRepository
 from app.stream.infrastructure.uow.restore_stream_context_uow import SqlAlchemyRestoreStreamContextUnitOfWorkFactory
 from app.stream.infrastructure.uow.stream_status_uow import SqlAlchemyStreamStatusUnitOfWorkFactory
 from app.task.infrastructure.runner import BackgroundTaskRunner
-from app.viewer.infrastructure.cache.viewer_cache_service import ViewerCacheService
+from app.viewer.application.port.viewer_cache_port import ViewerCachePort
 from app.viewer.session.application.job.viewer_time_job import ViewerTimeJob
 from app.viewer.session.application.usecase.reward_viewer_time_use_case import RewardViewerTimeUseCase
-from app.viewer.session.domain.repository import ViewerRepository
+from app.viewer.session.domain.repository import AsyncViewerRepository, ViewerRepository
 from app.viewer.session.infrastructure.uow.viewer_time_uow import SqlAlchemyViewerTimeUnitOfWorkFactory
-from core.types import SessionFactory
+from core.types import AsyncSessionFactory, SessionFactory
 
 
 class BotManagerFactory:
@@ -61,17 +68,23 @@ class BotManagerFactory:
         self,
         session_factory_rw: SessionFactory,
         session_factory_ro: SessionFactory,
+        async_session_factory_rw: AsyncSessionFactory,
+        async_session_factory_ro: AsyncSessionFactory,
         platform_repository: PlatformRepository,
         stream_repository_factory: SessionScopedFactory[StreamRepository],
+        async_stream_repository_factory: AsyncSessionScopedFactory[AsyncStreamRepository],
+        active_stream_registry: ActiveStreamRegistryPort,
         minigame_repository: MinigameRepository,
         platform_chat_client: TwitchPlatformChatClient,
         chat_repository_factory: SessionScopedFactory[ChatRepository],
+        summarizer_settings_repository_factory: SessionScopedFactory[SummarizerSettingsRepository],
+        chat_summary_progress_repository_factory: SessionScopedFactory[ChatSummaryProgressRepository],
         generate_response_use_case_factory: SessionScopedFactory[GenerateResponseUseCase],
-        chat_summary_state: ChatSummaryState,
         conversation_service_factory: SessionScopedFactory[ConversationService],
         jokes_configuration_repository_factory: SessionScopedFactory[JokesConfigurationRepository],
         viewer_repository_factory: SessionScopedFactory[ViewerRepository],
-        battle_use_case: BattleUseCase,
+        async_viewer_repository_factory: AsyncSessionScopedFactory[AsyncViewerRepository],
+        stream_statistics_repository_factory: SessionScopedFactory[StreamStatisticsRepository],
         economy_policy_factory: SessionScopedFactory[EconomyPolicy],
         notification_repository: NotificationRepository,
         notification_group_id: int,
@@ -88,22 +101,32 @@ class BotManagerFactory:
         followers_repository_factory: SessionScopedFactory[FollowersRepository],
         platform_auth: PlatformAuth,
         api_client: ApiClient,
-        viewer_cache: ViewerCacheService,
+        intent_detector: IntentDetectorClient,
+        viewer_cache: ViewerCachePort,
+        chat_transcript_sink: ChatTranscriptSinkPort,
+        activity_ledger: ActivityLedger,
+        maintain_partitions_use_case: MaintainPartitionsUseCase,
         logger: Logger,
     ):
         self._session_factory_rw = session_factory_rw
         self._session_factory_ro = session_factory_ro
+        self._async_session_factory_rw = async_session_factory_rw
+        self._async_session_factory_ro = async_session_factory_ro
         self._platform_repository = platform_repository
         self._stream_repository_factory = stream_repository_factory
+        self._async_stream_repository_factory = async_stream_repository_factory
+        self._active_stream_registry = active_stream_registry
         self._minigame_repository = minigame_repository
         self._platform_chat_client = platform_chat_client
         self._chat_repository_factory = chat_repository_factory
+        self._summarizer_settings_repository_factory = summarizer_settings_repository_factory
+        self._chat_summary_progress_repository_factory = chat_summary_progress_repository_factory
         self._generate_response_use_case_factory = generate_response_use_case_factory
-        self._chat_summary_state = chat_summary_state
         self._conversation_service_factory = conversation_service_factory
         self._jokes_configuration_repository_factory = jokes_configuration_repository_factory
         self._viewer_repository_factory = viewer_repository_factory
-        self._battle_use_case = battle_use_case
+        self._async_viewer_repository_factory = async_viewer_repository_factory
+        self._stream_statistics_repository_factory = stream_statistics_repository_factory
         self._economy_policy_factory = economy_policy_factory
         self._notification_repository = notification_repository
         self._notification_group_id = notification_group_id
@@ -120,7 +143,11 @@ class BotManagerFactory:
         self._followers_repository_factory = followers_repository_factory
         self._platform_auth = platform_auth
         self._api_client = api_client
+        self._intent_detector = intent_detector
         self._viewer_cache = viewer_cache
+        self._chat_transcript_sink = chat_transcript_sink
+        self._activity_ledger = activity_ledger
+        self._maintain_partitions_use_case = maintain_partitions_use_case
         self._logger = logger
 
     def create(self) -> BotManager:
@@ -131,6 +158,7 @@ class BotManagerFactory:
                 stream_repository_factory=self._stream_repository_factory,
             ),
             minigame_repository=self._minigame_repository,
+            active_stream_registry=self._active_stream_registry,
             logger=self._logger,
         )
 
@@ -145,13 +173,24 @@ class BotManagerFactory:
             session_factory_ro=self._session_factory_ro,
             stream_repository_factory=self._stream_repository_factory,
             chat_use_case=chat_use_case,
+            summarizer_settings_repository_factory=self._summarizer_settings_repository_factory,
+            chat_summary_progress_repository_factory=self._chat_summary_progress_repository_factory,
         )
-        handle_chat_summarizer_use_case = HandleChatSummarizerUseCase(
+        summarize_chat_use_case = SummarizeChatUseCase(
             chat_summarizer_uow=chat_summarizer_uow_factory,
-            generate_response_use_case_factory=self._generate_response_use_case_factory,
+            llm_repository_factory=self._llm_repository_factory,
             session_ro_factory=self._session_factory_ro,
         )
-        chat_summarizer_job = ChatSummarizerJob(handle_chat_summarizer_use_case, self._chat_summary_state, self._logger)
+        incremental_chat_summary_use_case = IncrementalChatSummaryUseCase(
+            chat_summarizer_uow=chat_summarizer_uow_factory,
+            summarize_chat_use_case=summarize_chat_use_case,
+            chat_transcript_sink=self._chat_transcript_sink,
+        )
+        handle_chat_summarizer_use_case = HandleChatSummarizerUseCase(
+            chat_summarizer_uow=chat_summarizer_uow_factory,
+            incremental_chat_summary_use_case=incremental_chat_summary_use_case,
+        )
+        chat_summarizer_job = ChatSummarizerJob(handle_chat_summarizer_use_case, self._logger)
 
         joke_uow_factory = SqlAlchemyJokeUnitOfWorkFactory(
             session_factory_rw=self._session_factory_rw,
@@ -185,9 +224,8 @@ class BotManagerFactory:
             session_factory_ro=self._session_factory_ro,
             stream_repository_factory=self._stream_repository_factory,
             viewer_repository_factory=self._viewer_repository_factory,
-            battle_use_case=self._battle_use_case,
+            stream_statistics_repository_factory=self._stream_statistics_repository_factory,
             economy_policy_factory=self._economy_policy_factory,
-            chat_use_case=chat_use_case,
             conversation_service_factory=self._conversation_service_factory,
         )
 
@@ -195,11 +233,13 @@ class BotManagerFactory:
             user_cache=self._viewer_cache,
             platform_repository=self._platform_repository,
             stream_status_uow=stream_status_uow_factory,
+            active_stream_registry=self._active_stream_registry,
             minigame_repository=self._minigame_repository,
             notification_repository=self._notification_repository,
             notification_group_id=self._notification_group_id,
             generate_response_use_case_factory=self._generate_response_use_case_factory,
-            state=self._chat_summary_state,
+            incremental_chat_summary_use_case=incremental_chat_summary_use_case,
+            chat_transcript_sink=self._chat_transcript_sink,
             session_ro_factory=self._session_factory_ro,
             logger=self._logger,
         )
@@ -272,16 +312,17 @@ class BotManagerFactory:
         minigame_job = MinigameTickJob(handle_minigame_tick_use_case=handle_minigame_tick_use_case, logger=self._logger)
 
         reward_viewer_time_uow_factory = SqlAlchemyViewerTimeUnitOfWorkFactory(
-            session_factory_ro=self._session_factory_ro,
-            session_factory_rw=self._session_factory_rw,
-            stream_repository_factory=self._stream_repository_factory,
-            viewer_repository_factory=self._viewer_repository_factory,
+            session_factory_ro=self._async_session_factory_ro,
+            session_factory_rw=self._async_session_factory_rw,
+            stream_repository_factory=self._async_stream_repository_factory,
+            viewer_repository_factory=self._async_viewer_repository_factory,
             economy_policy_factory=self._economy_policy_factory,
         )
         handle_viewer_time_use_case = RewardViewerTimeUseCase(
             reward_viewer_time_uow=reward_viewer_time_uow_factory,
             user_cache=self._viewer_cache,
             platform_repository=self._platform_repository,
+            active_stream_registry=self._active_stream_registry,
         )
         viewer_time_job = ViewerTimeJob(handle_viewer_time_use_case=handle_viewer_time_use_case, logger=self._logger)
 
@@ -296,6 +337,9 @@ class BotManagerFactory:
         )
 
         followers_sync_job = FollowersSyncJob(handle_followers_sync_use_case=handle_followers_sync_use_case, logger=self._logger)
+        partition_maintenance_job = PartitionMaintenanceJob(
+            maintain_partitions_use_case=self._maintain_partitions_use_case, logger=self._logger
+        )
 
         jobs = [
             post_joke_job,
@@ -305,6 +349,7 @@ class BotManagerFactory:
             minigame_job,
             viewer_time_job,
             followers_sync_job,
+            partition_maintenance_job,
         ]
 
         task_runner = BackgroundTaskRunner(jobs)
@@ -316,6 +361,9 @@ class BotManagerFactory:
             platform_chat_client=self._platform_chat_client,
             task_runner=task_runner,
             api_client=self._api_client,
+            intent_detector=self._intent_detector,
             platform_repository=self._platform_repository,
             platform_auth=self._platform_auth,
+            chat_transcript_sink=self._chat_transcript_sink,
+            activity_ledger=self._activity_ledger,
         )
@@ -1,3 +1,4 @@
+from dataclasses import asdict
 from urllib.parse import urlencode
 
 import httpx
@@ -7,6 +8,7 @@ from app.bot.bot_manager import BotManager
 from app.bot.presentation.api.bot_routes import get_bot_manager
 from app.bot.presentation.api.model.request.start_bot import StartBotRequest
 from app.bot.presentation.api.model.response.action import BotActionResultResponse
+from app.bot.presentation.api.model.response.rate_limit import RateLimitMetricsResponse
 from app.bot.presentation.api.model.response.start_bot import AuthStartResponse
 from app.core.config.domain.model.application import ApplicationConfig
 from app.core.config.domain.model.configuration import Config
@@ -112,3 +114,11 @@ async def stop_bot(bot_manager: BotManager = Depends(get_bot_manager)) -> BotAct
         return await bot_manager.stop_bot()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Ошибка остановки бота: {e}")
+
+
+@router.get("/rate-limit", summary="Состояние лимита запросов Twitch Helix", response_model=RateLimitMetricsResponse)
+async def get_rate_limit(platform_container: PlatformContainer = Depends(get_platform_container)) -> RateLimitMetricsResponse:
+    metrics = platform_container.api_client.rate_limit_metrics()
+    if metrics is None:
+        raise HTTPException(status_code=404, detail="Лимит запросов не отслеживается")
+    return RateLimitMetricsResponse(**asdict(metrics))
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+
+class RateLimitMetricsResponse(BaseModel):
+    limit: int | None = Field(None, description="Размер бакета запросов (Ratelimit-Limit)")
+    remaining: int | None = Field(None, description="Оставшиеся запросы в бакете")
+    reset_at: float | None = Field(None, description="Время пополнения бакета (unix timestamp)")
+    in_flight: int = Field(..., description="Запросы в процессе выполнения")
+    concurrency_limit: int = Field(..., description="Текущий предел параллельных запросов")
+    queued: int = Field(..., description="Запросы, ожидающие в очереди")
+    waits: int = Field(..., description="Сколько раз запросы ждали пополнения бакета")
+    waited_seconds: float = Field(..., description="Суммарное время ожидания, сек")
+    throttled: int = Field(..., description="Количество ответов 429")
+    retries: int = Field(..., description="Количество повторных запросов")
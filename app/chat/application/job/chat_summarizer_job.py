@@ -1,7 +1,6 @@
 import asyncio
 from datetime import UTC, datetime
 
-from app.chat.application.model.chat_summary_state import ChatSummaryState
 from app.chat.application.model.summarizer_job import SummarizerJobDTO
 from app.chat.application.usecase.handle_chat_summarizer_use_case import HandleChatSummarizerUseCase
 from app.core.logger.domain.logger import Logger
@@ -12,12 +11,11 @@ class ChatSummarizerJob(BackgroundJob):
     name = "summarize_chat"
     _INTERVAL_DEFAULT = 120
 
-    def __init__(self, handle_chat_summarizer_use_case: HandleChatSummarizerUseCase, chat_summary_state: ChatSummaryState, logger: Logger):
+    def __init__(self, handle_chat_summarizer_use_case: HandleChatSummarizerUseCase, logger: Logger):
         self._handle_chat_summarizer_use_case = handle_chat_summarizer_use_case
         self._logger = logger.create_child(__name__)
         self._channel_name: str | None = None
         self._bot_name: str | None = None
-        self._chat_summary_state = chat_summary_state
 
     def apply_channel(self, channel_name: str, bot_name: str):
         self._channel_name = channel_name
@@ -30,12 +28,7 @@ class ChatSummarizerJob(BackgroundJob):
 
                 summarizer_job_dto = SummarizerJobDTO(channel_name=self._channel_name, occurred_at=datetime.now(UTC))
 
-                result = await self._handle_chat_summarizer_use_case.handle(summarizer_job=summarizer_job_dto)
-                if result is None:
-                    continue
-
-                self._chat_summary_state.current_stream_summaries.append(result)
-                self._chat_summary_state.last_chat_summary_time = datetime.now(UTC)
+                await self._handle_chat_summarizer_use_case.handle(summarizer_job=summarizer_job_dto)
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from app.chat.domain.model.chat_cursor import ChatCursor
+
+
+@dataclass(frozen=True)
+class ChatSummary:
+    text: str
+    cursor: ChatCursor
+    message_count: int
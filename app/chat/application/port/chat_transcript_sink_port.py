@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from app.chat.domain.model.chat_message import ChatMessage
+
+
+class ChatTranscriptSinkPort(ABC):
+    @abstractmethod
+    def submit(self, message: ChatMessage) -> None: ...
+
+    @abstractmethod
+    async def drain(self) -> None: ...
+
+    @abstractmethod
+    def pending_since(self, channel_name: str) -> datetime | None: ...
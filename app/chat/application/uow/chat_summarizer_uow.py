@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Protocol
 
 from app.chat.application.usecase.chat_use_case import ChatUseCase
+from app.chat.domain.repo import ChatSummaryProgressRepository, SummarizerSettingsRepository
 from app.common.application.unit_of_work import UnitOfWork, UnitOfWorkFactory
 from app.stream.domain.repo import StreamRepository
 
@@ -14,6 +15,12 @@ class ChatSummarizerUnitOfWork(UnitOfWork, Protocol):
     @property
     def chat_use_case(self) -> ChatUseCase: ...
 
+    @property
+    def summarizer_settings_repository(self) -> SummarizerSettingsRepository: ...
+
+    @property
+    def chat_summary_progress_repository(self) -> ChatSummaryProgressRepository: ...
+
 
 class ChatSummarizerUnitOfWorkFactory(UnitOfWorkFactory[ChatSummarizerUnitOfWork], Protocol):
     pass
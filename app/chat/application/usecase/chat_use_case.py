@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 
 from app.chat.application.model.chat_user_info import ChatUserInfo
 from app.chat.application.uow.chat_use_case_uow import ChatUseCaseUnitOfWorkFactory
+from app.chat.domain.model.chat_cursor import ChatCursor
 from app.chat.domain.model.chat_message import ChatMessage
+from app.common.domain.keyset import KeysetCursor, Page
 
 
 class ChatUseCase:
@@ -38,6 +41,29 @@ class ChatUseCase:
         with self._chat_uow_factory.create(read_only=True) as uow:
             return list(uow.chat_repo.list_between(channel_name, from_time, to_time))
 
+    def get_chat_messages_page(
+        self, channel_name: str, from_time: datetime, to_time: datetime, after: ChatCursor | None, limit: int
+    ) -> list[ChatMessage]:
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        with self._chat_uow_factory.create(read_only=True) as uow:
+            return list(uow.chat_repo.list_page(channel_name, from_time, to_time, after, limit))
+
+    def get_chat_history(
+        self, channel_name: str, from_time: datetime, to_time: datetime, cursor: KeysetCursor | None, limit: int
+    ) -> Page[ChatMessage]:
+        after = ChatCursor(created_at=cursor.at, id=cursor.id) if cursor is not None and cursor.at is not None else None
+        messages = self.get_chat_messages_page(channel_name, from_time, to_time, after, limit + 1)
+        return Page.from_rows(messages, limit, lambda message: KeysetCursor(at=message.created_at, id=message.id))
+
+    def iter_chat_messages(self, channel_name: str, from_time: datetime, to_time: datetime) -> Iterator[ChatMessage]:
+        with self._chat_uow_factory.create(read_only=True) as uow:
+            yield from uow.chat_repo.iter_between(channel_name, from_time, to_time)
+
+    def count_chat_messages_page(self, channel_name: str, from_time: datetime, to_time: datetime, after: ChatCursor | None) -> int:
+        with self._chat_uow_factory.create(read_only=True) as uow:
+            return uow.chat_repo.count_page(channel_name, from_time, to_time, after)
+
     def get_last_chat_messages(self, channel_name: str, limit: int) -> list[ChatMessage]:
         if limit <= 0:
             raise ValueError("limit must be positive")
@@ -0,0 +1,68 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from app.chat.application.port.chat_transcript_sink_port import ChatTranscriptSinkPort
+from app.chat.application.uow.chat_summarizer_uow import ChatSummarizerUnitOfWorkFactory
+from app.chat.application.usecase.summarize_chat_use_case import SummarizeChatUseCase
+from app.chat.domain.model.chat_summary_progress import ChatSummaryProgress
+
+
+class IncrementalChatSummaryUseCase:
+    _MIN_NEW_MESSAGES: int = 150
+    _MAX_DELAY: timedelta = timedelta(minutes=20)
+    _FLUSH_LAG: timedelta = timedelta(seconds=5)
+    _MAX_SUMMARIES: int = 6
+
+    def __init__(
+        self,
+        chat_summarizer_uow: ChatSummarizerUnitOfWorkFactory,
+        summarize_chat_use_case: SummarizeChatUseCase,
+        chat_transcript_sink: ChatTranscriptSinkPort,
+    ):
+        self._chat_summarizer_uow = chat_summarizer_uow
+        self._summarize_chat_use_case = summarize_chat_use_case
+        self._chat_transcript_sink = chat_transcript_sink
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def summarize_new(self, channel_name: str, since: datetime, until: datetime, force: bool = False) -> list[str]:
+        async with self._locks.setdefault(channel_name, asyncio.Lock()):
+            if force:
+                await self._chat_transcript_sink.drain()
+            else:
+                until = until - self._FLUSH_LAG
+            pending_since = self._chat_transcript_sink.pending_since(channel_name)
+            if pending_since is not None:
+                until = min(until, pending_since)
+
+            with self._chat_summarizer_uow.create(read_only=True) as uow:
+                progress = uow.chat_summary_progress_repository.get_progress(channel_name) or ChatSummaryProgress()
+
+            if not force:
+                with self._chat_summarizer_uow.create(read_only=True) as uow:
+                    new_messages = uow.chat_use_case.count_chat_messages_page(channel_name, since, until, progress.cursor)
+                last_summarized_at = progress.summarized_at or since
+                if new_messages == 0:
+                    return list(progress.summaries)
+                if new_messages < self._MIN_NEW_MESSAGES and until - last_summarized_at < self._MAX_DELAY:
+                    return list(progress.summaries)
+
+            summary = await self._summarize_chat_use_case.summarize(channel_name, since, until, progress.cursor)
+            if summary is None:
+                return list(progress.summaries)
+
+            summaries = [*progress.summaries, summary.text]
+            if len(summaries) > self._MAX_SUMMARIES:
+                merge_count = len(summaries) - self._MAX_SUMMARIES + 1
+                merged = await self._summarize_chat_use_case.merge(channel_name, summaries[:merge_count])
+                summaries = [merged, *summaries[merge_count:]]
+
+            with self._chat_summarizer_uow.create() as uow:
+                uow.chat_summary_progress_repository.save_progress(
+                    channel_name,
+                    ChatSummaryProgress(cursor=summary.cursor, summarized_at=until, summaries=tuple(summaries)),
+                )
+            return summaries
+
+    def reset(self, channel_name: str) -> None:
+        with self._chat_summarizer_uow.create() as uow:
+            uow.chat_summary_progress_repository.delete_progress(channel_name)
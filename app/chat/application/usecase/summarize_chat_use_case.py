@@ -0,0 +1,145 @@
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from app.ai.gen.conversation.domain.models import AIMessage, Role
+from app.ai.gen.llm.domain.llm_repository import LLMRepository
+from app.ai.gen.llm.domain.model.assistant import AIAssistant
+from app.chat.application.model.chat_summary import ChatSummary
+from app.chat.application.uow.chat_summarizer_uow import ChatSummarizerUnitOfWorkFactory
+from app.chat.domain.model.chat_cursor import ChatCursor
+from app.chat.domain.model.summarizer_settings import SummarizerSettings
+from app.chat.domain.token_estimator import estimate_tokens, truncate_to_tokens
+from app.core.common.session.session_scoped_factory import SessionScopedFactory
+from core.types import SessionFactory
+
+
+class SummarizeChatUseCase:
+    _PAGE_SIZE: int = 500
+    _MAP_PROMPT = (
+        "Основываясь на сообщения в чате, подведи краткий итог общения в виде тезисов, без нумерации. Для отчёта. "
+        "Зафиксируй наиболее смешные и наиболее важные моменты, которые обсуждались в чате. Желательно с никнеймами."
+        "Вот сообщения: {text}"
+    )
+    _REDUCE_PROMPT = (
+        "Ниже несколько кратких итогов последовательных отрезков одного чата. "
+        "Объедини их в один краткий итог в виде тезисов, без нумерации. Для отчёта. "
+        "Убери повторы, сохрани наиболее смешные и наиболее важные моменты и никнеймы. "
+        "Вот итоги: {text}"
+    )
+
+    def __init__(
+        self,
+        chat_summarizer_uow: ChatSummarizerUnitOfWorkFactory,
+        llm_repository_factory: SessionScopedFactory[LLMRepository],
+        session_ro_factory: SessionFactory,
+    ):
+        self._chat_summarizer_uow = chat_summarizer_uow
+        self._llm_repository_factory = llm_repository_factory
+        self._session_ro = session_ro_factory
+
+    async def summarize(self, channel_name: str, since: datetime, until: datetime, after: ChatCursor | None = None) -> ChatSummary | None:
+        settings = self._get_settings(channel_name)
+        assistant = await self._resolve_assistant(channel_name, settings)
+        semaphore = asyncio.Semaphore(settings.parallelism)
+
+        tasks: list[asyncio.Task[str]] = []
+        cursor: ChatCursor | None = None
+        message_count = 0
+        try:
+            async for chunk, cursor, chunk_size in self._chunks(channel_name, since, until, after, settings.chunk_tokens):
+                message_count += chunk_size
+                await semaphore.acquire()
+                tasks.append(asyncio.create_task(self._generate(semaphore, assistant, self._MAP_PROMPT.format(text=chunk))))
+            partials = list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        if not partials:
+            return None
+        text = await self._reduce(partials, settings, assistant, semaphore)
+        return ChatSummary(text=text, cursor=cursor, message_count=message_count)
+
+    async def merge(self, channel_name: str, summaries: list[str]) -> str:
+        settings = self._get_settings(channel_name)
+        assistant = await self._resolve_assistant(channel_name, settings)
+        return await self._reduce(summaries, settings, assistant, asyncio.Semaphore(settings.parallelism))
+
+    def _get_settings(self, channel_name: str) -> SummarizerSettings:
+        with self._chat_summarizer_uow.create(read_only=True) as uow:
+            return uow.summarizer_settings_repository.get_settings(channel_name) or SummarizerSettings()
+
+    async def _reduce(self, partials: list[str], settings: SummarizerSettings, assistant: AIAssistant, semaphore: asyncio.Semaphore) -> str:
+        while len(partials) > 1:
+            groups = self._group(partials, settings.chunk_tokens)
+            reduce_tasks: list[asyncio.Task[str]] = []
+            try:
+                for group in groups:
+                    await semaphore.acquire()
+                    prompt = self._REDUCE_PROMPT.format(text="\n\n".join(group))
+                    reduce_tasks.append(asyncio.create_task(self._generate(semaphore, assistant, prompt)))
+                partials = list(await asyncio.gather(*reduce_tasks))
+            except BaseException:
+                for task in reduce_tasks:
+                    task.cancel()
+                raise
+        return partials[0]
+
+    async def _resolve_assistant(self, channel_name: str, settings: SummarizerSettings) -> AIAssistant:
+        if settings.assistant is not None:
+            return settings.assistant
+        with self._session_ro() as session:
+            assistant = await self._llm_repository_factory.get(session).get_assistant(channel_name)
+        return assistant or AIAssistant.GPT_OSS_120B
+
+    async def _chunks(
+        self, channel_name: str, since: datetime, until: datetime, after: ChatCursor | None, chunk_tokens: int
+    ) -> AsyncIterator[tuple[str, ChatCursor, int]]:
+        lines: list[str] = []
+        used_tokens = 0
+        cursor = after
+        while True:
+            with self._chat_summarizer_uow.create(read_only=True) as uow:
+                page = uow.chat_use_case.get_chat_messages_page(channel_name, since, until, cursor, self._PAGE_SIZE)
+            for message in page:
+                line = truncate_to_tokens(f"{message.user_name}: {message.content}", chunk_tokens)
+                tokens = estimate_tokens(line)
+                if lines and used_tokens + tokens > chunk_tokens:
+                    yield "\n".join(lines), cursor, len(lines)
+                    lines, used_tokens = [], 0
+                lines.append(line)
+                used_tokens += tokens
+                cursor = ChatCursor.after(message)
+            if len(page) < self._PAGE_SIZE:
+                break
+        if lines:
+            yield "\n".join(lines), cursor, len(lines)
+
+    @staticmethod
+    def _group(partials: list[str], chunk_tokens: int) -> list[list[str]]:
+        groups: list[list[str]] = []
+        current: list[str] = []
+        used_tokens = 0
+        for partial in partials:
+            tokens = estimate_tokens(partial)
+            if len(current) >= 2 and used_tokens + tokens > chunk_tokens:
+                groups.append(current)
+                current, used_tokens = [], 0
+            current.append(partial)
+            used_tokens += tokens
+        if len(current) == 1 and groups:
+            groups[-1].append(current[0])
+        elif current:
+            groups.append(current)
+        return groups
+
+    async def _generate(self, semaphore: asyncio.Semaphore, assistant: AIAssistant, prompt: str) -> str:
+        try:
+            with self._session_ro() as session:
+                llm_repository = self._llm_repository_factory.get(session)
+                response = await llm_repository.generate_ai_response(assistant, [AIMessage(role=Role.USER, content=prompt)])
+            return response.message
+        finally:
+            semaphore.release()
@@ -0,0 +1,17 @@
+from app.chat.domain.model.summarizer_settings import SummarizerSettings
+from app.chat.domain.repo import SummarizerSettingsRepository
+
+
+class SummarizerSettingsUseCase:
+    def __init__(self, summarizer_settings_repository: SummarizerSettingsRepository):
+        self._summarizer_settings_repository = summarizer_settings_repository
+
+    def get_settings(self, channel_name: str) -> SummarizerSettings:
+        return self._summarizer_settings_repository.get_settings(channel_name) or SummarizerSettings()
+
+    def save_settings(self, channel_name: str, settings: SummarizerSettings) -> None:
+        if settings.chunk_tokens <= 0:
+            raise ValueError("chunk_tokens must be positive")
+        if settings.parallelism <= 0:
+            raise ValueError("parallelism must be positive")
+        self._summarizer_settings_repository.save_settings(channel_name, settings)
@@ -2,14 +2,19 @@ from sqlalchemy.orm import Session
 
 from app.ai.gen.conversation.domain.conversation_service import ConversationService
 from app.ai.gen.prompt.domain.system_prompt_repository import SystemPromptRepository
+from app.chat.application.port.chat_transcript_sink_port import ChatTranscriptSinkPort
 from app.chat.application.uow.chat_use_case_uow import ChatUseCaseUnitOfWorkFactory
 from app.chat.application.usecase.chat_use_case import ChatUseCase
-from app.chat.domain.repo import ChatRepository
+from app.chat.application.usecase.summarizer_settings_use_case import SummarizerSettingsUseCase
+from app.chat.domain.repo import ChatRepository, ChatSummaryProgressRepository, SummarizerSettingsRepository
 from app.chat.infrastructure.chat_repository import ChatRepositoryImpl
+from app.chat.infrastructure.chat_summary_progress_repository import ChatSummaryProgressRepositoryImpl
+from app.chat.infrastructure.summarizer_settings_repository import SummarizerSettingsRepositoryImpl
+from app.chat.infrastructure.transcript.buffered_chat_transcript_sink import BufferedChatTranscriptSink
 from app.chat.infrastructure.uow.chat_use_case_uow import SqlAlchemyChatUseCaseUnitOfWorkFactory
+from app.chat.infrastructure.write_behind_chat_repository import WriteBehindChatRepository
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
 from app.core.logger.domain.logger import Logger
-from app.economy.domain.economy_policy import EconomyPolicy
 from app.platform.chat.application.uow.chat_message_uow import ChatMessageUnitOfWorkFactory
 from app.platform.chat.infrastructure.chat_message_uow import SqlAlchemyChatMessageUnitOfWorkFactory
 from app.stream.domain.repo import StreamRepository
@@ -21,11 +26,31 @@ class ChatContainer:
     def __init__(self, session_factory_rw: SessionFactory, session_factory_ro: SessionFactory, logger: Logger):
         self._session_factory_rw = session_factory_rw
         self._session_factory_ro = session_factory_ro
-        self.chat_repository_factory = SessionScopedFactory(self.chat_repository)
         self._logger = logger.create_child(__name__)
+        self.chat_transcript_sink: ChatTranscriptSinkPort = BufferedChatTranscriptSink(
+            chat_uow_factory=SqlAlchemyChatUseCaseUnitOfWorkFactory(
+                session_factory_rw=self._session_factory_rw,
+                session_factory_ro=self._session_factory_ro,
+                chat_repository_factory=SessionScopedFactory(ChatRepositoryImpl),
+            ),
+            logger=self._logger,
+        )
+        self.chat_repository_factory = SessionScopedFactory(self.chat_repository)
+        self.summarizer_settings_repository_factory = SessionScopedFactory(self._summarizer_settings_repository)
+        self.summarizer_settings_use_case_factory = SessionScopedFactory(self._summarizer_settings_use_case)
+        self.chat_summary_progress_repository_factory = SessionScopedFactory(self._chat_summary_progress_repository)
 
     def chat_repository(self, session: Session) -> ChatRepository:
-        return ChatRepositoryImpl(session)
+        return WriteBehindChatRepository(ChatRepositoryImpl(session), self.chat_transcript_sink)
+
+    def _summarizer_settings_repository(self, session: Session) -> SummarizerSettingsRepository:
+        return SummarizerSettingsRepositoryImpl(session)
+
+    def _summarizer_settings_use_case(self, session: Session) -> SummarizerSettingsUseCase:
+        return SummarizerSettingsUseCase(self._summarizer_settings_repository(session))
+
+    def _chat_summary_progress_repository(self, session: Session) -> ChatSummaryProgressRepository:
+        return ChatSummaryProgressRepositoryImpl(session)
 
     def chat_use_case_uow_factory(self) -> ChatUseCaseUnitOfWorkFactory:
         return SqlAlchemyChatUseCaseUnitOfWorkFactory(
@@ -40,7 +65,6 @@ class ChatContainer:
 
     def chat_message_uow_factory(
         self,
-        economy_policy_factory: SessionScopedFactory[EconomyPolicy],
         stream_repository_factory: SessionScopedFactory[StreamRepository],
         viewer_repository_factory: SessionScopedFactory[ViewerRepository],
         conversation_service_factory: SessionScopedFactory[ConversationService],
@@ -50,7 +74,6 @@ class ChatContainer:
             session_factory_rw=self._session_factory_rw,
             session_factory_ro=self._session_factory_ro,
             chat_repository_factory=self.chat_repository_factory,
-            economy_policy_factory=economy_policy_factory,
             stream_repository_factory=stream_repository_factory,
             viewer_repository_factory=viewer_repository_factory,
             conversation_service_factory=conversation_service_factory,
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.chat.domain.model.chat_message import ChatMessage
+
+
+@dataclass(frozen=True)
+class ChatCursor:
+    created_at: datetime
+    id: int
+
+    @classmethod
+    def after(cls, message: ChatMessage) -> "ChatCursor":
+        return cls(created_at=message.created_at, id=message.id)
@@ -8,3 +8,4 @@ class ChatMessage:
     user_name: str
     content: str
     created_at: datetime
+    id: int | None = None
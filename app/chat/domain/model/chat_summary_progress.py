@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.chat.domain.model.chat_cursor import ChatCursor
+
+
+@dataclass(frozen=True)
+class ChatSummaryProgress:
+    cursor: ChatCursor | None = None
+    summarized_at: datetime | None = None
+    summaries: tuple[str, ...] = ()
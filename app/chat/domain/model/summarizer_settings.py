@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from app.ai.gen.llm.domain.model.assistant import AIAssistant
+
+
+@dataclass(frozen=True)
+class SummarizerSettings:
+    chunk_tokens: int = 3000
+    parallelism: int = 3
+    assistant: AIAssistant | None = None
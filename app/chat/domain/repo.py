@@ -1,15 +1,28 @@
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from typing import Protocol
 
+from app.chat.domain.model.chat_cursor import ChatCursor
 from app.chat.domain.model.chat_message import ChatMessage
+from app.chat.domain.model.chat_summary_progress import ChatSummaryProgress
+from app.chat.domain.model.summarizer_settings import SummarizerSettings
 
 
 class ChatRepository(Protocol):
     def save(self, message: ChatMessage) -> None: ...
 
+    def save_many(self, messages: Sequence[ChatMessage]) -> None: ...
+
     def list_between(self, channel_name: str, start: datetime, end: datetime) -> Sequence[ChatMessage]: ...
 
+    def iter_between(self, channel_name: str, start: datetime, end: datetime) -> Iterator[ChatMessage]: ...
+
+    def list_page(
+        self, channel_name: str, start: datetime, end: datetime, after: ChatCursor | None, limit: int
+    ) -> Sequence[ChatMessage]: ...
+
+    def count_page(self, channel_name: str, start: datetime, end: datetime, after: ChatCursor | None) -> int: ...
+
     def list_last(self, channel_name: str, limit: int) -> Sequence[ChatMessage]: ...
 
     def top_chat_users(self, limit: int, date_from: datetime | None, date_to: datetime | None) -> Sequence[tuple[str, str, int]]: ...
@@ -17,3 +30,17 @@ class ChatRepository(Protocol):
     def get_last_chat_messages_since(self, channel_name: str, since: datetime) -> list[ChatMessage]: ...
 
     def count_between(self, channel_name: str, start: datetime, end: datetime) -> int: ...
+
+
+class SummarizerSettingsRepository(Protocol):
+    def get_settings(self, channel_name: str) -> SummarizerSettings | None: ...
+
+    def save_settings(self, channel_name: str, settings: SummarizerSettings) -> None: ...
+
+
+class ChatSummaryProgressRepository(Protocol):
+    def get_progress(self, channel_name: str) -> ChatSummaryProgress | None: ...
+
+    def save_progress(self, channel_name: str, progress: ChatSummaryProgress) -> None: ...
+
+    def delete_progress(self, channel_name: str) -> None: ...
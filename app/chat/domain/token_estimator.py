@@ -0,0 +1,11 @@
+CHARS_PER_TOKEN = 3
+LINE_OVERHEAD_TOKENS = 2
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + LINE_OVERHEAD_TOKENS
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    max_chars = max(0, (max_tokens - LINE_OVERHEAD_TOKENS) * CHARS_PER_TOKEN)
+    return text if len(text) <= max_chars else text[:max_chars]
@@ -1,9 +1,10 @@
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, or_, select
 from sqlalchemy.orm import Session
 
+from app.chat.domain.model.chat_cursor import ChatCursor
 from app.chat.domain.model.chat_message import ChatMessage
 from app.chat.domain.repo import ChatRepository
 from app.chat.infrastructure.db.chat_message import ChatMessage as ChatMessageORM
@@ -11,9 +12,14 @@ from app.stream.infrastructure.mappers.stream_mapper import normalize_datetime
 
 
 class ChatRepositoryImpl(ChatRepository):
+    _EXPORT_BATCH_SIZE = 1000
+
     def __init__(self, db: Session):
         self._db = db
 
+    def _to_domain(self, row: ChatMessageORM) -> ChatMessage:
+        return ChatMessage(row.channel_name, row.user_name, row.content, normalize_datetime(row.created_at), row.id)
+
     def save(self, message: ChatMessage) -> None:
         self._db.add(
             ChatMessageORM(
@@ -21,6 +27,22 @@ class ChatRepositoryImpl(ChatRepository):
             )
         )
 
+    def save_many(self, messages: Sequence[ChatMessage]) -> None:
+        if not messages:
+            return
+        self._db.execute(
+            insert(ChatMessageORM),
+            [
+                {
+                    "channel_name": message.channel_name,
+                    "user_name": message.user_name,
+                    "content": message.content,
+                    "created_at": message.created_at,
+                }
+                for message in messages
+            ],
+        )
+
     def list_between(self, channel_name: str, start: datetime, end: datetime) -> Sequence[ChatMessage]:
         stmt = (
             select(ChatMessageORM)
@@ -30,7 +52,41 @@ class ChatRepositoryImpl(ChatRepository):
             .order_by(ChatMessageORM.created_at.asc())
         )
         rows = self._db.execute(stmt).scalars().all()
-        return [ChatMessage(r.channel_name, r.user_name, r.content, normalize_datetime(r.created_at)) for r in rows]
+        return [self._to_domain(r) for r in rows]
+
+    def iter_between(self, channel_name: str, start: datetime, end: datetime) -> Iterator[ChatMessage]:
+        stmt = (
+            select(ChatMessageORM)
+            .where(ChatMessageORM.channel_name == channel_name)
+            .where(ChatMessageORM.created_at >= start)
+            .where(ChatMessageORM.created_at < end)
+            .order_by(ChatMessageORM.created_at.asc(), ChatMessageORM.id.asc())
+            .execution_options(yield_per=self._EXPORT_BATCH_SIZE)
+        )
+        for row in self._db.execute(stmt).scalars():
+            yield self._to_domain(row)
+
+    def _page_filter(self, stmt, channel_name: str, start: datetime, end: datetime, after: ChatCursor | None):
+        stmt = stmt.where(ChatMessageORM.channel_name == channel_name).where(ChatMessageORM.created_at < end)
+        if after is None:
+            return stmt.where(ChatMessageORM.created_at >= start)
+        after_created_at = after.created_at.replace(tzinfo=None)
+        return stmt.where(ChatMessageORM.created_at >= after_created_at).where(
+            or_(ChatMessageORM.created_at > after_created_at, ChatMessageORM.id > after.id)
+        )
+
+    def list_page(self, channel_name: str, start: datetime, end: datetime, after: ChatCursor | None, limit: int) -> list[ChatMessage]:
+        stmt = (
+            self._page_filter(select(ChatMessageORM), channel_name, start, end, after)
+            .order_by(ChatMessageORM.created_at.asc(), ChatMessageORM.id.asc())
+            .limit(limit)
+        )
+        rows = self._db.execute(stmt).scalars().all()
+        return [self._to_domain(r) for r in rows]
+
+    def count_page(self, channel_name: str, start: datetime, end: datetime, after: ChatCursor | None) -> int:
+        stmt = self._page_filter(select(func.count(ChatMessageORM.id)), channel_name, start, end, after)
+        return int(self._db.execute(stmt).scalar_one())
 
     def list_last(self, channel_name: str, limit: int) -> list[ChatMessage]:
         stmt = (
@@ -40,7 +96,7 @@ class ChatRepositoryImpl(ChatRepository):
             .limit(limit)
         )
         rows = self._db.execute(stmt).scalars().all()
-        return [ChatMessage(r.channel_name, r.user_name, r.content, normalize_datetime(r.created_at)) for r in reversed(rows)]
+        return [self._to_domain(r) for r in reversed(rows)]
 
     def top_chat_users(self, limit: int, date_from: datetime | None, date_to: datetime | None) -> Sequence[tuple[str, str, int]]:
         count_expr = func.count(ChatMessageORM.id).label("message_count")
@@ -61,7 +117,7 @@ class ChatRepositoryImpl(ChatRepository):
             .order_by(ChatMessageORM.created_at.asc())
         )
         rows = self._db.execute(stmt).scalars().all()
-        return [ChatMessage(r.channel_name, r.user_name, r.content, normalize_datetime(r.created_at)) for r in rows]
+        return [self._to_domain(r) for r in rows]
 
     def count_between(self, channel_name: str, start: datetime, end: datetime) -> int:
         stmt = (
@@ -0,0 +1,45 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.chat.domain.model.chat_cursor import ChatCursor
+from app.chat.domain.model.chat_summary_progress import ChatSummaryProgress
+from app.chat.domain.repo import ChatSummaryProgressRepository
+from app.chat.infrastructure.db.chat_summary_progress import ChatSummaryProgressRow
+from app.stream.infrastructure.mappers.stream_mapper import normalize_datetime
+
+
+class ChatSummaryProgressRepositoryImpl(ChatSummaryProgressRepository):
+    def __init__(self, db: Session):
+        self._db = db
+
+    def get_progress(self, channel_name: str) -> ChatSummaryProgress | None:
+        stmt = select(ChatSummaryProgressRow).where(ChatSummaryProgressRow.channel_name == channel_name)
+        row = self._db.execute(stmt).scalar_one_or_none()
+        if row is None:
+            return None
+        cursor = None
+        if row.last_message_created_at is not None and row.last_message_id is not None:
+            cursor = ChatCursor(created_at=normalize_datetime(row.last_message_created_at), id=row.last_message_id)
+        return ChatSummaryProgress(
+            cursor=cursor,
+            summarized_at=normalize_datetime(row.summarized_at),
+            summaries=tuple(row.summaries),
+        )
+
+    def save_progress(self, channel_name: str, progress: ChatSummaryProgress) -> None:
+        values = {
+            "last_message_created_at": progress.cursor.created_at.replace(tzinfo=None) if progress.cursor else None,
+            "last_message_id": progress.cursor.id if progress.cursor else None,
+            "summarized_at": progress.summarized_at.replace(tzinfo=None) if progress.summarized_at else None,
+            "summaries": list(progress.summaries),
+            "updated_at": datetime.now(UTC).replace(tzinfo=None),
+        }
+        stmt = insert(ChatSummaryProgressRow).values(channel_name=channel_name, **values)
+        stmt = stmt.on_conflict_do_update(index_elements=[ChatSummaryProgressRow.channel_name], set_=values)
+        self._db.execute(stmt)
+
+    def delete_progress(self, channel_name: str) -> None:
+        self._db.execute(delete(ChatSummaryProgressRow).where(ChatSummaryProgressRow.channel_name == channel_name))
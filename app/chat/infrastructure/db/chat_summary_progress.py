@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.db import Base
+
+
+class ChatSummaryProgressRow(Base):
+    __tablename__ = "chat_summary_progress"
+
+    channel_name: Mapped[str] = mapped_column(String(255), primary_key=True)
+    last_message_created_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    last_message_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    summarized_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    summaries: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.db import Base
+
+
+class SummarizerSettingsRow(Base):
+    __tablename__ = "chat_summarizer_settings"
+
+    channel_name: Mapped[str] = mapped_column(String(255), primary_key=True)
+    chunk_tokens: Mapped[int] = mapped_column(Integer, nullable=False)
+    parallelism: Mapped[int] = mapped_column(Integer, nullable=False)
+    assistant: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
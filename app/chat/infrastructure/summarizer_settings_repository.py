@@ -0,0 +1,37 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.ai.gen.llm.domain.model.assistant import AIAssistant
+from app.chat.domain.model.summarizer_settings import SummarizerSettings
+from app.chat.domain.repo import SummarizerSettingsRepository
+from app.chat.infrastructure.db.summarizer_settings import SummarizerSettingsRow
+
+
+class SummarizerSettingsRepositoryImpl(SummarizerSettingsRepository):
+    def __init__(self, db: Session):
+        self._db = db
+
+    def get_settings(self, channel_name: str) -> SummarizerSettings | None:
+        stmt = select(SummarizerSettingsRow).where(SummarizerSettingsRow.channel_name == channel_name)
+        row = self._db.execute(stmt).scalar_one_or_none()
+        if row is None:
+            return None
+        return SummarizerSettings(
+            chunk_tokens=row.chunk_tokens,
+            parallelism=row.parallelism,
+            assistant=AIAssistant(row.assistant) if row.assistant else None,
+        )
+
+    def save_settings(self, channel_name: str, settings: SummarizerSettings) -> None:
+        values = {
+            "chunk_tokens": settings.chunk_tokens,
+            "parallelism": settings.parallelism,
+            "assistant": settings.assistant.value if settings.assistant else None,
+            "updated_at": datetime.now(UTC).replace(tzinfo=None),
+        }
+        stmt = insert(SummarizerSettingsRow).values(channel_name=channel_name, **values)
+        stmt = stmt.on_conflict_do_update(index_elements=[SummarizerSettingsRow.channel_name], set_=values)
+        self._db.execute(stmt)
@@ -0,0 +1,119 @@
+import asyncio
+from collections import OrderedDict
+from datetime import datetime
+
+from app.chat.application.port.chat_transcript_sink_port import ChatTranscriptSinkPort
+from app.chat.application.uow.chat_use_case_uow import ChatUseCaseUnitOfWorkFactory
+from app.chat.domain.model.chat_message import ChatMessage
+from app.core.logger.domain.logger import Logger
+from app.stream.infrastructure.mappers.stream_mapper import normalize_datetime
+
+_MessageKey = tuple[str, str, str, datetime]
+
+
+class BufferedChatTranscriptSink(ChatTranscriptSinkPort):
+    _FLUSH_INTERVAL_MS_DEFAULT = 500
+    _MAX_BATCH_ROWS_DEFAULT = 200
+    _MAX_PENDING_ROWS_DEFAULT = 10_000
+    _RECENT_KEYS_LIMIT_DEFAULT = 4096
+    _RETRY_DELAY_SECONDS_DEFAULT = 2.0
+    _DRAIN_TIMEOUT_SECONDS_DEFAULT = 15.0
+
+    def __init__(
+        self,
+        chat_uow_factory: ChatUseCaseUnitOfWorkFactory,
+        logger: Logger,
+        flush_interval_ms: int = _FLUSH_INTERVAL_MS_DEFAULT,
+        max_batch_rows: int = _MAX_BATCH_ROWS_DEFAULT,
+    ):
+        self._chat_uow_factory = chat_uow_factory
+        self._logger = logger.create_child(__name__)
+        self._flush_interval_seconds = flush_interval_ms / 1000
+        self._max_batch_rows = max_batch_rows
+        self._buffer: list[ChatMessage] = []
+        self._recent_keys: OrderedDict[_MessageKey, None] = OrderedDict()
+        self._in_flight: list[ChatMessage] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task | None = None
+
+    def submit(self, message: ChatMessage) -> None:
+        key = (message.channel_name, message.user_name, message.content, message.created_at)
+        if key in self._recent_keys:
+            return
+        self._recent_keys[key] = None
+        if len(self._recent_keys) > self._RECENT_KEYS_LIMIT_DEFAULT:
+            self._recent_keys.popitem(last=False)
+
+        self._buffer.append(message)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write(self._take_batch())
+            return
+
+        if len(self._buffer) >= self._max_batch_rows:
+            self._schedule_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._flush_interval_seconds, self._schedule_flush)
+
+    def pending_since(self, channel_name: str) -> datetime | None:
+        created = [message.created_at for message in (*self._in_flight, *self._buffer) if message.channel_name == channel_name]
+        return normalize_datetime(min(created)) if created else None
+
+    async def drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._DRAIN_TIMEOUT_SECONDS_DEFAULT
+        while self._buffer or self._is_flushing():
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                self._logger.log_error(f"Не удалось сохранить {len(self._in_flight) + len(self._buffer)} сообщений чата до остановки")
+                return
+            if not self._is_flushing():
+                self._schedule_flush()
+            await asyncio.wait({self._flush_task}, timeout=remaining)
+            if self._buffer and not self._is_flushing():
+                await asyncio.sleep(min(self._RETRY_DELAY_SECONDS_DEFAULT, max(deadline - loop.time(), 0)))
+
+    def _is_flushing(self) -> bool:
+        return self._flush_task is not None and not self._flush_task.done()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._buffer or self._is_flushing():
+            return
+        self._flush_task = asyncio.get_running_loop().create_task(self._flush())
+
+    async def _flush(self) -> None:
+        while self._buffer:
+            self._in_flight = self._take_batch()
+            try:
+                await asyncio.to_thread(self._write, self._in_flight)
+            except Exception as e:
+                self._logger.log_exception(f"Не удалось сохранить {len(self._in_flight)} сообщений чата, повтор", e)
+                self._requeue(self._in_flight)
+                return
+            finally:
+                self._in_flight = []
+
+    def _write(self, batch: list[ChatMessage]) -> None:
+        if not batch:
+            return
+        with self._chat_uow_factory.create() as uow:
+            uow.chat_repo.save_many(batch)
+
+    def _take_batch(self) -> list[ChatMessage]:
+        batch = self._buffer
+        self._buffer = []
+        return batch
+
+    def _requeue(self, batch: list[ChatMessage]) -> None:
+        self._buffer = batch + self._buffer
+        overflow = len(self._buffer) - self._MAX_PENDING_ROWS_DEFAULT
+        if overflow > 0:
+            self._logger.log_error(f"Буфер сообщений чата переполнен, отброшено {overflow} старых сообщений")
+            self._buffer = self._buffer[overflow:]
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self._RETRY_DELAY_SECONDS_DEFAULT, self._schedule_flush)
@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 
 from app.chat.application.uow.chat_summarizer_uow import ChatSummarizerUnitOfWork, ChatSummarizerUnitOfWorkFactory
 from app.chat.application.usecase.chat_use_case import ChatUseCase
+from app.chat.domain.repo import ChatSummaryProgressRepository, SummarizerSettingsRepository
 from app.common.infrastructure.sqlalchemy_uow import SqlAlchemyUnitOfWorkBase, SqlAlchemyUnitOfWorkFactory
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
 from app.stream.domain.repo import StreamRepository
@@ -11,10 +12,20 @@ from core.types import SessionFactory
 
 
 class SqlAlchemyChatSummarizerUnitOfWork(SqlAlchemyUnitOfWorkBase, ChatSummarizerUnitOfWork):
-    def __init__(self, session: Session, stream_repository: StreamRepository, chat_use_case: ChatUseCase, read_only: bool):
+    def __init__(
+        self,
+        session: Session,
+        stream_repository: StreamRepository,
+        chat_use_case: ChatUseCase,
+        summarizer_settings_repository: SummarizerSettingsRepository,
+        chat_summary_progress_repository: ChatSummaryProgressRepository,
+        read_only: bool,
+    ):
         super().__init__(session=session, read_only=read_only)
         self._stream_repository = stream_repository
         self._chat_use_case = chat_use_case
+        self._summarizer_settings_repository = summarizer_settings_repository
+        self._chat_summary_progress_repository = chat_summary_progress_repository
 
     @property
     def stream_repository(self) -> StreamRepository:
@@ -24,6 +35,14 @@ class SqlAlchemyChatSummarizerUnitOfWork(SqlAlchemyUnitOfWorkBase, ChatSummarize
     def chat_use_case(self) -> ChatUseCase:
         return self._chat_use_case
 
+    @property
+    def summarizer_settings_repository(self) -> SummarizerSettingsRepository:
+        return self._summarizer_settings_repository
+
+    @property
+    def chat_summary_progress_repository(self) -> ChatSummaryProgressRepository:
+        return self._chat_summary_progress_repository
+
 
 class SqlAlchemyChatSummarizerUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[ChatSummarizerUnitOfWork], ChatSummarizerUnitOfWorkFactory):
     def __init__(
@@ -32,6 +51,8 @@ class SqlAlchemyChatSummarizerUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[Chat
         session_factory_ro: SessionFactory,
         stream_repository_factory: SessionScopedFactory[StreamRepository],
         chat_use_case: ChatUseCase,
+        summarizer_settings_repository_factory: SessionScopedFactory[SummarizerSettingsRepository],
+        chat_summary_progress_repository_factory: SessionScopedFactory[ChatSummaryProgressRepository],
     ):
         super().__init__(
             session_factory_rw=session_factory_rw,
@@ -40,11 +61,15 @@ class SqlAlchemyChatSummarizerUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[Chat
         )
         self._stream_repository_factory = stream_repository_factory
         self._chat_use_case = chat_use_case
+        self._summarizer_settings_repository_factory = summarizer_settings_repository_factory
+        self._chat_summary_progress_repository_factory = chat_summary_progress_repository_factory
 
     def _build_uow(self, db: Session, read_only: bool) -> ChatSummarizerUnitOfWork:
         return SqlAlchemyChatSummarizerUnitOfWork(
             session=db,
             stream_repository=self._stream_repository_factory.get(db),
             chat_use_case=self._chat_use_case,
+            summarizer_settings_repository=self._summarizer_settings_repository_factory.get(db),
+            chat_summary_progress_repository=self._chat_summary_progress_repository_factory.get(db),
             read_only=read_only,
         )
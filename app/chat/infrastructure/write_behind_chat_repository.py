@@ -0,0 +1,44 @@
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+
+from app.chat.application.port.chat_transcript_sink_port import ChatTranscriptSinkPort
+from app.chat.domain.model.chat_cursor import ChatCursor
+from app.chat.domain.model.chat_message import ChatMessage
+from app.chat.domain.repo import ChatRepository
+
+
+class WriteBehindChatRepository(ChatRepository):
+    def __init__(self, delegate: ChatRepository, transcript_sink: ChatTranscriptSinkPort):
+        self._delegate = delegate
+        self._transcript_sink = transcript_sink
+
+    def save(self, message: ChatMessage) -> None:
+        self._transcript_sink.submit(message)
+
+    def save_many(self, messages: Sequence[ChatMessage]) -> None:
+        for message in messages:
+            self._transcript_sink.submit(message)
+
+    def list_between(self, channel_name: str, start: datetime, end: datetime) -> Sequence[ChatMessage]:
+        return self._delegate.list_between(channel_name, start, end)
+
+    def iter_between(self, channel_name: str, start: datetime, end: datetime) -> Iterator[ChatMessage]:
+        return self._delegate.iter_between(channel_name, start, end)
+
+    def list_page(self, channel_name: str, start: datetime, end: datetime, after: ChatCursor | None, limit: int) -> Sequence[ChatMessage]:
+        return self._delegate.list_page(channel_name, start, end, after, limit)
+
+    def count_page(self, channel_name: str, start: datetime, end: datetime, after: ChatCursor | None) -> int:
+        return self._delegate.count_page(channel_name, start, end, after)
+
+    def list_last(self, channel_name: str, limit: int) -> Sequence[ChatMessage]:
+        return self._delegate.list_last(channel_name, limit)
+
+    def top_chat_users(self, limit: int, date_from: datetime | None, date_to: datetime | None) -> Sequence[tuple[str, str, int]]:
+        return self._delegate.top_chat_users(limit, date_from, date_to)
+
+    def get_last_chat_messages_since(self, channel_name: str, since: datetime) -> list[ChatMessage]:
+        return self._delegate.get_last_chat_messages_since(channel_name, since)
+
+    def count_between(self, channel_name: str, start: datetime, end: datetime) -> int:
+        return self._delegate.count_between(channel_name, start, end)
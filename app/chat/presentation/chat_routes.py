@@ -1,11 +1,19 @@
 from dataclasses import asdict
-from datetime import datetime
+from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
+from app.ai.gen.llm.domain.model.assistant import AIAssistant
 from app.chat.di.container import ChatContainer
+from app.chat.domain.model.summarizer_settings import SummarizerSettings
+from app.chat.presentation.schemas.chat_message import ChatMessageItem, ChatMessagesResponse
 from app.chat.presentation.schemas.chat_user import TopChatUser, TopChatUsersResponse
+from app.chat.presentation.schemas.summarizer_settings import SummarizerSettingsResponse, SummarizerSettingsUpdate
 from app.core.logger.domain.logger import Logger
+from app.core.network.api.export import ExportFormat, export_response
+from app.core.network.api.model.base_response import BaseResponse
+from app.core.network.api.pagination import decode_cursor, encode_cursor
 from core.db import db_ro_session, db_rw_session
 
 router = APIRouter()
@@ -35,3 +43,100 @@ async def get_top_users(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     return TopChatUsersResponse(top_users=[TopChatUser(**asdict(user)) for user in users])
+
+
+@router.get(
+    "/summarizer-settings/{channel_name}",
+    response_model=SummarizerSettingsResponse,
+    summary="Настройки суммаризации чата",
+    description="Получить бюджет фрагмента, параллельность и ассистента для суммаризации чата канала",
+)
+async def get_summarizer_settings(channel_name: str, logger: Logger = Depends(get_logger)) -> SummarizerSettingsResponse:
+    chat_container = ChatContainer(session_factory_rw=db_rw_session, session_factory_ro=db_ro_session, logger=logger)
+    with db_ro_session() as session:
+        settings = chat_container.summarizer_settings_use_case_factory.get(session).get_settings(channel_name)
+    return SummarizerSettingsResponse(
+        channel_name=channel_name,
+        chunk_tokens=settings.chunk_tokens,
+        parallelism=settings.parallelism,
+        assistant=settings.assistant.value if settings.assistant else None,
+    )
+
+
+@router.put(
+    "/summarizer-settings/{channel_name}",
+    response_model=BaseResponse,
+    summary="Изменить настройки суммаризации чата",
+    description="Сохранить бюджет фрагмента, параллельность и ассистента для суммаризации чата канала",
+)
+async def save_summarizer_settings(
+    channel_name: str,
+    body: SummarizerSettingsUpdate,
+    logger: Logger = Depends(get_logger),
+) -> BaseResponse:
+    assistant = None
+    if body.assistant is not None:
+        try:
+            assistant = AIAssistant(body.assistant)
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Неизвестный ассистент: {body.assistant}. Доступные: {[a.value for a in AIAssistant]}",
+            )
+    settings = SummarizerSettings(chunk_tokens=body.chunk_tokens, parallelism=body.parallelism, assistant=assistant)
+    chat_container = ChatContainer(session_factory_rw=db_rw_session, session_factory_ro=db_ro_session, logger=logger)
+    try:
+        with db_rw_session() as session:
+            chat_container.summarizer_settings_use_case_factory.get(session).save_settings(channel_name, settings)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return BaseResponse(message="Настройки суммаризации успешно сохранены")
+
+
+def _message_period(date_from: datetime, date_to: datetime | None) -> tuple[datetime, datetime]:
+    date_to = date_to or datetime.now(UTC)
+    if date_from > date_to:
+        raise HTTPException(status_code=400, detail="date_from не может быть больше date_to")
+    return date_from, date_to
+
+
+@router.get(
+    "/{channel_name}",
+    response_model=ChatMessagesResponse,
+    summary="Сообщения чата",
+    description="Постраничный просмотр сообщений чата канала за период",
+)
+async def get_chat_messages(
+    channel_name: str,
+    date_from: datetime = Query(..., description="Начало периода (UTC)"),
+    date_to: datetime | None = Query(None, description="Конец периода (UTC), по умолчанию — текущее время"),
+    cursor: str | None = Query(None, description="Курсор следующей страницы из предыдущего ответа"),
+    limit: int = Query(100, ge=1, le=1000, description="Количество сообщений в ответе"),
+    logger: Logger = Depends(get_logger),
+) -> ChatMessagesResponse:
+    date_from, date_to = _message_period(date_from, date_to)
+    page_cursor = decode_cursor(cursor)
+    chat_container = ChatContainer(session_factory_rw=db_rw_session, session_factory_ro=db_ro_session, logger=logger)
+    page = chat_container.chat_use_case().get_chat_history(channel_name, date_from, date_to, page_cursor, limit)
+    return ChatMessagesResponse(
+        items=[ChatMessageItem(**asdict(message)) for message in page.items],
+        next_cursor=encode_cursor(page.next_cursor),
+    )
+
+
+@router.get(
+    "/{channel_name}/export",
+    summary="Выгрузка сообщений чата",
+    description="Потоковая выгрузка сообщений чата канала за период в NDJSON или CSV",
+)
+def export_chat_messages(
+    channel_name: str,
+    date_from: datetime = Query(..., description="Начало периода (UTC)"),
+    date_to: datetime | None = Query(None, description="Конец периода (UTC), по умолчанию — текущее время"),
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format", description="Формат выгрузки"),
+    logger: Logger = Depends(get_logger),
+) -> StreamingResponse:
+    date_from, date_to = _message_period(date_from, date_to)
+    chat_use_case = ChatContainer(session_factory_rw=db_rw_session, session_factory_ro=db_ro_session, logger=logger).chat_use_case()
+    rows = (ChatMessageItem(**asdict(message)) for message in chat_use_case.iter_chat_messages(channel_name, date_from, date_to))
+    return export_response(rows, ChatMessageItem, export_format, f"chat_{channel_name}")
@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class ChatMessageItem(BaseModel):
+    id: int = Field(..., description="Идентификатор сообщения")
+    channel_name: str = Field(..., description="Название канала")
+    user_name: str = Field(..., description="Имя пользователя")
+    content: str = Field(..., description="Текст сообщения")
+    created_at: datetime = Field(..., description="Время отправки сообщения (UTC)")
+
+
+class ChatMessagesResponse(BaseModel):
+    items: list[ChatMessageItem] = Field(..., description="Сообщения чата в порядке отправки")
+    next_cursor: str | None = Field(None, description="Курсор следующей страницы (null — страниц больше нет)")
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+
+class SummarizerSettingsResponse(BaseModel):
+    channel_name: str = Field(..., description="Название канала")
+    chunk_tokens: int = Field(..., description="Бюджет токенов на один фрагмент чата")
+    parallelism: int = Field(..., description="Количество одновременных запросов к LLM")
+    assistant: str | None = Field(None, description="LLM-ассистент для суммаризации (по умолчанию — ассистент канала)")
+
+
+class SummarizerSettingsUpdate(BaseModel):
+    chunk_tokens: int = Field(..., ge=200, le=100000, description="Бюджет токенов на один фрагмент чата")
+    parallelism: int = Field(..., ge=1, le=16, description="Количество одновременных запросов к LLM")
+    assistant: str | None = Field(None, description="LLM-ассистент для суммаризации (по умолчанию — ассистент канала)")
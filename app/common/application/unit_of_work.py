@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from contextlib import AbstractContextManager
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from typing import Generic, Protocol, TypeVar
 
 
@@ -15,3 +15,16 @@ TUnitOfWork = TypeVar("TUnitOfWork", bound=UnitOfWork)
 
 class UnitOfWorkFactory(Protocol, Generic[TUnitOfWork]):
     def create(self, read_only: bool = False) -> AbstractContextManager[TUnitOfWork]: ...
+
+
+class AsyncUnitOfWork(Protocol):
+    async def commit(self) -> None: ...
+
+    async def rollback(self) -> None: ...
+
+
+TAsyncUnitOfWork = TypeVar("TAsyncUnitOfWork", bound=AsyncUnitOfWork)
+
+
+class AsyncUnitOfWorkFactory(Protocol, Generic[TAsyncUnitOfWork]):
+    def create(self, read_only: bool = False) -> AbstractAsyncContextManager[TAsyncUnitOfWork]: ...
@@ -0,0 +1,24 @@
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class KeysetCursor:
+    at: datetime | None
+    id: int
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: KeysetCursor | None
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[T], limit: int, key: Callable[[T], KeysetCursor]) -> "Page[T]":
+        items = list(rows[:limit])
+        next_cursor = key(items[-1]) if len(rows) > limit and items else None
+        return cls(items=items, next_cursor=next_cursor)
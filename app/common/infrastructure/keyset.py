@@ -0,0 +1,13 @@
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.common.domain.keyset import KeysetCursor
+
+
+def keyset_before(sort_column, id_column, cursor: KeysetCursor, nulls_first: bool = False) -> ColumnElement[bool]:
+    if cursor.at is None:
+        if nulls_first:
+            return or_(and_(sort_column.is_(None), id_column < cursor.id), sort_column.is_not(None))
+        return id_column < cursor.id
+    at = cursor.at.replace(tzinfo=None)
+    return or_(sort_column < at, and_(sort_column == at, id_column < cursor.id))
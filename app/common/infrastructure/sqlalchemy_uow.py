@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from contextlib import AbstractContextManager, contextmanager
+from contextlib import AbstractAsyncContextManager, AbstractContextManager, asynccontextmanager, contextmanager
 from typing import Generic, TypeVar
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.common.application.unit_of_work import UnitOfWork, UnitOfWorkFactory
-from core.types import SessionFactory
+from app.common.application.unit_of_work import AsyncUnitOfWork, AsyncUnitOfWorkFactory, UnitOfWork, UnitOfWorkFactory
+from core.types import AsyncSessionFactory, SessionFactory
 
 TUnitOfWork = TypeVar("TUnitOfWork", bound=UnitOfWork)
+TAsyncUnitOfWork = TypeVar("TAsyncUnitOfWork", bound=AsyncUnitOfWork)
+T = TypeVar("T")
 
 
 class SqlAlchemyUnitOfWorkBase(UnitOfWork):
@@ -52,3 +55,48 @@ class SqlAlchemyUnitOfWorkFactory(UnitOfWorkFactory[TUnitOfWork], Generic[TUnitO
                     raise
 
         return _ctx()
+
+
+class SqlAlchemyAsyncUnitOfWorkBase(AsyncUnitOfWork):
+    def __init__(self, session: AsyncSession, read_only: bool):
+        self._session = session
+        self._read_only = read_only
+
+    async def commit(self) -> None:
+        if not self._read_only:
+            await self._session.commit()
+
+    async def rollback(self) -> None:
+        await self._session.rollback()
+
+    async def run_sync(self, fn: Callable[[Session], T]) -> T:
+        return await self._session.run_sync(fn)
+
+
+class SqlAlchemyAsyncUnitOfWorkFactory(AsyncUnitOfWorkFactory[TAsyncUnitOfWork], Generic[TAsyncUnitOfWork]):
+    def __init__(
+        self,
+        session_factory_rw: AsyncSessionFactory,
+        session_factory_ro: AsyncSessionFactory,
+        builder: Callable[[AsyncSession, bool], TAsyncUnitOfWork],
+    ):
+        self._session_factory_rw = session_factory_rw
+        self._session_factory_ro = session_factory_ro
+        self._builder = builder
+
+    def create(self, read_only: bool = False) -> AbstractAsyncContextManager[TAsyncUnitOfWork]:
+        session_factory = self._session_factory_ro if read_only else self._session_factory_rw
+
+        @asynccontextmanager
+        async def _ctx():
+            async with session_factory() as db:
+                uow = self._builder(db, read_only)
+                try:
+                    yield uow
+                    if not read_only:
+                        await uow.commit()
+                except Exception:
+                    await uow.rollback()
+                    raise
+
+        return _ctx()
@@ -0,0 +1,17 @@
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+
+class AsyncSessionScopedFactory(Generic[T]):
+    def __init__(self, factory: Callable[[AsyncSession], T]) -> None:
+        self._factory = factory
+
+    def get(self, db: AsyncSession) -> T:
+        return self._factory(db)
+
+    def __call__(self, db: AsyncSession) -> T:
+        return self.get(db)
@@ -0,0 +1,37 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    def __init__(self, ttl_seconds: float = 0):
+        self._ttl_seconds = ttl_seconds
+        self._in_flight: dict[K, asyncio.Future[V]] = {}
+        self._cache: dict[K, tuple[V, float]] = {}
+
+    async def do(self, key: K, fetch: Callable[[], Awaitable[V]]) -> V:
+        cached = self._cache.get(key)
+        if cached is not None:
+            value, expires_at = cached
+            if time.monotonic() < expires_at:
+                return value
+            del self._cache[key]
+
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._run(key, fetch))
+            self._in_flight[key] = future
+        return await asyncio.shield(future)
+
+    async def _run(self, key: K, fetch: Callable[[], Awaitable[V]]) -> V:
+        try:
+            value = await fetch()
+            if self._ttl_seconds > 0 and value is not None:
+                self._cache[key] = (value, time.monotonic() + self._ttl_seconds)
+            return value
+        finally:
+            self._in_flight.pop(key, None)
@@ -7,3 +7,6 @@ class ConfigSource(ABC):
 
     @abstractmethod
     def get_int(self, key: str, default: int | None = None) -> int | None: ...
+
+    @abstractmethod
+    def get_bool(self, key: str, default: bool | None = None) -> bool | None: ...
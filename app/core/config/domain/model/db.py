@@ -4,3 +4,13 @@ from dataclasses import dataclass
 @dataclass(frozen=True)
 class DatabaseConfig:
     url: str
+    replica_url: str | None = None
+    replica_max_lag_seconds: int = 10
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_pre_ping: bool = True
+    pool_recycle_seconds: int = 1800
+    statement_timeout_ms: int = 30000
+    partition_months_ahead: int = 2
+    partition_retention_months: int = 0
+    partition_archive_dir: str = "archive"
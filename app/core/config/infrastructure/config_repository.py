@@ -47,7 +47,19 @@ class ConfigRepositoryImpl(ConfigRepository):
                 auth_secret_algorithm=self._config_source.get_str("ACCESS_SECRET_ALGORITHM"),
                 access_token_expire_minutes=self._config_source.get_int("ACCESS_TOKEN_EXPIRE_MINUTES", 60 * 24 * 30),
             ),
-            db=DatabaseConfig(url=self._config_source.get_str("DATABASE_URL")),
+            db=DatabaseConfig(
+                url=self._config_source.get_str("DATABASE_URL"),
+                replica_url=self._config_source.get_str("DATABASE_REPLICA_URL") or None,
+                replica_max_lag_seconds=self._config_source.get_int("DATABASE_REPLICA_MAX_LAG_SECONDS", 10),
+                pool_size=self._config_source.get_int("DATABASE_POOL_SIZE", 10),
+                max_overflow=self._config_source.get_int("DATABASE_MAX_OVERFLOW", 20),
+                pool_pre_ping=self._config_source.get_bool("DATABASE_POOL_PRE_PING", True),
+                pool_recycle_seconds=self._config_source.get_int("DATABASE_POOL_RECYCLE_SECONDS", 1800),
+                statement_timeout_ms=self._config_source.get_int("DATABASE_STATEMENT_TIMEOUT_MS", 30000),
+                partition_months_ahead=self._config_source.get_int("DATABASE_PARTITION_MONTHS_AHEAD", 2),
+                partition_retention_months=self._config_source.get_int("DATABASE_PARTITION_RETENTION_MONTHS", 0),
+                partition_archive_dir=self._config_source.get_str("DATABASE_PARTITION_ARCHIVE_DIR", "archive"),
+            ),
             logging=LoggingConfig(
                 level=self._config_source.get_str("LOG_LEVEL", "INFO"),
                 file=self._config_source.get_str("LOG_FILE", "gladdi-twitch-bot.log"),
@@ -9,3 +9,9 @@ class EnvConfigSource(ConfigSource):
 
     def get_int(self, key: str, default: int | None = None) -> int | None:
         return int(os.getenv(key, default))
+
+    def get_bool(self, key: str, default: bool | None = None) -> bool | None:
+        value = os.getenv(key)
+        if value is None:
+            return default
+        return value.strip().lower() in ("1", "true", "yes", "on")
@@ -1,17 +1,25 @@
+import asyncio
+import random
 from abc import ABC, abstractmethod
 from typing import Any
 
 import httpx
 
 from app.core.network.api.model.response import ApiResponse
+from app.core.network.api.rate_limit import RateLimitBucket, RateLimitMetrics
 
 
 class ApiClient(ABC):
     _TIMEOUT_SECONDS_DEFAULT = 10.0
     _MAX_CONNECTIONS_DEFAULT = 20
     _MAX_KEEP_ALIVE_CONNECTIONS_DEFAULT = 10
+    _MAX_RETRIES = 3
+    _BACKOFF_BASE_SECONDS = 0.5
+    _BACKOFF_MAX_SECONDS = 8.0
+    _STATUS_TOO_MANY_REQUESTS = 429
+    _RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
 
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, rate_limit_bucket: RateLimitBucket | None = None):
         self._client = httpx.AsyncClient(
             base_url=base_url,
             timeout=httpx.Timeout(self._TIMEOUT_SECONDS_DEFAULT),
@@ -19,23 +27,63 @@ class ApiClient(ABC):
                 max_connections=self._MAX_CONNECTIONS_DEFAULT, max_keepalive_connections=self._MAX_KEEP_ALIVE_CONNECTIONS_DEFAULT
             ),
         )
+        self._rate_limit_bucket = rate_limit_bucket
 
     @abstractmethod
     def base_headers(self) -> dict[str, str] | None: ...
 
     async def get(self, url: str, params: dict[str, Any] | None, headers: dict[str, str] | None = None) -> ApiResponse:
-        base_headers = self.base_headers()
-        merged_headers = {**base_headers, **headers} if headers else base_headers
-        response = await self._client.get(url, params=params, headers=merged_headers)
-        return ApiResponse(status_code=response.status_code, text=response.text, json_data=response.json())
+        return await self._request("GET", url, params=params, headers=headers, retry=True)
 
     async def post(
         self, url: str, params: dict[str, Any] | None, headers: dict[str, str] | None, data: dict[str, Any] | None
     ) -> ApiResponse:
-        base_headers = self.base_headers()
-        merged_headers = {**base_headers, **headers} if headers else base_headers
-        response = await self._client.post(url, params=params, headers=merged_headers, json=data)
-        return ApiResponse(status_code=response.status_code, text=response.text, json_data=response.json())
+        return await self._request("POST", url, params=params, headers=headers, data=data, retry=False)
+
+    def rate_limit_metrics(self) -> RateLimitMetrics | None:
+        return self._rate_limit_bucket.metrics() if self._rate_limit_bucket else None
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        retry: bool,
+        data: dict[str, Any] | None = None,
+    ) -> ApiResponse:
+        attempt = 0
+        while True:
+            base_headers = self.base_headers()
+            merged_headers = {**base_headers, **headers} if headers else base_headers
+            try:
+                response = await self._send(method, url, params=params, headers=merged_headers, data=data)
+            except httpx.TransportError:
+                if not retry or attempt >= self._MAX_RETRIES:
+                    raise
+            else:
+                if not retry or response.status_code not in self._RETRYABLE_STATUSES or attempt >= self._MAX_RETRIES:
+                    return ApiResponse(status_code=response.status_code, text=response.text)
+            attempt += 1
+            if self._rate_limit_bucket:
+                self._rate_limit_bucket.record_retry()
+            await asyncio.sleep(random.uniform(0, min(self._BACKOFF_MAX_SECONDS, self._BACKOFF_BASE_SECONDS * 2**attempt)))
+
+    async def _send(
+        self, method: str, url: str, params: dict[str, Any] | None, headers: dict[str, str] | None, data: dict[str, Any] | None
+    ) -> httpx.Response:
+        if self._rate_limit_bucket is None:
+            return await self._client.request(method, url, params=params, headers=headers, json=data)
+        await self._rate_limit_bucket.acquire()
+        response = None
+        try:
+            response = await self._client.request(method, url, params=params, headers=headers, json=data)
+            return response
+        finally:
+            await self._rate_limit_bucket.release(
+                headers=None if response is None else response.headers,
+                throttled=response is not None and response.status_code == self._STATUS_TOO_MANY_REQUESTS,
+            )
 
     async def close(self) -> None:
         await self._client.aclose()
@@ -0,0 +1,45 @@
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator
+from enum import StrEnum
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def _ndjson_lines(rows: Iterable[BaseModel]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(row.model_dump(mode="json"), ensure_ascii=False) + "\n"
+
+
+def _csv_lines(rows: Iterable[BaseModel], model: type[BaseModel]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(model.model_fields))
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row.model_dump(mode="json"))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def export_response(rows: Iterable[BaseModel], model: type[BaseModel], export_format: ExportFormat, filename: str) -> StreamingResponse:
+    lines = _ndjson_lines(rows) if export_format == ExportFormat.NDJSON else _csv_lines(rows, model)
+    return StreamingResponse(
+        lines,
+        media_type=_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'},
+    )
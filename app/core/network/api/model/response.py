@@ -1,4 +1,6 @@
+import json
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
 
@@ -6,4 +8,10 @@ from typing import Any
 class ApiResponse:
     status_code: int
     text: str
-    json_data: Any
+
+    @cached_property
+    def json_data(self) -> Any:
+        try:
+            return json.loads(self.text)
+        except ValueError:
+            return None
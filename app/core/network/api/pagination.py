@@ -0,0 +1,24 @@
+import base64
+from datetime import datetime
+
+from fastapi import HTTPException
+
+from app.common.domain.keyset import KeysetCursor
+
+
+def encode_cursor(cursor: KeysetCursor | None) -> str | None:
+    if cursor is None:
+        return None
+    at = cursor.at.isoformat() if cursor.at is not None else ""
+    return base64.urlsafe_b64encode(f"{at}|{cursor.id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str | None) -> KeysetCursor | None:
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        at, cursor_id = raw.split("|", 1)
+        return KeysetCursor(at=datetime.fromisoformat(at) if at else None, id=int(cursor_id))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Некорректный курсор пагинации") from exc
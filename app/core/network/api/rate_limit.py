@@ -0,0 +1,125 @@
+import asyncio
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RateLimitHeaders:
+    limit: str
+    remaining: str
+    reset: str
+
+
+@dataclass(frozen=True)
+class RateLimitMetrics:
+    limit: int | None
+    remaining: int | None
+    reset_at: float | None
+    in_flight: int
+    concurrency_limit: int
+    queued: int
+    waits: int
+    waited_seconds: float
+    throttled: int
+    retries: int
+
+
+class RateLimitBucket:
+    def __init__(self, headers: RateLimitHeaders, max_concurrency: int, reserve: int):
+        self._headers = headers
+        self._max_concurrency = max_concurrency
+        self._reserve = reserve
+        self._condition = asyncio.Condition()
+        self._limit: int | None = None
+        self._remaining: int | None = None
+        self._reset_at: float | None = None
+        self._in_flight = 0
+        self._concurrency_limit = max_concurrency
+        self._successes = 0
+        self._queued = 0
+        self._waits = 0
+        self._waited_seconds = 0.0
+        self._throttled = 0
+        self._retries = 0
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            started_at = None
+            while (delay := self._delay()) != 0:
+                if started_at is None:
+                    started_at = time.monotonic()
+                    self._queued += 1
+                try:
+                    await asyncio.wait_for(self._condition.wait(), timeout=delay)
+                except TimeoutError:
+                    pass
+            if started_at is not None:
+                self._queued -= 1
+                self._waits += 1
+                self._waited_seconds += time.monotonic() - started_at
+            self._in_flight += 1
+            if self._remaining is not None:
+                self._remaining -= 1
+
+    async def release(self, headers: Mapping[str, str] | None, throttled: bool) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            if headers is not None:
+                self._update(headers)
+            if throttled:
+                self._throttled += 1
+                self._successes = 0
+                self._concurrency_limit = max(1, self._concurrency_limit // 2)
+                self._remaining = 0
+            else:
+                self._successes += 1
+                if self._successes >= self._concurrency_limit and self._concurrency_limit < self._max_concurrency:
+                    self._concurrency_limit += 1
+                    self._successes = 0
+            self._condition.notify_all()
+
+    def record_retry(self) -> None:
+        self._retries += 1
+
+    def metrics(self) -> RateLimitMetrics:
+        return RateLimitMetrics(
+            limit=self._limit,
+            remaining=self._remaining,
+            reset_at=self._reset_at,
+            in_flight=self._in_flight,
+            concurrency_limit=self._concurrency_limit,
+            queued=self._queued,
+            waits=self._waits,
+            waited_seconds=round(self._waited_seconds, 3),
+            throttled=self._throttled,
+            retries=self._retries,
+        )
+
+    def _delay(self) -> float | None:
+        if self._in_flight >= self._concurrency_limit:
+            return None
+        if self._remaining is not None and self._remaining <= self._reserve:
+            until_reset = (self._reset_at or 0) - time.time()
+            if until_reset > 0:
+                return until_reset
+            self._remaining = None
+        return 0
+
+    def _update(self, headers: Mapping[str, str]) -> None:
+        limit = self._parse(headers.get(self._headers.limit))
+        remaining = self._parse(headers.get(self._headers.remaining))
+        reset_at = self._parse(headers.get(self._headers.reset))
+        if limit is not None:
+            self._limit = limit
+        if remaining is not None:
+            self._remaining = remaining
+        if reset_at is not None:
+            self._reset_at = float(reset_at)
+
+    @staticmethod
+    def _parse(value: str | None) -> int | None:
+        try:
+            return int(value) if value is not None else None
+        except ValueError:
+            return None
@@ -0,0 +1,105 @@
+import asyncio
+from datetime import datetime
+
+from app.core.logger.domain.logger import Logger
+from app.economy.application.uow.activity_ledger_uow import ActivityLedgerUnitOfWorkFactory
+from app.economy.domain.models import MessageActivity
+
+_ActivityKey = tuple[str, str]
+
+
+class ActivityLedger:
+    _FLUSH_INTERVAL_SECONDS_DEFAULT = 5.0
+    _RETRY_DELAY_SECONDS_DEFAULT = 2.0
+    _DRAIN_TIMEOUT_SECONDS_DEFAULT = 15.0
+
+    def __init__(
+        self,
+        activity_ledger_uow: ActivityLedgerUnitOfWorkFactory,
+        logger: Logger,
+        flush_interval_seconds: float = _FLUSH_INTERVAL_SECONDS_DEFAULT,
+    ):
+        self._activity_ledger_uow = activity_ledger_uow
+        self._logger = logger.create_child(__name__)
+        self._flush_interval_seconds = flush_interval_seconds
+        self._pending: dict[_ActivityKey, MessageActivity] = {}
+        self._in_flight: list[MessageActivity] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task | None = None
+
+    def record_message(self, channel_name: str, user_name: str, occurred_at: datetime) -> None:
+        self._merge(MessageActivity(channel_name, user_name.lower(), 1, occurred_at, occurred_at))
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write(self._take_pending())
+            return
+
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._flush_interval_seconds, self._schedule_flush)
+
+    async def drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._DRAIN_TIMEOUT_SECONDS_DEFAULT
+        while self._pending or self._is_flushing():
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                unwritten = {(activity.channel_name, activity.user_name) for activity in self._in_flight} | self._pending.keys()
+                self._logger.log_error(f"Не удалось записать активность {len(unwritten)} пользователей до остановки")
+                return
+            if not self._is_flushing():
+                self._schedule_flush()
+            await asyncio.wait({self._flush_task}, timeout=remaining)
+            if self._pending and not self._is_flushing():
+                await asyncio.sleep(min(self._RETRY_DELAY_SECONDS_DEFAULT, max(deadline - loop.time(), 0)))
+
+    def _merge(self, activity: MessageActivity) -> None:
+        key = (activity.channel_name, activity.user_name)
+        pending = self._pending.get(key)
+        if pending is None:
+            self._pending[key] = activity
+            return
+        pending.message_count += activity.message_count
+        pending.first_message_at = min(pending.first_message_at, activity.first_message_at)
+        pending.last_message_at = max(pending.last_message_at, activity.last_message_at)
+
+    def _is_flushing(self) -> bool:
+        return self._flush_task is not None and not self._flush_task.done()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending or self._is_flushing():
+            return
+        self._flush_task = asyncio.get_running_loop().create_task(self._flush())
+
+    async def _flush(self) -> None:
+        while self._pending:
+            self._in_flight = self._take_pending()
+            try:
+                await asyncio.to_thread(self._write, self._in_flight)
+            except Exception as e:
+                self._logger.log_exception(f"Не удалось записать активность {len(self._in_flight)} пользователей, повтор", e)
+                self._requeue(self._in_flight)
+                return
+            finally:
+                self._in_flight = []
+
+    def _write(self, activities: list[MessageActivity]) -> None:
+        if not activities:
+            return
+        with self._activity_ledger_uow.create() as uow:
+            uow.economy_policy.apply_message_activity(activities)
+
+    def _take_pending(self) -> list[MessageActivity]:
+        activities = list(self._pending.values())
+        self._pending = {}
+        return activities
+
+    def _requeue(self, activities: list[MessageActivity]) -> None:
+        for activity in activities:
+            self._merge(activity)
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self._RETRY_DELAY_SECONDS_DEFAULT, self._schedule_flush)
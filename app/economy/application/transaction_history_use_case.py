@@ -0,0 +1,18 @@
+from collections.abc import Iterator
+
+from app.common.domain.keyset import KeysetCursor, Page
+from app.economy.domain.models import TransactionRecord
+from app.economy.domain.repo import TransactionHistoryRepository
+
+
+class TransactionHistoryUseCase:
+    def __init__(self, transaction_history_repository: TransactionHistoryRepository):
+        self._transaction_history_repository = transaction_history_repository
+
+    def get_transactions(
+        self, channel_name: str, user_name: str | None, cursor: KeysetCursor | None, limit: int
+    ) -> Page[TransactionRecord]:
+        return self._transaction_history_repository.list_transactions(channel_name, user_name, cursor, limit)
+
+    def iter_transactions(self, channel_name: str, user_name: str | None) -> Iterator[TransactionRecord]:
+        return self._transaction_history_repository.iter_transactions(channel_name, user_name)
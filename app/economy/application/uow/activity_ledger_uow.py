@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+from app.common.application.unit_of_work import UnitOfWork, UnitOfWorkFactory
+from app.economy.domain.economy_policy import EconomyPolicy
+
+
+class ActivityLedgerUnitOfWork(UnitOfWork, Protocol):
+    @property
+    def economy_policy(self) -> EconomyPolicy: ...
+
+
+class ActivityLedgerUnitOfWorkFactory(UnitOfWorkFactory[ActivityLedgerUnitOfWork], Protocol):
+    pass
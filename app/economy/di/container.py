@@ -2,9 +2,16 @@ from sqlalchemy.orm import Session
 
 from app.chat.application.usecase.chat_use_case import ChatUseCase
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
+from app.core.logger.domain.logger import Logger
+from app.economy.application.activity_ledger import ActivityLedger
+from app.economy.application.transaction_history_use_case import TransactionHistoryUseCase
 from app.economy.domain.economy_policy import EconomyPolicy
+from app.economy.domain.leaderboard import Leaderboard
 from app.economy.domain.repo import EconomyRepository
 from app.economy.infrastructure.economy_repository import EconomyRepositoryImpl
+from app.economy.infrastructure.leaderboard.in_memory_leaderboard import InMemoryLeaderboard
+from app.economy.infrastructure.transaction_history_repository import TransactionHistoryRepositoryImpl
+from app.economy.infrastructure.uow.activity_ledger_uow import SqlAlchemyActivityLedgerUnitOfWorkFactory
 from app.platform.command.balance.application.balance_uow import BalanceUnitOfWorkFactory
 from app.platform.command.balance.application.handle_balance_use_case import HandleBalanceUseCase
 from app.platform.command.balance.infrastructure.balance_uow import SqlAlchemyBalanceUnitOfWorkFactory
@@ -12,17 +19,29 @@ from core.types import SessionFactory
 
 
 class EconomyContainer:
-    def __init__(self, session_factory_rw: SessionFactory, session_factory_ro: SessionFactory):
+    def __init__(self, session_factory_rw: SessionFactory, session_factory_ro: SessionFactory, logger: Logger):
         self._session_factory_rw = session_factory_rw
         self._session_factory_ro = session_factory_ro
+        self.leaderboard: Leaderboard = InMemoryLeaderboard()
         self.economy_policy_factory: SessionScopedFactory[EconomyPolicy] = SessionScopedFactory(self.economy_policy)
+        self.activity_ledger = ActivityLedger(
+            activity_ledger_uow=SqlAlchemyActivityLedgerUnitOfWorkFactory(
+                session_factory_rw=session_factory_rw,
+                session_factory_ro=session_factory_ro,
+                economy_policy_factory=self.economy_policy_factory,
+            ),
+            logger=logger,
+        )
 
     def economy_repository(self, session: Session) -> EconomyRepository:
-        return EconomyRepositoryImpl(session)
+        return EconomyRepositoryImpl(session, self.leaderboard)
 
     def economy_policy(self, session: Session) -> EconomyPolicy:
         economy_repository = self.economy_repository(session)
-        return EconomyPolicy(economy_repository)
+        return EconomyPolicy(economy_repository, self.leaderboard)
+
+    def transaction_history_use_case(self, session: Session) -> TransactionHistoryUseCase:
+        return TransactionHistoryUseCase(TransactionHistoryRepositoryImpl(session))
 
     def balance_uow_factory(self, chat_use_case: ChatUseCase) -> BalanceUnitOfWorkFactory:
         return SqlAlchemyBalanceUnitOfWorkFactory(
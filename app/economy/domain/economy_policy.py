@@ -1,8 +1,15 @@
+from collections import defaultdict
 from datetime import UTC, datetime, timedelta
 
+from app.economy.domain.leaderboard import Leaderboard
 from app.economy.domain.models import (
     BalanceBrief,
+    BalanceChange,
+    BalanceDelta,
+    BalanceTransfer,
     DailyBonusResult,
+    LedgerEntry,
+    MessageActivity,
     TransactionData,
     TransactionType,
     TransferResult,
@@ -26,45 +33,132 @@ class EconomyPolicy:
     BATTLE_ENTRY_FEE = 500
     BATTLE_WINNER_PRIZE = 1000
 
-    def __init__(self, repo: EconomyRepository):
+    def __init__(self, repo: EconomyRepository, leaderboard: Leaderboard):
         self._repo = repo
-
-    def _should_grant_activity_reward(self, user_balance: UserBalanceInfo) -> bool:
-        if user_balance.last_activity_reward is not None:
-            time_since_last = datetime.now(UTC) - user_balance.last_activity_reward
-            if time_since_last < timedelta(minutes=self.ACTIVITY_COOLDOWN_MINUTES):
-                return False
-
-        return True
-
-    def process_user_message_activity(self, channel_name: str, user_name: str):
-        user_balance = self.get_user_balance(channel_name, user_name)
-
-        user_balance.message_count += 1
-
-        if not self._should_grant_activity_reward(user_balance):
-            self._repo.save_balance(user_balance)
-            return None
-
-        user_balance.last_activity_reward = datetime.now(UTC)
-
-        balance_before = user_balance.balance
-        user_balance.balance += self.ACTIVITY_REWARD
-        user_balance.total_earned += self.ACTIVITY_REWARD
-
-        self._repo.save_balance(user_balance)
-        self._repo.add_transaction(
-            TransactionData(
-                channel_name=channel_name,
-                user_name=user_name,
-                transaction_type=TransactionType.MESSAGE_REWARD,
-                amount=self.ACTIVITY_REWARD,
-                balance_before=balance_before,
-                balance_after=user_balance.balance,
-                description="Награда за активность в чате",
-                created_at=datetime.now(UTC),
-            ),
+        self._leaderboard = leaderboard
+
+    def _activity_reward_time(self, last_activity_reward: datetime | None, activity: MessageActivity) -> datetime | None:
+        if last_activity_reward is None:
+            return activity.first_message_at
+
+        cooldown_ends_at = last_activity_reward + timedelta(minutes=self.ACTIVITY_COOLDOWN_MINUTES)
+        if activity.first_message_at >= cooldown_ends_at:
+            return activity.first_message_at
+        if activity.last_message_at >= cooldown_ends_at:
+            return activity.last_message_at
+        return None
+
+    def apply_message_activity(self, activities: list[MessageActivity]) -> None:
+        activities_by_channel: dict[str, list[MessageActivity]] = defaultdict(list)
+        for activity in activities:
+            activities_by_channel[activity.channel_name].append(activity)
+
+        for channel_name, channel_activities in activities_by_channel.items():
+            balances = self._get_or_create_balances(channel_name, [activity.user_name for activity in channel_activities])
+
+            deltas: list[BalanceDelta] = []
+            transactions: list[TransactionData] = []
+            for activity in channel_activities:
+                user_balance = balances[activity.user_name]
+                delta = BalanceDelta(balance_id=user_balance.id, message_count=activity.message_count)
+
+                reward_time = self._activity_reward_time(user_balance.last_activity_reward, activity)
+                if reward_time is not None:
+                    delta.amount = self.ACTIVITY_REWARD
+                    delta.earned = self.ACTIVITY_REWARD
+                    delta.last_activity_reward = reward_time
+                    delta.last_active_at = reward_time
+                    transactions.append(
+                        TransactionData(
+                            channel_name=channel_name,
+                            user_name=activity.user_name,
+                            transaction_type=TransactionType.MESSAGE_REWARD,
+                            amount=self.ACTIVITY_REWARD,
+                            balance_before=user_balance.balance,
+                            balance_after=user_balance.balance + self.ACTIVITY_REWARD,
+                            description="Награда за активность в чате",
+                            created_at=reward_time,
+                        )
+                    )
+                deltas.append(delta)
+
+            self._repo.apply_balance_deltas(deltas)
+            self._repo.add_transactions(transactions)
+
+    def post_many(self, entries: list[LedgerEntry]) -> list[LedgerEntry]:
+        rejected: list[LedgerEntry] = []
+        entries_by_channel: dict[str, list[LedgerEntry]] = defaultdict(list)
+        for entry in entries:
+            entries_by_channel[entry.channel_name].append(entry)
+
+        now = datetime.now(UTC)
+        for channel_name, channel_entries in entries_by_channel.items():
+            balances = self._get_or_create_balances(channel_name, [entry.user_name for entry in channel_entries])
+
+            deltas: dict[int, BalanceDelta] = {}
+            running_balances = {user_name: balance.balance for user_name, balance in balances.items()}
+            transactions: list[TransactionData] = []
+            for entry in channel_entries:
+                user_name = entry.user_name.lower()
+                balance_before = running_balances[user_name]
+                if balance_before + entry.amount < 0:
+                    rejected.append(entry)
+                    continue
+
+                user_balance = balances[user_name]
+                delta = deltas.setdefault(user_balance.id, BalanceDelta(balance_id=user_balance.id))
+                delta.amount += entry.amount
+                delta.earned += max(0, entry.amount)
+                delta.spent += max(0, -entry.amount)
+                delta.last_active_at = now
+
+                running_balances[user_name] = balance_before + entry.amount
+                transactions.append(
+                    TransactionData(
+                        channel_name=channel_name,
+                        user_name=user_name,
+                        transaction_type=entry.transaction_type,
+                        amount=entry.amount,
+                        balance_before=balance_before,
+                        balance_after=running_balances[user_name],
+                        description=entry.description,
+                        created_at=now,
+                    )
+                )
+
+            self._repo.apply_balance_deltas(list(deltas.values()))
+            self._repo.add_transactions(transactions)
+
+        return rejected
+
+    def _get_or_create_balances(self, channel_name: str, user_names: list[str]) -> dict[str, UserBalanceInfo]:
+        normalized_user_names = sorted({user_name.lower() for user_name in user_names})
+        balances = {balance.user_name: balance for balance in self._repo.lock_balances(channel_name, normalized_user_names)}
+
+        missing_user_names = [user_name for user_name in normalized_user_names if user_name not in balances]
+        if missing_user_names:
+            balances.update(self._create_balances(channel_name, missing_user_names))
+        return balances
+
+    def _create_balances(self, channel_name: str, user_names: list[str]) -> dict[str, UserBalanceInfo]:
+        created = self._repo.create_balances(channel_name, user_names, self.STARTING_BALANCE)
+        now = datetime.now(UTC)
+        self._repo.add_transactions(
+            [
+                TransactionData(
+                    channel_name=channel_name,
+                    user_name=balance.user_name,
+                    transaction_type=TransactionType.ADMIN_ADJUST,
+                    amount=self.STARTING_BALANCE,
+                    balance_before=0,
+                    balance_after=self.STARTING_BALANCE,
+                    description="Создание нового аккаунта",
+                    created_at=now,
+                )
+                for balance in created
+            ]
         )
+        return {balance.user_name: balance for balance in created}
 
     def get_user_balance(self, channel_name: str, user_name: str) -> UserBalanceInfo:
         normalized_user_name = user_name.lower()
@@ -87,131 +181,145 @@ class EconomyPolicy:
 
         return user_balance
 
+    def _apply_balance_change(self, change: BalanceChange) -> UserBalanceInfo | None:
+        saved = self._repo.apply_balance_change(change)
+        if saved is None and self._repo.get_balance(change.channel_name, change.user_name) is None:
+            self.get_user_balance(change.channel_name, change.user_name)
+            saved = self._repo.apply_balance_change(change)
+        return saved
+
     def add_balance(
         self, channel_name: str, user_name: str, amount: int, transaction_type: TransactionType, description: str
     ) -> UserBalanceInfo:
-        normalized_user_name = user_name.lower()
-
-        user_balance = self.get_user_balance(channel_name, normalized_user_name)
-
-        balance_before = user_balance.balance or 0
-        user_balance.balance = (user_balance.balance or 0) + amount
-        user_balance.total_earned = (user_balance.total_earned or 0) + max(0, amount)
-
-        saved = self._repo.save_balance(user_balance)
-        self._repo.add_transaction(
-            TransactionData(
+        return self._apply_balance_change(
+            BalanceChange(
                 channel_name=channel_name,
-                user_name=normalized_user_name,
-                transaction_type=transaction_type,
+                user_name=user_name.lower(),
                 amount=amount,
-                balance_before=balance_before,
-                balance_after=saved.balance,
+                transaction_type=transaction_type,
                 description=description,
                 created_at=datetime.now(UTC),
-            ),
+            )
         )
-        return saved
 
     def subtract_balance(
         self, channel_name: str, user_name: str, amount: int, transaction_type: TransactionType, description: str = None
     ) -> UserBalanceInfo | None:
-        normalized_user_name = user_name.lower()
-
-        user_balance = self.get_user_balance(channel_name, normalized_user_name)
-
-        current_balance = user_balance.balance or 0
-        if current_balance < amount:
-            return None
-
-        balance_before = current_balance
-        user_balance.balance = current_balance - amount
-        user_balance.total_spent = (user_balance.total_spent or 0) + amount
-
-        saved = self._repo.save_balance(user_balance)
-        self._repo.add_transaction(
-            TransactionData(
+        return self._apply_balance_change(
+            BalanceChange(
                 channel_name=channel_name,
-                user_name=normalized_user_name,
-                transaction_type=transaction_type,
+                user_name=user_name.lower(),
                 amount=-amount,
-                balance_before=balance_before,
-                balance_after=saved.balance,
+                transaction_type=transaction_type,
                 description=description,
                 created_at=datetime.now(UTC),
-            ),
+                required_balance=amount,
+            )
         )
 
-        return saved
-
-    def transfer_money(self, channel_name: str, sender_name: str, receiver_name: str, amount: int) -> TransferResult:
-        if amount < self.MIN_TRANSFER_AMOUNT:
+    def _validate_transfer(self, transfer: BalanceTransfer) -> TransferResult | None:
+        if transfer.amount < self.MIN_TRANSFER_AMOUNT:
             return TransferResult.failure_result(f"Минимальная сумма перевода: {self.MIN_TRANSFER_AMOUNT} монет")
 
-        if amount > self.MAX_TRANSFER_AMOUNT:
+        if transfer.amount > self.MAX_TRANSFER_AMOUNT:
             return TransferResult.failure_result(f"Максимальная сумма перевода: {self.MAX_TRANSFER_AMOUNT} монет")
 
-        if sender_name == receiver_name:
+        if transfer.sender_name.lower() == transfer.receiver_name.lower():
             return TransferResult.failure_result("Нельзя переводить деньги самому себе!")
 
-        receiver_balance = self._repo.get_balance(channel_name, receiver_name)
-
-        if receiver_balance is None:
-            return TransferResult.failure_result(f"Пользователь @{receiver_name} не найден в системе!")
-
-        sender_balance = self.get_user_balance(channel_name, sender_name)
-        receiver_balance = self.get_user_balance(channel_name, receiver_name)
+        return None
 
-        if sender_balance.balance < amount:
-            return TransferResult.failure_result(f"Недостаточно средств! У вас {sender_balance.balance} монет, нужно {amount}")
-
-        sender_balance_before = sender_balance.balance
-        receiver_balance_before = receiver_balance.balance
-
-        sender_balance.balance -= amount
-        sender_balance.total_spent += amount
+    def transfer_money(self, channel_name: str, sender_name: str, receiver_name: str, amount: int) -> TransferResult:
+        transfer = BalanceTransfer(channel_name=channel_name, sender_name=sender_name, receiver_name=receiver_name, amount=amount)
+        return self.transfer_many([transfer])[0]
 
-        receiver_balance.balance += amount
-        receiver_balance.total_earned += amount
+    def transfer_many(self, transfers: list[BalanceTransfer]) -> list[TransferResult]:
+        results: list[TransferResult | None] = [self._validate_transfer(transfer) for transfer in transfers]
 
-        sender_saved = self._repo.save_balance(sender_balance)
-        receiver_saved = self._repo.save_balance(receiver_balance)
+        transfers_by_channel: dict[str, list[int]] = defaultdict(list)
+        for index, transfer in enumerate(transfers):
+            if results[index] is None:
+                transfers_by_channel[transfer.channel_name].append(index)
 
-        self._repo.add_transaction(
-            TransactionData(
-                channel_name=channel_name,
-                user_name=sender_name,
-                transaction_type=TransactionType.TRANSFER_SENT,
-                amount=-amount,
-                balance_before=sender_balance_before,
-                balance_after=sender_saved.balance,
-                description=f"Перевод {amount} монет пользователю {receiver_name}",
-                created_at=datetime.now(UTC),
-            ),
-        )
+        now = datetime.now(UTC)
+        for channel_name, indexes in transfers_by_channel.items():
+            user_names = sorted(
+                {transfers[index].sender_name.lower() for index in indexes} | {transfers[index].receiver_name.lower() for index in indexes}
+            )
+            balances = {balance.user_name: balance for balance in self._repo.lock_balances(channel_name, user_names)}
 
-        self._repo.add_transaction(
-            TransactionData(
-                channel_name=channel_name,
-                user_name=receiver_name,
-                transaction_type=TransactionType.TRANSFER_RECEIVED,
-                amount=amount,
-                balance_before=receiver_balance_before,
-                balance_after=receiver_saved.balance,
-                description=f"Получен перевод {amount} монет от {sender_name}",
-                created_at=datetime.now(UTC),
-            ),
-        )
-        return TransferResult.success_result()
+            missing_sender_names = sorted(
+                {transfers[index].sender_name.lower() for index in indexes if transfers[index].receiver_name.lower() in balances}
+                - balances.keys()
+            )
+            if missing_sender_names:
+                balances.update(self._create_balances(channel_name, missing_sender_names))
+
+            deltas: dict[int, BalanceDelta] = {}
+            running_balances = {user_name: balance.balance for user_name, balance in balances.items()}
+            transactions: list[TransactionData] = []
+            for index in indexes:
+                transfer = transfers[index]
+                sender_name = transfer.sender_name.lower()
+                receiver_name = transfer.receiver_name.lower()
+
+                if receiver_name not in balances:
+                    results[index] = TransferResult.failure_result(f"Пользователь @{receiver_name} не найден в системе!")
+                    continue
+
+                sender_balance = running_balances[sender_name]
+                if sender_balance < transfer.amount:
+                    results[index] = TransferResult.failure_result(
+                        f"Недостаточно средств! У вас {sender_balance} монет, нужно {transfer.amount}"
+                    )
+                    continue
+
+                sender_delta = deltas.setdefault(balances[sender_name].id, BalanceDelta(balance_id=balances[sender_name].id))
+                sender_delta.amount -= transfer.amount
+                sender_delta.spent += transfer.amount
+                sender_delta.last_active_at = now
+                receiver_delta = deltas.setdefault(balances[receiver_name].id, BalanceDelta(balance_id=balances[receiver_name].id))
+                receiver_delta.amount += transfer.amount
+                receiver_delta.earned += transfer.amount
+                receiver_delta.last_active_at = now
+
+                receiver_balance = running_balances[receiver_name]
+                running_balances[sender_name] = sender_balance - transfer.amount
+                running_balances[receiver_name] = receiver_balance + transfer.amount
+                transactions.append(
+                    TransactionData(
+                        channel_name=channel_name,
+                        user_name=sender_name,
+                        transaction_type=TransactionType.TRANSFER_SENT,
+                        amount=-transfer.amount,
+                        balance_before=sender_balance,
+                        balance_after=running_balances[sender_name],
+                        description=f"Перевод {transfer.amount} монет пользователю {receiver_name}",
+                        created_at=now,
+                    )
+                )
+                transactions.append(
+                    TransactionData(
+                        channel_name=channel_name,
+                        user_name=receiver_name,
+                        transaction_type=TransactionType.TRANSFER_RECEIVED,
+                        amount=transfer.amount,
+                        balance_before=receiver_balance,
+                        balance_after=running_balances[receiver_name],
+                        description=f"Получен перевод {transfer.amount} монет от {sender_name}",
+                        created_at=now,
+                    )
+                )
+                results[index] = TransferResult.success_result()
+
+            self._repo.apply_balance_deltas(list(deltas.values()))
+            self._repo.add_transactions(transactions)
+
+        return results
 
     def claim_daily_bonus(
         self, active_stream_id: int, channel_name: str, user_name: str, user_equipment: list[UserEquipment] = None
     ) -> DailyBonusResult:
-        user_balance = self.get_user_balance(channel_name, user_name)
-
-        if user_balance.last_bonus_stream_id == active_stream_id:
-            return DailyBonusResult(success=False, failure_reason="already_claimed")
-
         equipment = user_equipment or []
         total_multiplier = 1.0
         bonus_messages = []
@@ -233,34 +341,32 @@ class EconomyPolicy:
             else:
                 bonus_message = bonus_messages[0]
 
-        balance_before = user_balance.balance
-        user_balance.balance += bonus_amount
-        user_balance.total_earned += bonus_amount
-        user_balance.last_daily_claim = datetime.now(UTC)
-        user_balance.last_bonus_stream_id = active_stream_id
-        user_balance.updated_at = datetime.now(UTC)
-
         transaction_description = "Бонус" + (f" (усилен {special_items})" if special_items else "")
 
-        saved = self._repo.save_balance(user_balance)
-
-        self._repo.add_transaction(
-            TransactionData(
+        saved = self._apply_balance_change(
+            BalanceChange(
                 channel_name=channel_name,
-                user_name=user_name,
-                transaction_type=TransactionType.DAILY_BONUS,
+                user_name=user_name.lower(),
                 amount=bonus_amount,
-                balance_before=balance_before,
-                balance_after=saved.balance,
+                transaction_type=TransactionType.DAILY_BONUS,
                 description=transaction_description,
                 created_at=datetime.now(UTC),
-            ),
+                bonus_stream_id=active_stream_id,
+            )
         )
+        if saved is None:
+            return DailyBonusResult(success=False, failure_reason="already_claimed")
 
         return DailyBonusResult(success=True, bonus_amount=bonus_amount, bonus_message=bonus_message)
 
+    def _ensure_leaderboard(self, channel_name: str) -> None:
+        if not self._leaderboard.is_loaded(channel_name):
+            self._leaderboard.load(channel_name, self._repo.list_leaderboard_entries(channel_name))
+
     def get_top_users(self, channel_name: str, limit: int) -> list[BalanceBrief]:
-        return self._repo.get_top_users(channel_name, limit)
+        self._ensure_leaderboard(channel_name)
+        return self._leaderboard.top(channel_name, limit)
 
     def get_bottom_users(self, channel_name: str, limit: int, active_since: datetime) -> list[BalanceBrief]:
-        return self._repo.get_bottom_users(channel_name, limit, active_since)
+        self._ensure_leaderboard(channel_name)
+        return self._leaderboard.bottom(channel_name, limit, active_since)
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+
+from app.economy.domain.models import BalanceBrief, LeaderboardEntry
+
+
+class Leaderboard(ABC):
+    @abstractmethod
+    def is_loaded(self, channel_name: str) -> bool: ...
+
+    @abstractmethod
+    def load(self, channel_name: str, entries: Sequence[LeaderboardEntry]) -> None: ...
+
+    @abstractmethod
+    def apply(self, entries: Sequence[LeaderboardEntry]) -> None: ...
+
+    @abstractmethod
+    def top(self, channel_name: str, limit: int) -> list[BalanceBrief]: ...
+
+    @abstractmethod
+    def bottom(self, channel_name: str, limit: int, active_since: datetime) -> list[BalanceBrief]: ...
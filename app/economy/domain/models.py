@@ -31,6 +31,8 @@ class UserBalanceInfo:
     last_bonus_stream_id: int | None
     message_count: int
     last_activity_reward: datetime | None
+    last_active_at: datetime | None = None
+    version: int = 0
 
 
 @dataclass
@@ -45,6 +47,77 @@ class TransactionData:
     created_at: datetime
 
 
+@dataclass(frozen=True)
+class TransactionRecord:
+    id: int
+    channel_name: str
+    user_name: str
+    transaction_type: TransactionType
+    amount: int
+    balance_before: int
+    balance_after: int
+    description: str | None
+    created_at: datetime
+
+
+@dataclass
+class BalanceDelta:
+    balance_id: int
+    amount: int = 0
+    earned: int = 0
+    spent: int = 0
+    message_count: int = 0
+    last_activity_reward: datetime | None = None
+    last_active_at: datetime | None = None
+
+
+@dataclass(frozen=True)
+class LeaderboardEntry:
+    channel_name: str
+    user_name: str
+    balance: int
+    last_active_at: datetime | None
+    version: int
+
+
+@dataclass(frozen=True)
+class BalanceChange:
+    channel_name: str
+    user_name: str
+    amount: int
+    transaction_type: TransactionType
+    description: str | None
+    created_at: datetime
+    required_balance: int | None = None
+    bonus_stream_id: int | None = None
+
+
+@dataclass(frozen=True)
+class BalanceTransfer:
+    channel_name: str
+    sender_name: str
+    receiver_name: str
+    amount: int
+
+
+@dataclass(frozen=True)
+class LedgerEntry:
+    channel_name: str
+    user_name: str
+    amount: int
+    transaction_type: TransactionType
+    description: str | None
+
+
+@dataclass
+class MessageActivity:
+    channel_name: str
+    user_name: str
+    message_count: int
+    first_message_at: datetime
+    last_message_at: datetime
+
+
 @dataclass
 class BalanceBrief:
     user_name: str
@@ -1,7 +1,8 @@
-from datetime import datetime
+from collections.abc import Iterator, Sequence
 from typing import Protocol
 
-from app.economy.domain.models import BalanceBrief, TransactionData, UserBalanceInfo
+from app.common.domain.keyset import KeysetCursor, Page
+from app.economy.domain.models import BalanceChange, BalanceDelta, LeaderboardEntry, TransactionData, TransactionRecord, UserBalanceInfo
 
 
 class EconomyRepository(Protocol):
@@ -9,10 +10,24 @@ class EconomyRepository(Protocol):
 
     def create_balance(self, channel_name: str, user_name: str, starting_balance: int) -> UserBalanceInfo: ...
 
-    def save_balance(self, balance: UserBalanceInfo) -> UserBalanceInfo: ...
+    def apply_balance_change(self, change: BalanceChange) -> UserBalanceInfo | None: ...
+
+    def lock_balances(self, channel_name: str, user_names: Sequence[str]) -> list[UserBalanceInfo]: ...
+
+    def create_balances(self, channel_name: str, user_names: Sequence[str], starting_balance: int) -> list[UserBalanceInfo]: ...
+
+    def apply_balance_deltas(self, deltas: Sequence[BalanceDelta]) -> None: ...
 
     def add_transaction(self, tx: TransactionData) -> None: ...
 
-    def get_top_users(self, channel_name: str, limit: int) -> list[BalanceBrief]: ...
+    def add_transactions(self, txs: Sequence[TransactionData]) -> None: ...
+
+    def list_leaderboard_entries(self, channel_name: str) -> list[LeaderboardEntry]: ...
+
+
+class TransactionHistoryRepository(Protocol):
+    def list_transactions(
+        self, channel_name: str, user_name: str | None, cursor: KeysetCursor | None, limit: int
+    ) -> Page[TransactionRecord]: ...
 
-    def get_bottom_users(self, channel_name: str, limit: int, active_since: datetime) -> list[BalanceBrief]: ...
+    def iter_transactions(self, channel_name: str, user_name: str | None) -> Iterator[TransactionRecord]: ...
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import BigInteger, DateTime, Enum, Integer, String
+from sqlalchemy import BigInteger, DateTime, Enum, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.economy.domain.models import TransactionType
@@ -9,6 +9,11 @@ from core.db import Base
 
 class TransactionHistory(Base):
     __tablename__ = "transaction_history"
+    __table_args__ = (
+        Index("ix_transaction_history_channel_user_created", "channel_name", "user_name", "created_at"),
+        Index("ix_transaction_history_channel_created", "channel_name", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, nullable=False)
     channel_name: Mapped[str] = mapped_column(String, nullable=False)
@@ -18,7 +23,7 @@ class TransactionHistory(Base):
     balance_before: Mapped[int] = mapped_column(BigInteger, nullable=False)
     balance_after: Mapped[int] = mapped_column(BigInteger, nullable=False)
     description: Mapped[str | None] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, primary_key=True, default=datetime.utcnow, nullable=False)
 
     def __repr__(self):
         return f"<TransactionHistory(user='{self.user_name}', type='{self.transaction_type}', amount={self.amount})>"
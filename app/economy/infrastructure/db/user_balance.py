@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import BigInteger, DateTime, Integer, String
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.db import Base
@@ -8,6 +8,10 @@ from core.db import Base
 
 class UserBalance(Base):
     __tablename__ = "user_balance"
+    __table_args__ = (
+        UniqueConstraint("channel_name", "user_name", name="uq_user_balance_channel_user"),
+        Index("ix_user_balance_channel_balance", "channel_name", "balance"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, nullable=False)
     channel_name: Mapped[str] = mapped_column(String, nullable=False)
@@ -19,6 +23,8 @@ class UserBalance(Base):
     last_bonus_stream_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
     message_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     last_activity_reward: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    last_active_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
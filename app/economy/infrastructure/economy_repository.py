@@ -1,18 +1,57 @@
-from datetime import datetime
+from collections.abc import Sequence
+from datetime import UTC, datetime
 
-from sqlalchemy import select
+from sqlalchemy import BigInteger, DateTime, Integer, String, cast, column, event, func, insert, literal, select, update, values
 from sqlalchemy.orm import Session
 
-from app.economy.domain.models import BalanceBrief, TransactionData, UserBalanceInfo
+from app.economy.domain.leaderboard import Leaderboard
+from app.economy.domain.models import BalanceChange, BalanceDelta, LeaderboardEntry, TransactionData, UserBalanceInfo
 from app.economy.domain.repo import EconomyRepository
 from app.economy.infrastructure.db.transaction_history import TransactionHistory
 from app.economy.infrastructure.db.user_balance import UserBalance
 from app.stream.infrastructure.mappers.stream_mapper import normalize_datetime
 
+LEADERBOARD_UPDATES_KEY = "economy_leaderboard_updates"
+LEADERBOARD_COLUMNS = (
+    UserBalance.channel_name,
+    UserBalance.user_name,
+    UserBalance.balance,
+    UserBalance.last_active_at,
+    UserBalance.version,
+)
+
 
 class EconomyRepositoryImpl(EconomyRepository):
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, leaderboard: Leaderboard | None = None):
         self._db = db
+        self._leaderboard = leaderboard
+
+    def _to_leaderboard_entry(self, row) -> LeaderboardEntry:
+        return LeaderboardEntry(
+            channel_name=row.channel_name,
+            user_name=row.user_name,
+            balance=row.balance,
+            last_active_at=normalize_datetime(row.last_active_at),
+            version=row.version,
+        )
+
+    def _publish(self, rows: Sequence) -> None:
+        if self._leaderboard is None or not rows:
+            return
+        if LEADERBOARD_UPDATES_KEY not in self._db.info:
+            self._db.info[LEADERBOARD_UPDATES_KEY] = []
+            event.listen(self._db, "after_commit", self._flush_leaderboard_updates)
+            event.listen(self._db, "after_rollback", self._discard_leaderboard_updates)
+        self._db.info[LEADERBOARD_UPDATES_KEY].extend(self._to_leaderboard_entry(row) for row in rows)
+
+    def _flush_leaderboard_updates(self, session: Session) -> None:
+        updates = session.info[LEADERBOARD_UPDATES_KEY]
+        if updates:
+            self._leaderboard.apply(updates)
+            updates.clear()
+
+    def _discard_leaderboard_updates(self, session: Session) -> None:
+        session.info[LEADERBOARD_UPDATES_KEY].clear()
 
     def _to_info(self, row: UserBalance) -> UserBalanceInfo:
         return UserBalanceInfo(
@@ -26,94 +65,171 @@ class EconomyRepositoryImpl(EconomyRepository):
             last_bonus_stream_id=row.last_bonus_stream_id,
             message_count=row.message_count,
             last_activity_reward=normalize_datetime(row.last_activity_reward),
+            last_active_at=normalize_datetime(row.last_active_at),
+            version=row.version,
         )
 
     def get_balance(self, channel_name: str, user_name: str) -> UserBalanceInfo | None:
-        stmt = select(UserBalance).where(UserBalance.channel_name == channel_name).where(UserBalance.user_name == user_name)
+        stmt = (
+            select(UserBalance)
+            .where(UserBalance.channel_name == channel_name)
+            .where(UserBalance.user_name == user_name)
+            .execution_options(populate_existing=True)
+        )
         row = self._db.execute(stmt).scalars().first()
         return self._to_info(row) if row else None
 
     def create_balance(self, channel_name: str, user_name: str, starting_balance: int) -> UserBalanceInfo:
-        row = UserBalance(
-            channel_name=channel_name,
-            user_name=user_name,
-            balance=starting_balance,
-            total_earned=starting_balance,
-            total_spent=0,
-            message_count=0,
-            last_daily_claim=None,
-            last_bonus_stream_id=None,
-            last_activity_reward=None,
-        )
-        self._db.add(row)
-        self._db.flush()
-        self._db.refresh(row)
-        return self._to_info(row)
-
-    def save_balance(self, balance: UserBalanceInfo) -> UserBalanceInfo:
-        row = None
-        if balance.id:
-            stmt = select(UserBalance).where(UserBalance.id == balance.id)
-            row = self._db.execute(stmt).scalars().first()
-
-        if not row:
-            row = UserBalance(channel_name=balance.channel_name, user_name=balance.user_name)
-            self._db.add(row)
-
-        last_daily_claim_naive = balance.last_daily_claim.replace(tzinfo=None) if balance.last_daily_claim else None
-        last_activity_reward_naive = balance.last_activity_reward.replace(tzinfo=None) if balance.last_activity_reward else None
-
-        row.balance = balance.balance
-        row.total_earned = balance.total_earned
-        row.total_spent = balance.total_spent
-        row.last_daily_claim = last_daily_claim_naive
-        row.last_bonus_stream_id = balance.last_bonus_stream_id
-        row.message_count = balance.message_count
-        row.last_activity_reward = last_activity_reward_naive
-
-        self._db.flush()
-        self._db.refresh(row)
-        return self._to_info(row)
-
-    def add_transaction(self, tx: TransactionData) -> None:
-        self._db.add(
-            TransactionHistory(
-                channel_name=tx.channel_name,
-                user_name=tx.user_name,
-                transaction_type=tx.transaction_type,
-                amount=tx.amount,
-                balance_before=tx.balance_before,
-                balance_after=tx.balance_after,
-                description=tx.description,
-                created_at=tx.created_at,
+        return self.create_balances(channel_name, [user_name], starting_balance)[0]
+
+    def apply_balance_change(self, change: BalanceChange) -> UserBalanceInfo | None:
+        balance_table = UserBalance.__table__
+        transaction_table = TransactionHistory.__table__
+        created_at = change.created_at.replace(tzinfo=None)
+
+        update_stmt = (
+            update(balance_table)
+            .where(balance_table.c.channel_name == change.channel_name)
+            .where(balance_table.c.user_name == change.user_name)
+            .values(
+                balance=balance_table.c.balance + change.amount,
+                total_earned=balance_table.c.total_earned + max(0, change.amount),
+                total_spent=balance_table.c.total_spent + max(0, -change.amount),
+                last_active_at=func.greatest(balance_table.c.last_active_at, created_at),
+                version=balance_table.c.version + 1,
             )
+            .returning(*balance_table.c)
         )
-
-    def get_top_users(self, channel_name: str, limit: int) -> list[BalanceBrief]:
-        stmt = select(UserBalance).where(UserBalance.channel_name == channel_name).order_by(UserBalance.balance.desc()).limit(limit)
-        rows = self._db.execute(stmt).scalars().all()
-        return [BalanceBrief(user_name=r.user_name, balance=r.balance) for r in rows]
-
-    def get_bottom_users(self, channel_name: str, limit: int, active_since: datetime) -> list[BalanceBrief]:
-        has_tx = (
-            select(1)
-            .select_from(TransactionHistory)
-            .where(
-                TransactionHistory.channel_name == channel_name,
-                TransactionHistory.user_name == UserBalance.user_name,
-                TransactionHistory.created_at >= active_since,
+        if change.required_balance is not None:
+            update_stmt = update_stmt.where(balance_table.c.balance >= change.required_balance)
+        if change.bonus_stream_id is not None:
+            update_stmt = update_stmt.where(balance_table.c.last_bonus_stream_id.is_distinct_from(change.bonus_stream_id)).values(
+                last_daily_claim=created_at, last_bonus_stream_id=change.bonus_stream_id
             )
-            .exists()
+        updated = update_stmt.cte("updated_balance")
+
+        ledger = insert(transaction_table).from_select(
+            ["channel_name", "user_name", "transaction_type", "amount", "balance_before", "balance_after", "description", "created_at"],
+            select(
+                updated.c.channel_name,
+                updated.c.user_name,
+                literal(change.transaction_type, transaction_table.c.transaction_type.type),
+                literal(change.amount, BigInteger),
+                updated.c.balance - change.amount,
+                updated.c.balance,
+                literal(change.description, String),
+                literal(created_at, DateTime),
+            ),
         )
+        row = self._db.execute(select(updated).add_cte(ledger.cte("ledger_entry"))).first()
+        if row is None:
+            return None
+        self._publish([row])
+        return self._to_info(row)
 
+    def lock_balances(self, channel_name: str, user_names: Sequence[str]) -> list[UserBalanceInfo]:
+        if not user_names:
+            return []
         stmt = (
             select(UserBalance)
-            .where(
-                UserBalance.channel_name == channel_name,
-                has_tx,
-            )
-            .order_by(UserBalance.balance.asc())
-            .limit(limit)
+            .where(UserBalance.channel_name == channel_name)
+            .where(UserBalance.user_name.in_(set(user_names)))
+            .order_by(UserBalance.id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
         )
         rows = self._db.execute(stmt).scalars().all()
-        return [BalanceBrief(user_name=r.user_name, balance=r.balance) for r in rows]
+        return [self._to_info(row) for row in rows]
+
+    def create_balances(self, channel_name: str, user_names: Sequence[str], starting_balance: int) -> list[UserBalanceInfo]:
+        if not user_names:
+            return []
+        created_at = datetime.now(UTC).replace(tzinfo=None)
+        stmt = insert(UserBalance).returning(UserBalance)
+        rows = self._db.scalars(
+            stmt,
+            [
+                {
+                    "channel_name": channel_name,
+                    "user_name": user_name,
+                    "balance": starting_balance,
+                    "total_earned": starting_balance,
+                    "total_spent": 0,
+                    "message_count": 0,
+                    "last_active_at": created_at,
+                }
+                for user_name in user_names
+            ],
+        ).all()
+        self._publish(rows)
+        return [self._to_info(row) for row in rows]
+
+    def apply_balance_deltas(self, deltas: Sequence[BalanceDelta]) -> None:
+        if not deltas:
+            return
+        delta_values = values(
+            column("id", Integer),
+            column("amount", BigInteger),
+            column("earned", BigInteger),
+            column("spent", BigInteger),
+            column("message_count", Integer),
+            column("last_activity_reward", DateTime),
+            column("last_active_at", DateTime),
+            name="balance_delta",
+        ).data(
+            [
+                (
+                    delta.balance_id,
+                    delta.amount,
+                    delta.earned,
+                    delta.spent,
+                    delta.message_count,
+                    delta.last_activity_reward.replace(tzinfo=None) if delta.last_activity_reward else None,
+                    delta.last_active_at.replace(tzinfo=None) if delta.last_active_at else None,
+                )
+                for delta in deltas
+            ]
+        )
+        stmt = (
+            update(UserBalance)
+            .where(UserBalance.id == delta_values.c.id)
+            .values(
+                balance=UserBalance.balance + delta_values.c.amount,
+                total_earned=UserBalance.total_earned + delta_values.c.earned,
+                total_spent=UserBalance.total_spent + delta_values.c.spent,
+                message_count=UserBalance.message_count + delta_values.c.message_count,
+                last_activity_reward=func.coalesce(cast(delta_values.c.last_activity_reward, DateTime), UserBalance.last_activity_reward),
+                last_active_at=func.greatest(UserBalance.last_active_at, cast(delta_values.c.last_active_at, DateTime)),
+                version=UserBalance.version + 1,
+            )
+            .returning(*LEADERBOARD_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        self._publish(self._db.execute(stmt).all())
+
+    def add_transaction(self, tx: TransactionData) -> None:
+        self.add_transactions([tx])
+
+    def add_transactions(self, txs: Sequence[TransactionData]) -> None:
+        if not txs:
+            return
+        self._db.execute(
+            insert(TransactionHistory),
+            [
+                {
+                    "channel_name": tx.channel_name,
+                    "user_name": tx.user_name,
+                    "transaction_type": tx.transaction_type,
+                    "amount": tx.amount,
+                    "balance_before": tx.balance_before,
+                    "balance_after": tx.balance_after,
+                    "description": tx.description,
+                    "created_at": tx.created_at.replace(tzinfo=None),
+                }
+                for tx in txs
+            ],
+        )
+
+    def list_leaderboard_entries(self, channel_name: str) -> list[LeaderboardEntry]:
+        stmt = select(*LEADERBOARD_COLUMNS).where(UserBalance.channel_name == channel_name)
+        return [self._to_leaderboard_entry(row) for row in self._db.execute(stmt).all()]
@@ -0,0 +1,110 @@
+import threading
+from bisect import bisect_left, insort
+from collections.abc import Sequence
+from datetime import datetime
+from heapq import heapify, heappop, heappush
+
+from app.economy.domain.leaderboard import Leaderboard
+from app.economy.domain.models import BalanceBrief, LeaderboardEntry
+
+
+class ChannelRanking:
+    def __init__(self):
+        self.loaded = False
+        self._ranking: list[tuple[int, str]] = []
+        self._entries: dict[str, LeaderboardEntry] = {}
+        self._active_ranking: list[tuple[int, str]] = []
+        self._active_expiry: list[tuple[datetime, str]] = []
+        self._active_since: datetime | None = None
+
+    def upsert(self, entry: LeaderboardEntry) -> None:
+        current = self._entries.get(entry.user_name)
+        if current is not None:
+            if current.version >= entry.version:
+                return
+            del self._ranking[bisect_left(self._ranking, (current.balance, current.user_name))]
+            self._remove_active(current)
+        self._entries[entry.user_name] = entry
+        insort(self._ranking, (entry.balance, entry.user_name))
+        if self._is_active(entry):
+            insort(self._active_ranking, (entry.balance, entry.user_name))
+            if current is None or current.last_active_at != entry.last_active_at:
+                heappush(self._active_expiry, (entry.last_active_at, entry.user_name))
+
+    def top(self, limit: int) -> list[BalanceBrief]:
+        if limit <= 0:
+            return []
+        return [BalanceBrief(user_name=user_name, balance=balance) for balance, user_name in reversed(self._ranking[-limit:])]
+
+    def bottom(self, limit: int, active_since: datetime) -> list[BalanceBrief]:
+        if limit <= 0:
+            return []
+        if self._active_since is not None and active_since < self._active_since:
+            return self._scan_bottom(limit, active_since)
+        self._expire_active(active_since)
+        return [BalanceBrief(user_name=user_name, balance=balance) for balance, user_name in self._active_ranking[:limit]]
+
+    def _scan_bottom(self, limit: int, active_since: datetime) -> list[BalanceBrief]:
+        result = []
+        for balance, user_name in self._ranking:
+            if len(result) >= limit:
+                break
+            last_active_at = self._entries[user_name].last_active_at
+            if last_active_at is not None and last_active_at >= active_since:
+                result.append(BalanceBrief(user_name=user_name, balance=balance))
+        return result
+
+    def _is_active(self, entry: LeaderboardEntry) -> bool:
+        if entry.last_active_at is None:
+            return False
+        return self._active_since is None or entry.last_active_at >= self._active_since
+
+    def _remove_active(self, entry: LeaderboardEntry) -> None:
+        key = (entry.balance, entry.user_name)
+        index = bisect_left(self._active_ranking, key)
+        if index < len(self._active_ranking) and self._active_ranking[index] == key:
+            del self._active_ranking[index]
+
+    def _expire_active(self, active_since: datetime) -> None:
+        self._active_since = active_since
+        while self._active_expiry and self._active_expiry[0][0] < active_since:
+            last_active_at, user_name = heappop(self._active_expiry)
+            entry = self._entries[user_name]
+            if entry.last_active_at == last_active_at:
+                self._remove_active(entry)
+        if len(self._active_expiry) > 2 * len(self._active_ranking) + 64:
+            self._active_expiry = [(self._entries[user_name].last_active_at, user_name) for _, user_name in self._active_ranking]
+            heapify(self._active_expiry)
+
+
+class InMemoryLeaderboard(Leaderboard):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._channels: dict[str, ChannelRanking] = {}
+
+    def is_loaded(self, channel_name: str) -> bool:
+        with self._lock:
+            ranking = self._channels.get(channel_name)
+            return ranking is not None and ranking.loaded
+
+    def load(self, channel_name: str, entries: Sequence[LeaderboardEntry]) -> None:
+        with self._lock:
+            ranking = self._channels.setdefault(channel_name, ChannelRanking())
+            for entry in entries:
+                ranking.upsert(entry)
+            ranking.loaded = True
+
+    def apply(self, entries: Sequence[LeaderboardEntry]) -> None:
+        with self._lock:
+            for entry in entries:
+                self._channels.setdefault(entry.channel_name, ChannelRanking()).upsert(entry)
+
+    def top(self, channel_name: str, limit: int) -> list[BalanceBrief]:
+        with self._lock:
+            ranking = self._channels.get(channel_name)
+            return ranking.top(limit) if ranking else []
+
+    def bottom(self, channel_name: str, limit: int, active_since: datetime) -> list[BalanceBrief]:
+        with self._lock:
+            ranking = self._channels.get(channel_name)
+            return ranking.bottom(limit, active_since) if ranking else []
@@ -0,0 +1,55 @@
+from collections.abc import Iterator
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.common.domain.keyset import KeysetCursor, Page
+from app.common.infrastructure.keyset import keyset_before
+from app.economy.domain.models import TransactionRecord
+from app.economy.domain.repo import TransactionHistoryRepository
+from app.economy.infrastructure.db.transaction_history import TransactionHistory
+from app.stream.infrastructure.mappers.stream_mapper import normalize_datetime
+
+
+class TransactionHistoryRepositoryImpl(TransactionHistoryRepository):
+    _EXPORT_BATCH_SIZE = 1000
+
+    def __init__(self, db: Session):
+        self._db = db
+
+    def _to_domain(self, row: TransactionHistory) -> TransactionRecord:
+        return TransactionRecord(
+            id=row.id,
+            channel_name=row.channel_name,
+            user_name=row.user_name,
+            transaction_type=row.transaction_type,
+            amount=row.amount,
+            balance_before=row.balance_before,
+            balance_after=row.balance_after,
+            description=row.description,
+            created_at=normalize_datetime(row.created_at),
+        )
+
+    def _statement(self, channel_name: str, user_name: str | None):
+        stmt = (
+            select(TransactionHistory)
+            .where(TransactionHistory.channel_name == channel_name)
+            .order_by(TransactionHistory.created_at.desc(), TransactionHistory.id.desc())
+        )
+        if user_name is not None:
+            stmt = stmt.where(TransactionHistory.user_name == user_name)
+        return stmt
+
+    def list_transactions(
+        self, channel_name: str, user_name: str | None, cursor: KeysetCursor | None, limit: int
+    ) -> Page[TransactionRecord]:
+        stmt = self._statement(channel_name, user_name).limit(limit + 1)
+        if cursor is not None:
+            stmt = stmt.where(keyset_before(TransactionHistory.created_at, TransactionHistory.id, cursor))
+        rows = [self._to_domain(row) for row in self._db.execute(stmt).scalars().all()]
+        return Page.from_rows(rows, limit, lambda tx: KeysetCursor(at=tx.created_at, id=tx.id))
+
+    def iter_transactions(self, channel_name: str, user_name: str | None) -> Iterator[TransactionRecord]:
+        stmt = self._statement(channel_name, user_name).execution_options(yield_per=self._EXPORT_BATCH_SIZE)
+        for row in self._db.execute(stmt).scalars():
+            yield self._to_domain(row)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from sqlalchemy.orm import Session
+
+from app.common.infrastructure.sqlalchemy_uow import SqlAlchemyUnitOfWorkBase, SqlAlchemyUnitOfWorkFactory
+from app.core.common.session.session_scoped_factory import SessionScopedFactory
+from app.economy.application.uow.activity_ledger_uow import ActivityLedgerUnitOfWork, ActivityLedgerUnitOfWorkFactory
+from app.economy.domain.economy_policy import EconomyPolicy
+from core.types import SessionFactory
+
+
+class SqlAlchemyActivityLedgerUnitOfWork(SqlAlchemyUnitOfWorkBase, ActivityLedgerUnitOfWork):
+    def __init__(self, session: Session, economy_policy: EconomyPolicy, read_only: bool):
+        super().__init__(session=session, read_only=read_only)
+        self._economy_policy = economy_policy
+
+    @property
+    def economy_policy(self) -> EconomyPolicy:
+        return self._economy_policy
+
+
+class SqlAlchemyActivityLedgerUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[ActivityLedgerUnitOfWork], ActivityLedgerUnitOfWorkFactory):
+    def __init__(
+        self,
+        session_factory_rw: SessionFactory,
+        session_factory_ro: SessionFactory,
+        economy_policy_factory: SessionScopedFactory[EconomyPolicy],
+    ):
+        super().__init__(
+            session_factory_rw=session_factory_rw,
+            session_factory_ro=session_factory_ro,
+            builder=self._build_uow,
+        )
+        self._economy_policy_factory = economy_policy_factory
+
+    def _build_uow(self, db: Session, read_only: bool) -> ActivityLedgerUnitOfWork:
+        return SqlAlchemyActivityLedgerUnitOfWork(
+            session=db,
+            economy_policy=self._economy_policy_factory.get(db),
+            read_only=read_only,
+        )
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from app.bot.presentation.api.bot_twitch_routes import get_economy_container
+from app.core.network.api.export import ExportFormat, export_response
+from app.core.network.api.pagination import decode_cursor, encode_cursor
+from app.economy.di.container import EconomyContainer
+from app.economy.presentation.economy_schemas import TransactionResponse, TransactionsListResponse
+from core.db import db_replica_session
+
+router = APIRouter()
+
+
+@router.get("/{channel_name}/transactions", response_model=TransactionsListResponse, summary="История транзакций")
+async def get_transactions(
+    channel_name: str,
+    user_name: str | None = Query(None, description="Фильтр по пользователю"),
+    cursor: str | None = Query(None, description="Курсор следующей страницы из предыдущего ответа"),
+    limit: int = Query(100, ge=1, le=500, description="Количество записей в ответе"),
+    economy_container: EconomyContainer = Depends(get_economy_container),
+):
+    page_cursor = decode_cursor(cursor)
+    with db_replica_session() as session:
+        page = economy_container.transaction_history_use_case(session).get_transactions(channel_name, user_name, page_cursor, limit)
+    return TransactionsListResponse(
+        transactions=[TransactionResponse.model_validate(tx, from_attributes=True) for tx in page.items],
+        next_cursor=encode_cursor(page.next_cursor),
+    )
+
+
+@router.get("/{channel_name}/transactions/export", summary="Выгрузка истории транзакций (NDJSON/CSV)")
+def export_transactions(
+    channel_name: str,
+    user_name: str | None = Query(None, description="Фильтр по пользователю"),
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format", description="Формат выгрузки"),
+    economy_container: EconomyContainer = Depends(get_economy_container),
+) -> StreamingResponse:
+    def rows():
+        with db_replica_session() as session:
+            for tx in economy_container.transaction_history_use_case(session).iter_transactions(channel_name, user_name):
+                yield TransactionResponse.model_validate(tx, from_attributes=True)
+
+    return export_response(rows(), TransactionResponse, export_format, f"transactions_{channel_name}")
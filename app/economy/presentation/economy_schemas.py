@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from app.economy.domain.models import TransactionType
+
+
+class TransactionResponse(BaseModel):
+    id: int
+    channel_name: str
+    user_name: str
+    transaction_type: TransactionType
+    amount: int
+    balance_before: int
+    balance_after: int
+    description: str | None = None
+    created_at: datetime
+
+
+class TransactionsListResponse(BaseModel):
+    transactions: list[TransactionResponse]
+    next_cursor: str | None = Field(None, description="Курсор следующей страницы (null — страниц больше нет)")
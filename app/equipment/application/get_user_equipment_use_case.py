@@ -9,3 +9,7 @@ class GetUserEquipmentUseCase:
     def get_user_equipment(self, channel_name: str, user_name: str) -> list[UserEquipment]:
         with self._unit_of_work_factory.create(read_only=True) as uow:
             return uow.equipment_repo.list_user_equipment(channel_name, user_name)
+
+    def get_users_equipment(self, channel_name: str, user_names: list[str]) -> dict[str, list[UserEquipment]]:
+        with self._unit_of_work_factory.create(read_only=True) as uow:
+            return uow.equipment_repo.list_users_equipment(channel_name, user_names)
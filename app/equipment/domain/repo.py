@@ -8,6 +8,9 @@ class EquipmentRepository(ABC):
     @abstractmethod
     def list_user_equipment(self, channel_name: str, user_name: str) -> list[UserEquipment]: ...
 
+    @abstractmethod
+    def list_users_equipment(self, channel_name: str, user_names: list[str]) -> dict[str, list[UserEquipment]]: ...
+
     @abstractmethod
     def add_equipment(self, channel_name: str, user_name: str, shop_item_id: int, expires_at: datetime) -> None: ...
 
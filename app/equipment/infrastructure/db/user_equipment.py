@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.shop.infrastructure.db.model.shop_item import ShopItem
@@ -9,6 +9,7 @@ from core.db import Base
 
 class UserEquipment(Base):
     __tablename__ = "user_equipment"
+    __table_args__ = (Index("ix_user_equipment_channel_user_expires", "channel_name", "user_name", "expires_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, nullable=False)
     channel_name: Mapped[str] = mapped_column(String, nullable=False)
@@ -25,6 +25,21 @@ class EquipmentRepositoryImpl(EquipmentRepository):
         rows = self._db.execute(stmt).scalars().all()
         return [self._mapper.map_to_domain(item) for item in rows]
 
+    def list_users_equipment(self, channel_name: str, user_names: list[str]) -> dict[str, list[UserEquipment]]:
+        equipment: dict[str, list[UserEquipment]] = {user_name: [] for user_name in user_names}
+        if not user_names:
+            return equipment
+        now_naive = datetime.now(UTC).replace(tzinfo=None)
+        stmt = (
+            select(OrmUserEquipment)
+            .where(OrmUserEquipment.channel_name == channel_name)
+            .where(OrmUserEquipment.user_name.in_(user_names))
+            .where(OrmUserEquipment.expires_at > now_naive)
+        )
+        for row in self._db.execute(stmt).scalars().all():
+            equipment[row.user_name].append(self._mapper.map_to_domain(row))
+        return equipment
+
     def add_equipment(self, channel_name: str, user_name: str, shop_item_id: int, expires_at: datetime) -> None:
         expires_at_naive = expires_at.replace(tzinfo=None)
         orm = OrmUserEquipment(
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class ExportResult:
+    path: Path
+    rows: int
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from app.export.application.model.export_result import ExportResult
+from app.export.domain.model.export_request import ExportRequest
+
+
+class ExportRunnerPort(ABC):
+    @abstractmethod
+    async def run(self, request: ExportRequest) -> ExportResult: ...
+
+    @abstractmethod
+    async def shutdown(self) -> None: ...
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+from app.export.domain.model.export_column import ExportColumn
+
+
+class ExportWriterPort(ABC):
+    @abstractmethod
+    def write(self, target: Path, columns: Sequence[ExportColumn], batches: Iterable[Sequence[tuple]]) -> int: ...
@@ -0,0 +1,31 @@
+from collections.abc import Mapping
+from pathlib import Path
+
+from app.core.common.session.session_scoped_factory import SessionScopedFactory
+from app.export.application.model.export_result import ExportResult
+from app.export.application.port.export_writer_port import ExportWriterPort
+from app.export.domain.model.export_request import ExportFileFormat, ExportRequest
+from app.export.domain.repo import ExportRepository
+from core.types import SessionFactory
+
+
+class ExportDatasetUseCase:
+    _BATCH_SIZE: int = 10_000
+
+    def __init__(
+        self,
+        session_factory_ro: SessionFactory,
+        export_repository_factory: SessionScopedFactory[ExportRepository],
+        writers: Mapping[ExportFileFormat, ExportWriterPort],
+    ):
+        self._session_ro = session_factory_ro
+        self._export_repository_factory = export_repository_factory
+        self._writers = writers
+
+    def handle(self, request: ExportRequest, target: Path) -> ExportResult:
+        writer = self._writers[request.file_format]
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with self._session_ro() as session:
+            repository = self._export_repository_factory.get(session)
+            rows = writer.write(target, repository.columns(request.dataset), repository.iter_batches(request, self._BATCH_SIZE))
+        return ExportResult(path=target, rows=rows)
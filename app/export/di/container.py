@@ -0,0 +1,47 @@
+import tempfile
+from pathlib import Path
+
+from sqlalchemy.orm import Session
+
+from app.core.common.session.session_scoped_factory import SessionScopedFactory
+from app.core.config.domain.model.db import DatabaseConfig
+from app.export.application.port.export_runner_port import ExportRunnerPort
+from app.export.application.usecase.export_dataset_use_case import ExportDatasetUseCase
+from app.export.domain.model.export_request import ExportFileFormat
+from app.export.domain.repo import ExportRepository
+from app.export.infrastructure.export_repository import ExportRepositoryImpl
+from app.export.infrastructure.process_pool_export_runner import ProcessPoolExportRunner
+from app.export.infrastructure.writer.parquet_export_writer import ParquetExportWriter
+from app.export.infrastructure.writer.xlsx_export_writer import XlsxExportWriter
+from core.db import db_replica_session
+
+EXPORT_DIR = Path(tempfile.gettempdir()) / "gladdi_exports"
+EXPORT_WORKERS = 1
+
+
+def export_repository(session: Session) -> ExportRepository:
+    return ExportRepositoryImpl(session)
+
+
+def export_dataset_use_case() -> ExportDatasetUseCase:
+    return ExportDatasetUseCase(
+        session_factory_ro=db_replica_session,
+        export_repository_factory=SessionScopedFactory(export_repository),
+        writers={
+            ExportFileFormat.PARQUET: ParquetExportWriter(),
+            ExportFileFormat.XLSX: XlsxExportWriter(),
+        },
+    )
+
+
+class ExportContainer:
+    def __init__(self, db_config: DatabaseConfig):
+        self.export_runner: ExportRunnerPort = ProcessPoolExportRunner(
+            db_config=db_config,
+            use_case_factory=export_dataset_use_case,
+            export_dir=EXPORT_DIR,
+            max_workers=EXPORT_WORKERS,
+        )
+
+    def export_dataset_use_case(self) -> ExportDatasetUseCase:
+        return export_dataset_use_case()
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class ExportColumnType(StrEnum):
+    INTEGER = "integer"
+    STRING = "string"
+    DATETIME = "datetime"
+    BOOLEAN = "boolean"
+
+
+@dataclass(frozen=True)
+class ExportColumn:
+    name: str
+    type: ExportColumnType
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+
+
+class ExportDataset(StrEnum):
+    CHAT_MESSAGES = "chat_messages"
+    TRANSACTIONS = "transactions"
+    VIEWER_SESSIONS = "viewer_sessions"
+
+
+class ExportFileFormat(StrEnum):
+    PARQUET = "parquet"
+    XLSX = "xlsx"
+
+
+@dataclass(frozen=True)
+class ExportRequest:
+    dataset: ExportDataset
+    file_format: ExportFileFormat
+    channel_name: str
+    date_from: datetime | None = None
+    date_to: datetime | None = None
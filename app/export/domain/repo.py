@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+
+from app.export.domain.model.export_column import ExportColumn
+from app.export.domain.model.export_request import ExportDataset, ExportRequest
+
+
+class ExportRepository(ABC):
+    @abstractmethod
+    def columns(self, dataset: ExportDataset) -> list[ExportColumn]: ...
+
+    @abstractmethod
+    def iter_batches(self, request: ExportRequest, batch_size: int) -> Iterator[Sequence[tuple]]: ...
@@ -0,0 +1,84 @@
+from collections.abc import Iterator, Sequence
+
+from sqlalchemy import Boolean, DateTime, Integer, String, cast, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.chat.infrastructure.db.chat_message import ChatMessage
+from app.economy.infrastructure.db.transaction_history import TransactionHistory
+from app.export.domain.model.export_column import ExportColumn, ExportColumnType
+from app.export.domain.model.export_request import ExportDataset, ExportRequest
+from app.export.domain.repo import ExportRepository
+from app.viewer.session.infrastructure.db.model.viewer_session import StreamViewerSession
+from core.db import disable_statement_timeout
+
+_DATASET_COLUMNS: dict[ExportDataset, tuple[ColumnElement, ...]] = {
+    ExportDataset.CHAT_MESSAGES: (
+        ChatMessage.id,
+        ChatMessage.user_name,
+        ChatMessage.content,
+        ChatMessage.created_at,
+    ),
+    ExportDataset.TRANSACTIONS: (
+        TransactionHistory.id,
+        TransactionHistory.user_name,
+        cast(TransactionHistory.transaction_type, String).label("transaction_type"),
+        TransactionHistory.amount,
+        TransactionHistory.balance_before,
+        TransactionHistory.balance_after,
+        TransactionHistory.description,
+        TransactionHistory.created_at,
+    ),
+    ExportDataset.VIEWER_SESSIONS: (
+        StreamViewerSession.id,
+        StreamViewerSession.stream_id,
+        StreamViewerSession.user_name,
+        StreamViewerSession.session_start,
+        StreamViewerSession.session_end,
+        StreamViewerSession.total_minutes,
+        StreamViewerSession.last_activity,
+        StreamViewerSession.is_watching,
+        StreamViewerSession.rewards_claimed,
+        StreamViewerSession.created_at,
+    ),
+}
+
+_DATASET_KEYS = {
+    ExportDataset.CHAT_MESSAGES: (ChatMessage.channel_name, ChatMessage.created_at, ChatMessage.id),
+    ExportDataset.TRANSACTIONS: (TransactionHistory.channel_name, TransactionHistory.created_at, TransactionHistory.id),
+    ExportDataset.VIEWER_SESSIONS: (StreamViewerSession.channel_name, StreamViewerSession.session_start, StreamViewerSession.id),
+}
+
+
+def _column_type(column: ColumnElement) -> ExportColumnType:
+    if isinstance(column.type, Boolean):
+        return ExportColumnType.BOOLEAN
+    if isinstance(column.type, Integer):
+        return ExportColumnType.INTEGER
+    if isinstance(column.type, DateTime):
+        return ExportColumnType.DATETIME
+    return ExportColumnType.STRING
+
+
+class ExportRepositoryImpl(ExportRepository):
+    def __init__(self, db: Session):
+        self._db = db
+
+    def columns(self, dataset: ExportDataset) -> list[ExportColumn]:
+        return [ExportColumn(name=column.key, type=_column_type(column)) for column in _DATASET_COLUMNS[dataset]]
+
+    def iter_batches(self, request: ExportRequest, batch_size: int) -> Iterator[Sequence[tuple]]:
+        channel_column, time_column, id_column = _DATASET_KEYS[request.dataset]
+        stmt = (
+            select(*_DATASET_COLUMNS[request.dataset])
+            .where(channel_column == request.channel_name)
+            .order_by(time_column, id_column)
+            .execution_options(yield_per=batch_size)
+        )
+        if request.date_from is not None:
+            stmt = stmt.where(time_column >= request.date_from.replace(tzinfo=None))
+        if request.date_to is not None:
+            stmt = stmt.where(time_column < request.date_to.replace(tzinfo=None))
+        disable_statement_timeout(self._db)
+        for partition in self._db.execute(stmt).partitions():
+            yield [tuple(row) for row in partition]
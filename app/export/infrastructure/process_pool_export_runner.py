@@ -0,0 +1,62 @@
+import asyncio
+import multiprocessing
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from app.core.config.domain.model.db import DatabaseConfig
+from app.export.application.model.export_result import ExportResult
+from app.export.application.port.export_runner_port import ExportRunnerPort
+from app.export.application.usecase.export_dataset_use_case import ExportDatasetUseCase
+from app.export.domain.model.export_request import ExportRequest
+from core.db import init_db, refresh_replica_state
+
+_worker_use_case: ExportDatasetUseCase | None = None
+
+
+def _init_worker(db_config: DatabaseConfig, use_case_factory: Callable[[], ExportDatasetUseCase]) -> None:
+    global _worker_use_case
+    init_db(db_config)
+    _worker_use_case = use_case_factory()
+
+
+def _run_export(request: ExportRequest, target: Path) -> ExportResult:
+    refresh_replica_state()
+    return _worker_use_case.handle(request, target)
+
+
+class ProcessPoolExportRunner(ExportRunnerPort):
+    def __init__(
+        self,
+        db_config: DatabaseConfig,
+        use_case_factory: Callable[[], ExportDatasetUseCase],
+        export_dir: Path,
+        max_workers: int,
+    ):
+        self._db_config = db_config
+        self._use_case_factory = use_case_factory
+        self._export_dir = export_dir
+        self._max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    async def run(self, request: ExportRequest) -> ExportResult:
+        target = self._export_dir / f"{request.dataset.value}_{request.channel_name}_{uuid.uuid4().hex}.{request.file_format.value}"
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), _run_export, request, target)
+
+    async def shutdown(self) -> None:
+        if self._executor is None:
+            return
+        executor, self._executor = self._executor, None
+        await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._db_config, self._use_case_factory),
+            )
+        return self._executor
@@ -0,0 +1,30 @@
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.export.application.port.export_writer_port import ExportWriterPort
+from app.export.domain.model.export_column import ExportColumn, ExportColumnType
+from app.export.infrastructure.writer.pending_file import pending_file
+
+_ARROW_TYPES = {
+    ExportColumnType.INTEGER: pa.int64(),
+    ExportColumnType.STRING: pa.string(),
+    ExportColumnType.DATETIME: pa.timestamp("us"),
+    ExportColumnType.BOOLEAN: pa.bool_(),
+}
+
+
+class ParquetExportWriter(ExportWriterPort):
+    def write(self, target: Path, columns: Sequence[ExportColumn], batches: Iterable[Sequence[tuple]]) -> int:
+        schema = pa.schema([pa.field(column.name, _ARROW_TYPES[column.type]) for column in columns])
+        rows = 0
+        with pending_file(target) as pending, pq.ParquetWriter(pending, schema, compression="zstd") as writer:
+            for batch in batches:
+                if not batch:
+                    continue
+                arrays = [pa.array(values, type=field.type) for values, field in zip(zip(*batch), schema, strict=True)]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+                rows += len(batch)
+        return rows
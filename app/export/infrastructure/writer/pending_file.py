@@ -0,0 +1,14 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def pending_file(target: Path) -> Iterator[Path]:
+    pending = target.with_name(f"{target.name}.part")
+    try:
+        yield pending
+    except BaseException:
+        pending.unlink(missing_ok=True)
+        raise
+    pending.replace(target)
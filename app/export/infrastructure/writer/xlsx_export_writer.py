@@ -0,0 +1,34 @@
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+from openpyxl import Workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+from app.export.application.port.export_writer_port import ExportWriterPort
+from app.export.domain.model.export_column import ExportColumn
+from app.export.infrastructure.writer.pending_file import pending_file
+
+
+class XlsxExportWriter(ExportWriterPort):
+    _MAX_SHEET_ROWS: int = 1_048_576
+    _SHEET_TITLE: str = "data"
+
+    def write(self, target: Path, columns: Sequence[ExportColumn], batches: Iterable[Sequence[tuple]]) -> int:
+        header = [column.name for column in columns]
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(self._SHEET_TITLE)
+        sheet.append(header)
+        sheet_rows = 1
+        rows = 0
+        for batch in batches:
+            for row in batch:
+                if sheet_rows >= self._MAX_SHEET_ROWS:
+                    sheet = workbook.create_sheet(f"{self._SHEET_TITLE}_{len(workbook.worksheets) + 1}")
+                    sheet.append(header)
+                    sheet_rows = 1
+                sheet.append([ILLEGAL_CHARACTERS_RE.sub("", value) if isinstance(value, str) else value for value in row])
+                sheet_rows += 1
+            rows += len(batch)
+        with pending_file(target) as pending:
+            workbook.save(pending)
+        return rows
@@ -0,0 +1,39 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import FileResponse
+from starlette.background import BackgroundTask
+
+from app.export.di.container import ExportContainer
+from app.export.domain.model.export_request import ExportDataset, ExportFileFormat, ExportRequest
+
+router = APIRouter()
+
+_MEDIA_TYPES = {
+    ExportFileFormat.PARQUET: "application/vnd.apache.parquet",
+    ExportFileFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def get_export_container(request: Request) -> ExportContainer:
+    return request.app.state.export_container
+
+
+@router.get("/{channel_name}/{dataset}", summary="Выгрузка аналитики в Parquet/XLSX")
+async def export_dataset(
+    channel_name: str,
+    dataset: ExportDataset,
+    file_format: ExportFileFormat = Query(ExportFileFormat.PARQUET, alias="format", description="Формат файла"),
+    date_from: datetime | None = Query(None, description="Начало периода (включительно)"),
+    date_to: datetime | None = Query(None, description="Конец периода (не включительно)"),
+    export_container: ExportContainer = Depends(get_export_container),
+) -> FileResponse:
+    request = ExportRequest(dataset=dataset, file_format=file_format, channel_name=channel_name, date_from=date_from, date_to=date_to)
+    result = await export_container.export_runner.run(request)
+    return FileResponse(
+        result.path,
+        media_type=_MEDIA_TYPES[file_format],
+        filename=f"{dataset.value}_{channel_name}.{file_format.value}",
+        headers={"X-Export-Rows": str(result.rows)},
+        background=BackgroundTask(result.path.unlink, missing_ok=True),
+    )
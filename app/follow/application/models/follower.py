@@ -8,3 +8,10 @@ class ChannelFollowerDTO:
     user_name: str
     display_name: str
     followed_at: datetime
+
+
+@dataclass(frozen=True)
+class FollowersSyncResult:
+    synced: int
+    unfollowed: int
+    complete: bool
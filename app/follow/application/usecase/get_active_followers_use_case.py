@@ -1,3 +1,6 @@
+from collections.abc import Iterator
+
+from app.common.domain.keyset import KeysetCursor, Page
 from app.follow.domain.models import ChannelFollower
 from app.follow.domain.repo import FollowersRepository
 
@@ -6,5 +9,8 @@ class GetActiveFollowersUseCase:
     def __init__(self, followers_repository: FollowersRepository):
         self.followers_repository = followers_repository
 
-    def handle(self, channel_name: str) -> list[ChannelFollower]:
-        return self.followers_repository.list_active(channel_name)
+    def handle(self, channel_name: str, cursor: KeysetCursor | None, limit: int) -> Page[ChannelFollower]:
+        return self.followers_repository.list_active(channel_name, cursor, limit)
+
+    def iterate(self, channel_name: str) -> Iterator[ChannelFollower]:
+        return self.followers_repository.iter_active(channel_name)
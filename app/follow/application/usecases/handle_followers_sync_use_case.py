@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from app.follow.application.models.follower import ChannelFollowerDTO, FollowersSyncResult
 from app.follow.application.uow.followers_sync_uow import FollowersSyncUnitOfWorkFactory
 from app.platform.domain.repository import PlatformRepository
 
@@ -9,29 +10,23 @@ class HandleFollowersSyncUseCase:
         self._platform_repository = platform_repository
         self._sync_followers_uow = sync_followers_uow
 
-    async def handle(self, channel_name: str, seen_at: datetime):
-        followers = await self._platform_repository.get_channel_followers(channel_name)
+    async def handle(self, channel_name: str, seen_at: datetime, full: bool = True) -> FollowersSyncResult:
+        synced = 0
+        async for page in self._platform_repository.iter_channel_followers(channel_name):
+            with self._sync_followers_uow.create() as uow:
+                known = {} if full else uow.followers_repo.get_active_followed_at(channel_name, [f.user_id for f in page])
+                uow.followers_repo.upsert_active_batch(channel_name, page, seen_at)
+            synced += len(page)
+            if self._all_known(known, page):
+                return FollowersSyncResult(synced=synced, unfollowed=0, complete=False)
 
-        with self._sync_followers_uow.create() as uow:
-            existing = uow.followers_repo.list_by_channel(channel_name)
-            existing_map = {f.user_id: f for f in existing}
-
-            for follower in followers:
-                uow.followers_repo.upsert_active(
-                    channel_name=channel_name,
-                    user_id=follower.user_id,
-                    user_name=follower.user_name,
-                    display_name=follower.display_name,
-                    followed_at=follower.followed_at,
-                    seen_at=seen_at,
-                )
+        if not full:
+            return FollowersSyncResult(synced=synced, unfollowed=0, complete=True)
 
-            current_ids = {f.user_id for f in followers}
-            unfollowed_ids = [f.user_id for f in existing_map.values() if f.is_active and f.user_id not in current_ids]
+        with self._sync_followers_uow.create() as uow:
+            unfollowed = uow.followers_repo.mark_unfollowed_not_seen_since(channel_name, seen_at)
+        return FollowersSyncResult(synced=synced, unfollowed=unfollowed, complete=True)
 
-            if unfollowed_ids:
-                uow.followers_repo.mark_unfollowed(
-                    channel_name=channel_name,
-                    user_ids=unfollowed_ids,
-                    unfollowed_at=seen_at,
-                )
+    @staticmethod
+    def _all_known(known: dict[str, datetime | None], page: list[ChannelFollowerDTO]) -> bool:
+        return bool(page) and all(follower.user_id in known and known[follower.user_id] == follower.followed_at for follower in page)
@@ -1,18 +1,21 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 
+from app.common.domain.keyset import KeysetCursor, Page
+from app.follow.application.models.follower import ChannelFollowerDTO
 from app.follow.domain.models import ChannelFollower
 
 
 class FollowersRepository(ABC):
     @abstractmethod
-    def list_by_channel(self, channel_name: str) -> list[ChannelFollower]: ...
+    def list_active(self, channel_name: str, cursor: KeysetCursor | None, limit: int) -> Page[ChannelFollower]: ...
 
     @abstractmethod
-    def list_active(self, channel_name: str) -> list[ChannelFollower]: ...
+    def iter_active(self, channel_name: str) -> Iterator[ChannelFollower]: ...
 
     @abstractmethod
-    def list_unfollowed_since(self, channel_name: str) -> list[ChannelFollower]: ...
+    def list_unfollowed_since(self, channel_name: str, cursor: KeysetCursor | None, limit: int) -> Page[ChannelFollower]: ...
 
     @abstractmethod
     def get_by_user_name(self, channel_name: str, user_name: str) -> ChannelFollower | None: ...
@@ -29,4 +32,10 @@ class FollowersRepository(ABC):
     ): ...
 
     @abstractmethod
-    def mark_unfollowed(self, channel_name: str, user_ids: list[str], unfollowed_at: datetime) -> None: ...
+    def get_active_followed_at(self, channel_name: str, user_ids: Sequence[str]) -> dict[str, datetime | None]: ...
+
+    @abstractmethod
+    def upsert_active_batch(self, channel_name: str, followers: Sequence[ChannelFollowerDTO], seen_at: datetime) -> None: ...
+
+    @abstractmethod
+    def mark_unfollowed_not_seen_since(self, channel_name: str, seen_at: datetime) -> int: ...
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.db import Base
@@ -8,7 +8,12 @@ from core.db import Base
 
 class ChannelFollowerRow(Base):
     __tablename__ = "channel_follower"
-    __table_args__ = (UniqueConstraint("channel_name", "user_id", name="uq_channel_follower_user"),)
+    __table_args__ = (
+        UniqueConstraint("channel_name", "user_id", name="uq_channel_follower_user"),
+        Index("ix_channel_follower_channel_user_name", "channel_name", "user_name"),
+        Index("ix_channel_follower_active_followed", "channel_name", "followed_at", postgresql_where=text("is_active")),
+        Index("ix_channel_follower_unfollowed", "channel_name", "unfollowed_at", postgresql_where=text("NOT is_active")),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, nullable=False)
     channel_name: Mapped[str] = mapped_column(String, nullable=False)
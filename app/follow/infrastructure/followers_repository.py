@@ -1,8 +1,13 @@
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 
 from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
+from app.common.domain.keyset import KeysetCursor, Page
+from app.common.infrastructure.keyset import keyset_before
+from app.follow.application.models.follower import ChannelFollowerDTO
 from app.follow.domain.models import ChannelFollower
 from app.follow.domain.repo import FollowersRepository
 from app.follow.infrastructure.db.follower import ChannelFollowerRow
@@ -10,6 +15,8 @@ from app.stream.infrastructure.mappers.stream_mapper import normalize_datetime
 
 
 class FollowersRepositoryImpl(FollowersRepository):
+    _EXPORT_BATCH_SIZE = 1000
+
     def __init__(self, db: Session):
         self._db = db
 
@@ -29,36 +36,46 @@ class FollowersRepositoryImpl(FollowersRepository):
             updated_at=normalize_datetime(row.updated_at),
         )
 
-    def list_by_channel(self, channel_name: str) -> list[ChannelFollower]:
-        stmt = select(ChannelFollowerRow).where(ChannelFollowerRow.channel_name == channel_name)
-        rows = self._db.execute(stmt).scalars().all()
-        return [self._to_domain(row) for row in rows]
-
-    def list_active(self, channel_name: str) -> list[ChannelFollower]:
-        stmt = (
+    def _active_statement(self, channel_name: str):
+        return (
             select(ChannelFollowerRow)
             .where(ChannelFollowerRow.channel_name == channel_name)
-            .where(ChannelFollowerRow.is_active.is_(True))
-            .order_by(ChannelFollowerRow.followed_at.desc())
+            .where(ChannelFollowerRow.is_active)
+            .order_by(ChannelFollowerRow.followed_at.desc(), ChannelFollowerRow.id.desc())
         )
-        rows = self._db.execute(stmt).scalars().all()
-        return [self._to_domain(row) for row in rows]
 
-    def list_unfollowed_since(self, channel_name: str) -> list[ChannelFollower]:
+    def list_active(self, channel_name: str, cursor: KeysetCursor | None, limit: int) -> Page[ChannelFollower]:
+        stmt = self._active_statement(channel_name).limit(limit + 1)
+        if cursor is not None:
+            stmt = stmt.where(keyset_before(ChannelFollowerRow.followed_at, ChannelFollowerRow.id, cursor, nulls_first=True))
+        rows = [self._to_domain(row) for row in self._db.execute(stmt).scalars().all()]
+        return Page.from_rows(rows, limit, lambda follower: KeysetCursor(at=follower.followed_at, id=follower.id))
+
+    def iter_active(self, channel_name: str) -> Iterator[ChannelFollower]:
+        stmt = self._active_statement(channel_name).execution_options(yield_per=self._EXPORT_BATCH_SIZE)
+        for row in self._db.execute(stmt).scalars():
+            yield self._to_domain(row)
+
+    def list_unfollowed_since(self, channel_name: str, cursor: KeysetCursor | None, limit: int) -> Page[ChannelFollower]:
         stmt = (
             select(ChannelFollowerRow)
             .where(ChannelFollowerRow.channel_name == channel_name)
-            .where(ChannelFollowerRow.is_active.is_(False))
+            .where(~ChannelFollowerRow.is_active)
             .where(ChannelFollowerRow.unfollowed_at.is_not(None))
+            .order_by(ChannelFollowerRow.unfollowed_at.desc(), ChannelFollowerRow.id.desc())
+            .limit(limit + 1)
         )
-        rows = self._db.execute(stmt).scalars().all()
-        return [self._to_domain(row) for row in rows]
+        if cursor is not None:
+            stmt = stmt.where(keyset_before(ChannelFollowerRow.unfollowed_at, ChannelFollowerRow.id, cursor))
+        rows = [self._to_domain(row) for row in self._db.execute(stmt).scalars().all()]
+        return Page.from_rows(rows, limit, lambda follower: KeysetCursor(at=follower.unfollowed_at, id=follower.id))
 
     def get_by_user_name(self, channel_name: str, user_name: str) -> ChannelFollower | None:
         stmt = (
             select(ChannelFollowerRow)
             .where(ChannelFollowerRow.channel_name == channel_name)
             .where(ChannelFollowerRow.user_name == user_name)
+            .order_by(ChannelFollowerRow.is_active.desc(), ChannelFollowerRow.last_seen_at.desc())
         )
         row = self._db.execute(stmt).scalars().first()
         return None if not row else self._to_domain(row)
@@ -98,19 +115,66 @@ class FollowersRepositoryImpl(FollowersRepository):
             )
             self._db.add(row)
 
-    def mark_unfollowed(self, channel_name: str, user_ids: list[str], unfollowed_at: datetime):
-        unfollowed_at_naive = unfollowed_at.replace(tzinfo=None)
+    def get_active_followed_at(self, channel_name: str, user_ids: Sequence[str]) -> dict[str, datetime | None]:
         if not user_ids:
+            return {}
+        stmt = (
+            select(ChannelFollowerRow.user_id, ChannelFollowerRow.followed_at)
+            .where(ChannelFollowerRow.channel_name == channel_name)
+            .where(ChannelFollowerRow.user_id.in_(user_ids))
+            .where(ChannelFollowerRow.is_active)
+        )
+        return {user_id: normalize_datetime(followed_at) for user_id, followed_at in self._db.execute(stmt)}
+
+    def upsert_active_batch(self, channel_name: str, followers: Sequence[ChannelFollowerDTO], seen_at: datetime) -> None:
+        if not followers:
             return
+        seen_at_naive = seen_at.replace(tzinfo=None)
+        unique = {follower.user_id: follower for follower in followers}
+        stmt = insert(ChannelFollowerRow).values(
+            [
+                {
+                    "channel_name": channel_name,
+                    "user_id": follower.user_id,
+                    "user_name": follower.user_name,
+                    "display_name": follower.display_name,
+                    "followed_at": follower.followed_at.replace(tzinfo=None) if follower.followed_at else None,
+                    "first_seen_at": seen_at_naive,
+                    "last_seen_at": seen_at_naive,
+                    "unfollowed_at": None,
+                    "is_active": True,
+                    "created_at": seen_at_naive,
+                    "updated_at": seen_at_naive,
+                }
+                for follower in unique.values()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_channel_follower_user",
+            set_={
+                "user_name": stmt.excluded.user_name,
+                "display_name": stmt.excluded.display_name,
+                "followed_at": stmt.excluded.followed_at,
+                "last_seen_at": stmt.excluded.last_seen_at,
+                "unfollowed_at": None,
+                "is_active": True,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        self._db.execute(stmt)
+
+    def mark_unfollowed_not_seen_since(self, channel_name: str, seen_at: datetime) -> int:
+        seen_at_naive = seen_at.replace(tzinfo=None)
         stmt = (
             update(ChannelFollowerRow)
             .where(ChannelFollowerRow.channel_name == channel_name)
-            .where(ChannelFollowerRow.user_id.in_(user_ids))
+            .where(ChannelFollowerRow.is_active)
+            .where(ChannelFollowerRow.last_seen_at < seen_at_naive)
             .values(
                 is_active=False,
-                unfollowed_at=unfollowed_at_naive,
-                last_seen_at=unfollowed_at_naive,
-                updated_at=unfollowed_at_naive,
+                unfollowed_at=seen_at_naive,
+                last_seen_at=seen_at_naive,
+                updated_at=seen_at_naive,
             )
         )
-        self._db.execute(stmt)
+        return self._db.execute(stmt).rowcount
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from datetime import UTC, datetime
 
 from app.core.logger.domain.logger import Logger
@@ -7,7 +8,8 @@ from app.task.domain.job import BackgroundJob
 
 
 class FollowersSyncJob(BackgroundJob):
-    SYNC_FOLLOWERS_INTERVAL_SECONDS = 24 * 60 * 60
+    SYNC_FOLLOWERS_INTERVAL_SECONDS = 60 * 60
+    FULL_SYNC_INTERVAL_SECONDS = 24 * 60 * 60
     name = "sync_followers"
 
     def __init__(self, handle_followers_sync_use_case: HandleFollowersSyncUseCase, logger: Logger):
@@ -15,6 +17,7 @@ class FollowersSyncJob(BackgroundJob):
         self._bot_name: str | None = None
         self._handle_followers_sync_use_case = handle_followers_sync_use_case
         self._logger = logger.create_child(__name__)
+        self._last_full_sync_at: float | None = None
 
     def apply_channel(self, channel_name: str, bot_name: str):
         self._channel_name = channel_name
@@ -23,7 +26,14 @@ class FollowersSyncJob(BackgroundJob):
     async def run(self):
         while True:
             try:
-                await self._handle_followers_sync_use_case.handle(self._channel_name, datetime.now(UTC))
+                full = self._last_full_sync_at is None or time.monotonic() - self._last_full_sync_at >= self.FULL_SYNC_INTERVAL_SECONDS
+                result = await self._handle_followers_sync_use_case.handle(self._channel_name, datetime.now(UTC), full=full)
+                if full:
+                    self._last_full_sync_at = time.monotonic()
+                self._logger.log_info(
+                    f"Синхронизация фолловеров ({'полная' if full else 'инкрементальная'}): "
+                    f"обновлено {result.synced}, отписалось {result.unfollowed}"
+                )
             except asyncio.CancelledError:
                 self._logger.log_info("FollowersSyncJob cancelled")
                 break
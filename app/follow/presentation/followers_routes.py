@@ -1,31 +1,63 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from app.bot.presentation.api.bot_twitch_routes import get_follow_container
+from app.core.network.api.export import ExportFormat, export_response
+from app.core.network.api.pagination import decode_cursor, encode_cursor
 from app.follow.di.container import FollowContainer
 from app.follow.presentation.followers_schemas import (
     FollowerResponse,
     FollowersListResponse,
 )
-from core.db import db_ro_session
+from core.db import db_replica_session
 
 router = APIRouter()
 
 
 @router.get("", response_model=FollowersListResponse, summary="Текущие подписчики (активные)")
-async def get_active_followers(channel_name: str, follow_container: FollowContainer = Depends(get_follow_container)):
-    with db_ro_session() as session:
+async def get_active_followers(
+    channel_name: str,
+    cursor: str | None = Query(None, description="Курсор следующей страницы из предыдущего ответа"),
+    limit: int = Query(100, ge=1, le=500, description="Количество записей в ответе"),
+    follow_container: FollowContainer = Depends(get_follow_container),
+):
+    page_cursor = decode_cursor(cursor)
+    with db_replica_session() as session:
         active_followers_use_case = follow_container.get_active_followers_use_case(session)
-        followers = active_followers_use_case.handle(channel_name)
+        page = active_followers_use_case.handle(channel_name, page_cursor, limit)
+
+    return FollowersListResponse(
+        followers=[FollowerResponse.model_validate(f, from_attributes=True) for f in page.items],
+        next_cursor=encode_cursor(page.next_cursor),
+    )
+
+
+@router.get("/export", summary="Выгрузка активных подписчиков (NDJSON/CSV)")
+def export_active_followers(
+    channel_name: str,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format", description="Формат выгрузки"),
+    follow_container: FollowContainer = Depends(get_follow_container),
+) -> StreamingResponse:
+    def rows():
+        with db_replica_session() as session:
+            for follower in follow_container.get_active_followers_use_case(session).iterate(channel_name):
+                yield FollowerResponse.model_validate(follower, from_attributes=True)
 
-    return FollowersListResponse(followers=[FollowerResponse.model_validate(f, from_attributes=True) for f in followers])
+    return export_response(rows(), FollowerResponse, export_format, f"followers_{channel_name}")
 
 
 @router.get("/unfollowed", response_model=FollowersListResponse, summary="Отписавшиеся с даты")
 async def get_unfollowed_followers(
     channel_name: str,
+    cursor: str | None = Query(None, description="Курсор следующей страницы из предыдущего ответа"),
+    limit: int = Query(100, ge=1, le=500, description="Количество записей в ответе"),
     follow_container: FollowContainer = Depends(get_follow_container),
 ):
-    with db_ro_session() as session:
+    page_cursor = decode_cursor(cursor)
+    with db_replica_session() as session:
         unfollowed_use_case = follow_container.get_unfollowed_use_case(session)
-        followers = unfollowed_use_case.handle(channel_name)
-    return FollowersListResponse(followers=[FollowerResponse.model_validate(f, from_attributes=True) for f in followers])
+        page = unfollowed_use_case.handle(channel_name, page_cursor, limit)
+    return FollowersListResponse(
+        followers=[FollowerResponse.model_validate(f, from_attributes=True) for f in page.items],
+        next_cursor=encode_cursor(page.next_cursor),
+    )
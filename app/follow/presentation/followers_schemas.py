@@ -50,3 +50,4 @@ class FollowerDetailResponse(FollowerResponse):
 
 class FollowersListResponse(BaseModel):
     followers: list[FollowerResponse]
+    next_cursor: str | None = Field(None, description="Курсор следующей страницы (null — страниц больше нет)")
@@ -0,0 +1,13 @@
+from sqlalchemy.orm import Session
+
+from app.core.common.session.session_scoped_factory import SessionScopedFactory
+from app.game_stats.domain.repo import GameStatsRepository
+from app.game_stats.infrastructure.game_stats_repository import GameStatsRepositoryImpl
+
+
+class GameStatsContainer:
+    def __init__(self):
+        self.game_stats_repository_factory: SessionScopedFactory[GameStatsRepository] = SessionScopedFactory(self.game_stats_repository)
+
+    def game_stats_repository(self, session: Session) -> GameStatsRepository:
+        return GameStatsRepositoryImpl(session)
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class UserGameStats:
+    channel_name: str
+    user_name: str
+    total_bets: int = 0
+    jackpots: int = 0
+    total_battles: int = 0
+    battle_wins: int = 0
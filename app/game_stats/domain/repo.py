@@ -0,0 +1,12 @@
+from collections.abc import Sequence
+from typing import Protocol
+
+from app.game_stats.domain.model.user_game_stats import UserGameStats
+
+
+class GameStatsRepository(Protocol):
+    def record_bet(self, channel_name: str, user_name: str, jackpot: bool) -> None: ...
+
+    def record_battle(self, channel_name: str, winner: str, loser: str) -> None: ...
+
+    def get_users_stats(self, channel_name: str, user_names: Sequence[str]) -> dict[str, UserGameStats]: ...
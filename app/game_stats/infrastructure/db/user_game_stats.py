@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.db import Base
+
+
+class UserGameStatsRow(Base):
+    __tablename__ = "user_game_stats"
+
+    channel_name: Mapped[str] = mapped_column(String, primary_key=True, nullable=False)
+    user_name: Mapped[str] = mapped_column(String, primary_key=True, nullable=False)
+    total_bets: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0", nullable=False)
+    jackpots: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0", nullable=False)
+    total_battles: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0", nullable=False)
+    battle_wins: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0", nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -0,0 +1,62 @@
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.game_stats.domain.model.user_game_stats import UserGameStats
+from app.game_stats.domain.repo import GameStatsRepository
+from app.game_stats.infrastructure.db.user_game_stats import UserGameStatsRow
+
+COUNTERS = ("total_bets", "jackpots", "total_battles", "battle_wins")
+
+
+class GameStatsRepositoryImpl(GameStatsRepository):
+    def __init__(self, db: Session):
+        self._db = db
+
+    def _increment(self, channel_name: str, increments: dict[str, dict[str, int]]) -> None:
+        now_naive = datetime.now(UTC).replace(tzinfo=None)
+        rows = [
+            {
+                "channel_name": channel_name,
+                "user_name": user_name,
+                "updated_at": now_naive,
+                **{counter: counters.get(counter, 0) for counter in COUNTERS},
+            }
+            for user_name, counters in sorted(increments.items())
+        ]
+        stmt = insert(UserGameStatsRow).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserGameStatsRow.channel_name, UserGameStatsRow.user_name],
+            set_={
+                **{counter: getattr(UserGameStatsRow, counter) + getattr(stmt.excluded, counter) for counter in COUNTERS},
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        self._db.execute(stmt)
+
+    def record_bet(self, channel_name: str, user_name: str, jackpot: bool) -> None:
+        self._increment(channel_name, {user_name: {"total_bets": 1, "jackpots": int(jackpot)}})
+
+    def record_battle(self, channel_name: str, winner: str, loser: str) -> None:
+        self._increment(channel_name, {winner: {"total_battles": 1, "battle_wins": 1}, loser: {"total_battles": 1}})
+
+    def get_users_stats(self, channel_name: str, user_names: Sequence[str]) -> dict[str, UserGameStats]:
+        stats = {user_name: UserGameStats(channel_name=channel_name, user_name=user_name) for user_name in user_names}
+        stmt = (
+            select(UserGameStatsRow)
+            .where(UserGameStatsRow.channel_name == channel_name)
+            .where(UserGameStatsRow.user_name.in_(set(user_names)))
+        )
+        for row in self._db.execute(stmt).scalars().all():
+            stats[row.user_name] = UserGameStats(
+                channel_name=row.channel_name,
+                user_name=row.user_name,
+                total_bets=row.total_bets,
+                jackpots=row.jackpots,
+                total_battles=row.total_battles,
+                battle_wins=row.battle_wins,
+            )
+        return stats
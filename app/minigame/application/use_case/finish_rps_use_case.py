@@ -2,7 +2,7 @@ import random
 from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 
-from app.economy.domain.models import TransactionType
+from app.economy.domain.models import LedgerEntry, TransactionType
 from app.minigame.application.uow.minigame_uow import MinigameUnitOfWorkFactory
 from app.minigame.domain.minigame_repository import MinigameRepository
 from app.minigame.infrastructure.minigame_repository import RPS_CHOICES
@@ -39,15 +39,15 @@ class FinishRpsUseCase:
         if winners:
             share = max(1, game.bank // len(winners))
             messages = []
+            entries = []
             with self._minigame_uow.create() as uow:
+                equipment_by_user = uow.get_user_equipment_use_case.get_users_equipment(channel_name, winners)
                 for winner in winners:
                     messages.append(f"Победитель @{winner}.")
 
                     multiplier = 1.0
 
-                    user_equipment = uow.get_user_equipment_use_case.get_user_equipment(channel_name, winner)
-
-                    for equipment in user_equipment:
+                    for equipment in equipment_by_user[winner]:
                         for effect in equipment.shop_item.effects:
                             if isinstance(effect, MinigamePrizeMultiplierEffect):
                                 multiplier *= effect.multiplier
@@ -57,14 +57,18 @@ class FinishRpsUseCase:
 
                     messages.append(f"Сумма выигрыша {prize}.")
 
-                    uow.economy_policy.add_balance(
-                        channel_name=channel_name,
-                        user_name=winner,
-                        amount=prize,
-                        transaction_type=TransactionType.MINIGAME_WIN,
-                        description=f"Победа в КНБ ({winning_choice})",
+                    entries.append(
+                        LedgerEntry(
+                            channel_name=channel_name,
+                            user_name=winner,
+                            amount=prize,
+                            transaction_type=TransactionType.MINIGAME_WIN,
+                            description=f"Победа в КНБ ({winning_choice})",
+                        )
                     )
 
+                uow.economy_policy.post_many(entries)
+
             message = f"Выбор бота: {bot_choice}. Банк: {game.bank}. Побеждает вариант: {winning_choice}. {' '.join(messages)}"
         else:
             message = f"Выбор бота: {bot_choice}. Побеждает вариант: {winning_choice}. Победителей нет. Банк {game.bank} монет сгорает."
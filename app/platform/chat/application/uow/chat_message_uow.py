@@ -6,7 +6,6 @@ from app.ai.gen.conversation.domain.conversation_service import ConversationServ
 from app.ai.gen.prompt.domain.system_prompt_repository import SystemPromptRepository
 from app.chat.domain.repo import ChatRepository
 from app.common.application.unit_of_work import UnitOfWork, UnitOfWorkFactory
-from app.economy.domain.economy_policy import EconomyPolicy
 from app.stream.domain.repo import StreamRepository
 from app.viewer.session.domain.repository import ViewerRepository
 
@@ -15,9 +14,6 @@ class ChatMessageUnitOfWork(UnitOfWork, Protocol):
     @property
     def chat_repo(self) -> ChatRepository: ...
 
-    @property
-    def economy(self) -> EconomyPolicy: ...
-
     @property
     def stream_repo(self) -> StreamRepository: ...
 
@@ -1,9 +1,11 @@
 from app.ai.gen.llm.application.usecase.generate_response_use_case import GenerateResponseUseCase
 from app.ai.gen.prompt.prompt_service import PromptService
 from app.ai.intent.application.usecases.get_intent_use_case import GetIntentFromTextUseCase
+from app.ai.intent.domain.exceptions.intent_exceptions import IntentDetectorError
 from app.ai.intent.domain.models import Intent
 from app.chat.domain.model.chat_message import ChatMessage
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
+from app.economy.application.activity_ledger import ActivityLedger
 from app.platform.chat.application.model.message import ChatMessageDTO
 from app.platform.chat.application.uow.chat_message_uow import ChatMessageUnitOfWorkFactory
 from core.types import SessionFactory
@@ -16,19 +18,30 @@ class HandleChatMessageUseCase:
         get_intent_from_text_use_case_factory: SessionScopedFactory[GetIntentFromTextUseCase],
         prompt_service: PromptService,
         generate_response_use_case_factory: SessionScopedFactory[GenerateResponseUseCase],
+        activity_ledger: ActivityLedger,
         db_ro_session: SessionFactory,
     ):
         self._chat_message_uow = chat_message_uow
         self._get_intent_from_text_use_case_factory = get_intent_from_text_use_case_factory
         self._prompt_service = prompt_service
         self._generate_response_use_case_factory = generate_response_use_case_factory
+        self._activity_ledger = activity_ledger
         self._db_ro_session = db_ro_session
 
     async def handle(self, chat_message: ChatMessageDTO) -> str | None:
         with self._db_ro_session() as session:
-            intent = await self._get_intent_from_text_use_case_factory.get(session).get_intent_from_text(
-                chat_message.channel_name, chat_message.message
-            )
+            try:
+                intent = await self._get_intent_from_text_use_case_factory.get(session).get_intent_from_text(
+                    chat_message.channel_name, chat_message.message
+                )
+            except IntentDetectorError:
+                intent = Intent.OTHER
+
+        self._activity_ledger.record_message(
+            channel_name=chat_message.channel_name,
+            user_name=chat_message.user_name,
+            occurred_at=chat_message.occurred_at,
+        )
 
         with self._chat_message_uow.create() as uow:
             uow.chat_repo.save(
@@ -39,31 +52,14 @@ class HandleChatMessageUseCase:
                     created_at=chat_message.occurred_at,
                 )
             )
-            uow.economy.process_user_message_activity(
-                channel_name=chat_message.channel_name,
-                user_name=chat_message.user_name,
-            )
             active_stream = uow.stream_repo.get_active_stream(chat_message.channel_name)
             if active_stream:
-                existing_session = uow.viewer_repo.get_viewer_session(
+                uow.viewer_repo.heartbeat(
                     stream_id=active_stream.id,
                     channel_name=chat_message.channel_name,
-                    user_name=chat_message.user_name,
+                    user_names=[chat_message.user_name],
+                    current_time=chat_message.occurred_at,
                 )
-                if existing_session:
-                    uow.viewer_repo.update_last_activity(
-                        stream_id=active_stream.id,
-                        channel_name=chat_message.channel_name,
-                        user_name=chat_message.user_name,
-                        current_time=chat_message.occurred_at,
-                    )
-                else:
-                    uow.viewer_repo.create_view_session(
-                        stream_id=active_stream.id,
-                        channel_name=chat_message.channel_name,
-                        user_name=chat_message.user_name,
-                        current_time=chat_message.occurred_at,
-                    )
 
         prompt = None
         if intent == Intent.JACKBOX:
@@ -85,14 +81,6 @@ class HandleChatMessageUseCase:
                 user_message=prompt,
                 ai_message=result,
             )
-            uow.chat_repo.save(
-                ChatMessage(
-                    channel_name=chat_message.channel_name,
-                    user_name=chat_message.user_name,
-                    content=chat_message.message,
-                    created_at=chat_message.occurred_at,
-                )
-            )
             uow.chat_repo.save(
                 ChatMessage(
                     channel_name=chat_message.channel_name,
@@ -7,7 +7,6 @@ from app.ai.gen.prompt.domain.system_prompt_repository import SystemPromptReposi
 from app.chat.domain.repo import ChatRepository
 from app.common.infrastructure.sqlalchemy_uow import SqlAlchemyUnitOfWorkBase, SqlAlchemyUnitOfWorkFactory
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
-from app.economy.domain.economy_policy import EconomyPolicy
 from app.platform.chat.application.uow.chat_message_uow import ChatMessageUnitOfWork, ChatMessageUnitOfWorkFactory
 from app.stream.domain.repo import StreamRepository
 from app.viewer.session.domain.repository import ViewerRepository
@@ -19,7 +18,6 @@ class SqlAlchemyChatMessageUnitOfWork(SqlAlchemyUnitOfWorkBase, ChatMessageUnitO
         self,
         session: Session,
         chat_repo: ChatRepository,
-        economy: EconomyPolicy,
         stream_repo: StreamRepository,
         viewer_repo: ViewerRepository,
         conversation_service: ConversationService,
@@ -28,7 +26,6 @@ class SqlAlchemyChatMessageUnitOfWork(SqlAlchemyUnitOfWorkBase, ChatMessageUnitO
     ):
         super().__init__(session=session, read_only=read_only)
         self._chat_repo = chat_repo
-        self._economy = economy
         self._stream_repo = stream_repo
         self._viewer_repo = viewer_repo
         self._conversation_service = conversation_service
@@ -38,10 +35,6 @@ class SqlAlchemyChatMessageUnitOfWork(SqlAlchemyUnitOfWorkBase, ChatMessageUnitO
     def chat_repo(self) -> ChatRepository:
         return self._chat_repo
 
-    @property
-    def economy(self) -> EconomyPolicy:
-        return self._economy
-
     @property
     def stream_repo(self) -> StreamRepository:
         return self._stream_repo
@@ -65,7 +58,6 @@ class SqlAlchemyChatMessageUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[ChatMes
         session_factory_rw: SessionFactory,
         session_factory_ro: SessionFactory,
         chat_repository_factory: SessionScopedFactory[ChatRepository],
-        economy_policy_factory: SessionScopedFactory[EconomyPolicy],
         stream_repository_factory: SessionScopedFactory[StreamRepository],
         viewer_repository_factory: SessionScopedFactory[ViewerRepository],
         conversation_service_factory: SessionScopedFactory[ConversationService],
@@ -77,7 +69,6 @@ class SqlAlchemyChatMessageUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[ChatMes
             builder=self._build_uow,
         )
         self._chat_repository_factory = chat_repository_factory
-        self._economy_policy_factory = economy_policy_factory
         self._stream_repository_factory = stream_repository_factory
         self._viewer_repository_factory = viewer_repository_factory
         self._conversation_service_factory = conversation_service_factory
@@ -87,7 +78,6 @@ class SqlAlchemyChatMessageUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[ChatMes
         return SqlAlchemyChatMessageUnitOfWork(
             session=db,
             chat_repo=self._chat_repository_factory.get(db),
-            economy=self._economy_policy_factory.get(db),
             stream_repo=self._stream_repository_factory.get(db),
             viewer_repo=self._viewer_repository_factory.get(db),
             conversation_service=self._conversation_service_factory.get(db),
@@ -4,6 +4,7 @@ from app.ai.gen.conversation.domain.conversation_service import ConversationServ
 from app.ai.gen.prompt.domain.system_prompt_repository import SystemPromptRepository
 from app.chat.domain.repo import ChatRepository
 from app.common.application.unit_of_work import UnitOfWork, UnitOfWorkFactory
+from app.follow.domain.repo import FollowersRepository
 from app.platform.domain.repository import PlatformRepository
 
 
@@ -20,6 +21,9 @@ class FollowAgeUnitOfWork(UnitOfWork, Protocol):
     @property
     def platform_repository(self) -> PlatformRepository: ...
 
+    @property
+    def followers_repository(self) -> FollowersRepository: ...
+
 
 class FollowAgeUnitOfWorkFactory(UnitOfWorkFactory[FollowAgeUnitOfWork], Protocol):
     pass
@@ -1,8 +1,11 @@
+from datetime import datetime
+
 from app.ai.gen.llm.application.usecase.generate_response_use_case import GenerateResponseUseCase
 from app.chat.domain.model.chat_message import ChatMessage
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
-from app.platform.command.followage.application.model import FollowageDTO
+from app.platform.command.followage.application.model import FollowageDTO, FollowageInfo
 from app.platform.command.followage.application.uow import FollowAgeUnitOfWorkFactory
+from app.viewer.application.port.viewer_cache_port import ViewerCachePort
 from core.types import SessionFactory
 
 
@@ -12,19 +15,53 @@ class HandleFollowAgeUseCase:
         generate_response_use_case_factory: SessionScopedFactory[GenerateResponseUseCase],
         follow_age_uow_factory: FollowAgeUnitOfWorkFactory,
         session_factory_ro: SessionFactory,
+        viewer_cache: ViewerCachePort,
     ):
         self._generate_response_use_case_factory = generate_response_use_case_factory
         self._follow_age_uow_factory = follow_age_uow_factory
         self._db_ro_session = session_factory_ro
+        self._viewer_cache = viewer_cache
 
-    async def handle(self, command_follow_age: FollowageDTO) -> str:
-        channel_name = command_follow_age.channel_name
+    def _get_local_followage(self, channel_name: str, user_name: str) -> FollowageInfo | None:
+        with self._follow_age_uow_factory.create(read_only=True) as uow:
+            follower = uow.followers_repository.get_by_user_name(channel_name, user_name)
+        if follower is None or not follower.is_active or follower.followed_at is None:
+            return None
+        return FollowageInfo(
+            user_id=follower.user_id,
+            user_name=follower.display_name,
+            user_login=follower.user_name,
+            followed_at=follower.followed_at,
+        )
+
+    async def _fetch_followage(self, channel_name: str, user_name: str, occurred_at: datetime) -> FollowageInfo | None:
+        broadcaster_id = await self._viewer_cache.get_viewer_id(channel_name)
+        user_id = await self._viewer_cache.get_viewer_id(user_name)
+        if not broadcaster_id or not user_id:
+            return None
 
         with self._follow_age_uow_factory.create(read_only=True) as uow:
-            follow_info = await uow.platform_repository.get_followage(
+            follow_info = await uow.platform_repository.get_followage_by_ids(broadcaster_id, user_id)
+        if follow_info is None:
+            return None
+
+        with self._follow_age_uow_factory.create() as uow:
+            uow.followers_repository.upsert_active(
                 channel_name=channel_name,
-                user_name=command_follow_age.user_name,
+                user_id=follow_info.user_id,
+                user_name=follow_info.user_login,
+                display_name=follow_info.user_name,
+                followed_at=follow_info.followed_at,
+                seen_at=occurred_at,
             )
+        return follow_info
+
+    async def handle(self, command_follow_age: FollowageDTO) -> str:
+        channel_name = command_follow_age.channel_name
+
+        follow_info = self._get_local_followage(channel_name, command_follow_age.user_name)
+        if follow_info is None:
+            follow_info = await self._fetch_followage(channel_name, command_follow_age.user_name, command_follow_age.occurred_at)
 
         if not follow_info:
             result = f"@{command_follow_age.display_name}, вы не отслеживаете канал."
@@ -7,6 +7,7 @@ from app.ai.gen.prompt.domain.system_prompt_repository import SystemPromptReposi
 from app.chat.domain.repo import ChatRepository
 from app.common.infrastructure.sqlalchemy_uow import SqlAlchemyUnitOfWorkBase, SqlAlchemyUnitOfWorkFactory
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
+from app.follow.domain.repo import FollowersRepository
 from app.platform.command.followage.application.uow import FollowAgeUnitOfWork, FollowAgeUnitOfWorkFactory
 from app.platform.domain.repository import PlatformRepository
 from core.types import SessionFactory
@@ -20,6 +21,7 @@ class SqlAlchemyFollowAgeUnitOfWork(SqlAlchemyUnitOfWorkBase, FollowAgeUnitOfWor
         chat_repository: ChatRepository,
         system_prompt_repository: SystemPromptRepository,
         platform_repository: PlatformRepository,
+        followers_repository: FollowersRepository,
         read_only: bool,
     ):
         super().__init__(session=session, read_only=read_only)
@@ -27,6 +29,7 @@ class SqlAlchemyFollowAgeUnitOfWork(SqlAlchemyUnitOfWorkBase, FollowAgeUnitOfWor
         self._chat_repository = chat_repository
         self._system_prompt_repository = system_prompt_repository
         self._platform_repository = platform_repository
+        self._followers_repository = followers_repository
 
     @property
     def conversation_service(self) -> ConversationService:
@@ -44,6 +47,10 @@ class SqlAlchemyFollowAgeUnitOfWork(SqlAlchemyUnitOfWorkBase, FollowAgeUnitOfWor
     def platform_repository(self) -> PlatformRepository:
         return self._platform_repository
 
+    @property
+    def followers_repository(self) -> FollowersRepository:
+        return self._followers_repository
+
 
 class SqlAlchemyFollowAgeUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[FollowAgeUnitOfWork], FollowAgeUnitOfWorkFactory):
     def __init__(
@@ -54,6 +61,7 @@ class SqlAlchemyFollowAgeUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[FollowAge
         conversation_service_factory: SessionScopedFactory[ConversationService],
         system_prompt_repository_factory: SessionScopedFactory[SystemPromptRepository],
         platform_repository: PlatformRepository,
+        followers_repository_factory: SessionScopedFactory[FollowersRepository],
     ):
         super().__init__(
             session_factory_rw=session_factory_rw,
@@ -64,6 +72,7 @@ class SqlAlchemyFollowAgeUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[FollowAge
         self._conversation_service_factory = conversation_service_factory
         self._system_prompt_repository_factory = system_prompt_repository_factory
         self._platform_repository = platform_repository
+        self._followers_repository_factory = followers_repository_factory
 
     def _build_uow(self, db: Session, read_only: bool) -> FollowAgeUnitOfWork:
         return SqlAlchemyFollowAgeUnitOfWork(
@@ -72,5 +81,6 @@ class SqlAlchemyFollowAgeUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[FollowAge
             chat_repository=self._chat_repository_factory.get(db),
             system_prompt_repository=self._system_prompt_repository_factory.get(db),
             platform_repository=self._platform_repository,
+            followers_repository=self._followers_repository_factory.get(db),
             read_only=read_only,
         )
@@ -10,24 +10,25 @@ class HandleStatsUseCase:
     async def handle(self, command_stats: CommandStatsDTO) -> str:
         with self._stats_uow.create(read_only=True) as uow:
             balance = uow.economy_policy.get_user_balance(command_stats.channel_name, command_stats.user_name)
-            bets = uow.betting_service.get_user_bets(command_stats.channel_name, command_stats.user_name)
+            game_stats = uow.game_stats_repo.get_users_stats(
+                command_stats.channel_name, [command_stats.user_name, command_stats.display_name]
+            )
 
-        if not bets:
+        user_stats = game_stats[command_stats.user_name]
+        if user_stats.total_bets == 0:
             bet_stats = UserBetStats(total_bets=0, jackpots=0, jackpot_rate=0)
         else:
-            total_bets = len(bets)
-            jackpots = sum(1 for bet in bets if bet.result_type == "jackpot")
+            total_bets = user_stats.total_bets
+            jackpots = user_stats.jackpots
             jackpot_rate = (jackpots / total_bets) * 100 if total_bets > 0 else 0
             bet_stats = UserBetStats(total_bets=total_bets, jackpots=jackpots, jackpot_rate=jackpot_rate)
 
-        with self._stats_uow.create(read_only=True) as uow:
-            battles = uow.battle_use_case.get_user_battles(channel_name=command_stats.channel_name, user_name=command_stats.display_name)
-
-        if not battles:
+        fighter_stats = game_stats[command_stats.display_name]
+        if fighter_stats.total_battles == 0:
             battle_stats = UserBattleStats(total_battles=0, wins=0, losses=0, win_rate=0.0)
         else:
-            total_battles = len(battles)
-            wins = sum(1 for battle in battles if battle.winner == command_stats.display_name)
+            total_battles = fighter_stats.total_battles
+            wins = fighter_stats.battle_wins
             losses = total_battles - wins
             win_rate = (wins / total_battles) * 100 if total_battles > 0 else 0.0
             battle_stats = UserBattleStats(total_battles=total_battles, wins=wins, losses=losses, win_rate=win_rate)
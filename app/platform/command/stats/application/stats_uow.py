@@ -2,11 +2,10 @@ from __future__ import annotations
 
 from typing import Protocol
 
-from app.battle.application.usecase.battle_use_case import BattleUseCase
-from app.betting.application.betting_service import BettingService
 from app.chat.application.usecase.chat_use_case import ChatUseCase
 from app.common.application.unit_of_work import UnitOfWork, UnitOfWorkFactory
 from app.economy.domain.economy_policy import EconomyPolicy
+from app.game_stats.domain.repo import GameStatsRepository
 
 
 class StatsUnitOfWork(UnitOfWork, Protocol):
@@ -14,10 +13,7 @@ class StatsUnitOfWork(UnitOfWork, Protocol):
     def economy_policy(self) -> EconomyPolicy: ...
 
     @property
-    def betting_service(self) -> BettingService: ...
-
-    @property
-    def battle_use_case(self) -> BattleUseCase: ...
+    def game_stats_repo(self) -> GameStatsRepository: ...
 
     @property
     def chat_use_case(self) -> ChatUseCase: ...
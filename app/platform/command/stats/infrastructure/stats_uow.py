@@ -2,12 +2,11 @@ from __future__ import annotations
 
 from sqlalchemy.orm import Session
 
-from app.battle.application.usecase.battle_use_case import BattleUseCase
-from app.betting.application.betting_service import BettingService
 from app.chat.application.usecase.chat_use_case import ChatUseCase
 from app.common.infrastructure.sqlalchemy_uow import SqlAlchemyUnitOfWorkBase, SqlAlchemyUnitOfWorkFactory
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
 from app.economy.domain.economy_policy import EconomyPolicy
+from app.game_stats.domain.repo import GameStatsRepository
 from app.platform.command.stats.application.stats_uow import StatsUnitOfWork, StatsUnitOfWorkFactory
 from core.types import SessionFactory
 
@@ -17,15 +16,13 @@ class SqlAlchemyStatsUnitOfWork(SqlAlchemyUnitOfWorkBase, StatsUnitOfWork):
         self,
         session: Session,
         economy_policy: EconomyPolicy,
-        betting_service: BettingService,
-        battle_use_case: BattleUseCase,
+        game_stats_repo: GameStatsRepository,
         chat_use_case: ChatUseCase,
         read_only: bool,
     ):
         super().__init__(session=session, read_only=read_only)
         self._economy_policy = economy_policy
-        self._betting_service = betting_service
-        self._battle_use_case = battle_use_case
+        self._game_stats_repo = game_stats_repo
         self._chat_use_case = chat_use_case
 
     @property
@@ -33,12 +30,8 @@ class SqlAlchemyStatsUnitOfWork(SqlAlchemyUnitOfWorkBase, StatsUnitOfWork):
         return self._economy_policy
 
     @property
-    def betting_service(self) -> BettingService:
-        return self._betting_service
-
-    @property
-    def battle_use_case(self) -> BattleUseCase:
-        return self._battle_use_case
+    def game_stats_repo(self) -> GameStatsRepository:
+        return self._game_stats_repo
 
     @property
     def chat_use_case(self) -> ChatUseCase:
@@ -51,8 +44,7 @@ class SqlAlchemyStatsUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[StatsUnitOfWo
         session_factory_rw: SessionFactory,
         session_factory_ro: SessionFactory,
         economy_policy_factory: SessionScopedFactory[EconomyPolicy],
-        betting_service_factory: SessionScopedFactory[BettingService],
-        battle_use_case: BattleUseCase,
+        game_stats_repository_factory: SessionScopedFactory[GameStatsRepository],
         chat_use_case: ChatUseCase,
     ):
         super().__init__(
@@ -61,16 +53,14 @@ class SqlAlchemyStatsUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[StatsUnitOfWo
             builder=self._build_uow,
         )
         self._economy_policy_provider = economy_policy_factory
-        self._betting_service_factory = betting_service_factory
-        self._battle_use_case = battle_use_case
+        self._game_stats_repository_factory = game_stats_repository_factory
         self._chat_use_case = chat_use_case
 
     def _build_uow(self, db: Session, read_only: bool) -> StatsUnitOfWork:
         return SqlAlchemyStatsUnitOfWork(
             session=db,
             economy_policy=self._economy_policy_provider.get(db),
-            betting_service=self._betting_service_factory.get(db),
-            battle_use_case=self._battle_use_case,
+            game_stats_repo=self._game_stats_repository_factory.get(db),
             chat_use_case=self._chat_use_case,
             read_only=read_only,
         )
@@ -1,7 +1,6 @@
 from app.ai.gen.conversation.domain.conversation_service import ConversationService
 from app.ai.gen.llm.application.usecase.generate_response_use_case import GenerateResponseUseCase
 from app.ai.gen.prompt.domain.system_prompt_repository import SystemPromptRepository
-from app.battle.application.usecase.battle_use_case import BattleUseCase
 from app.betting.application.betting_service import BettingService
 from app.chat.application.usecase.chat_use_case import ChatUseCase
 from app.chat.domain.repo import ChatRepository
@@ -13,6 +12,8 @@ from app.equipment.application.defense.calculate_timeout_use_case import Calcula
 from app.equipment.application.defense.roll_cooldown_use_case import RollCooldownUseCase
 from app.equipment.application.equipment_exists_use_case import EquipmentExistsUseCase
 from app.equipment.application.get_user_equipment_use_case import GetUserEquipmentUseCase
+from app.follow.domain.repo import FollowersRepository
+from app.game_stats.domain.repo import GameStatsRepository
 from app.minigame.application.uow.rps_uow import RpsUnitOfWorkFactory
 from app.minigame.application.use_case.handle_rps_use_case import HandleRpsUseCase
 from app.minigame.domain.minigame_repository import MinigameRepository
@@ -71,6 +72,7 @@ from app.platform.infrastructure.api.client import TwitchHelixClient
 from app.platform.infrastructure.repository import PlatformRepositoryImpl
 from app.shop.domain.repository import ShopItemRepository
 from app.stream.domain.repo import StreamRepository
+from app.viewer.application.port.viewer_cache_port import ViewerCachePort
 from core.types import SessionFactory
 
 
@@ -92,11 +94,12 @@ class PlatformContainer:
             logger=logger,
         )
         self.api_client = TwitchHelixClient(self.platform_auth)
+        self._platform_repository = PlatformRepositoryImpl(self.api_client, logger)
         self._handle_token_checker_use_case = HandleTokenCheckerUseCase(self.platform_auth, logger)
         self.token_checker_job = TokenCheckerJob(self._handle_token_checker_use_case, logger)
 
     def platform_repository(self) -> PlatformRepository:
-        return PlatformRepositoryImpl(self.api_client, self._logger)
+        return self._platform_repository
 
     def bonus_uow_factory(
         self,
@@ -382,27 +385,24 @@ class PlatformContainer:
     def stats_uow_factory(
         self,
         economy_policy_factory: SessionScopedFactory[EconomyPolicy],
-        betting_service_factory: SessionScopedFactory[BettingService],
-        battle_use_case: BattleUseCase,
+        game_stats_repository_factory: SessionScopedFactory[GameStatsRepository],
         chat_use_case: ChatUseCase,
     ) -> StatsUnitOfWorkFactory:
         return SqlAlchemyStatsUnitOfWorkFactory(
             session_factory_rw=self._session_factory_rw,
             session_factory_ro=self._session_factory_ro,
             economy_policy_factory=economy_policy_factory,
-            betting_service_factory=betting_service_factory,
-            battle_use_case=battle_use_case,
+            game_stats_repository_factory=game_stats_repository_factory,
             chat_use_case=chat_use_case,
         )
 
     def handle_stats_use_case(
         self,
         economy_policy_factory: SessionScopedFactory[EconomyPolicy],
-        betting_service_factory: SessionScopedFactory[BettingService],
-        battle_use_case: BattleUseCase,
+        game_stats_repository_factory: SessionScopedFactory[GameStatsRepository],
         chat_use_case: ChatUseCase,
     ) -> HandleStatsUseCase:
-        stats_uow_factory = self.stats_uow_factory(economy_policy_factory, betting_service_factory, battle_use_case, chat_use_case)
+        stats_uow_factory = self.stats_uow_factory(economy_policy_factory, game_stats_repository_factory, chat_use_case)
         return HandleStatsUseCase(stats_uow_factory)
 
     def stats_command_handler(
@@ -410,11 +410,10 @@ class PlatformContainer:
         command_prefix: str,
         command_name: str,
         economy_policy_factory: SessionScopedFactory[EconomyPolicy],
-        betting_service_factory: SessionScopedFactory[BettingService],
-        battle_use_case: BattleUseCase,
+        game_stats_repository_factory: SessionScopedFactory[GameStatsRepository],
         chat_use_case: ChatUseCase,
     ) -> StatsCommandHandler:
-        handle_stats_use_case = self.handle_stats_use_case(economy_policy_factory, betting_service_factory, battle_use_case, chat_use_case)
+        handle_stats_use_case = self.handle_stats_use_case(economy_policy_factory, game_stats_repository_factory, chat_use_case)
         return StatsCommandHandler(command_prefix=command_prefix, command_name=command_name, handle_stats_use_case=handle_stats_use_case)
 
     def top_bottom_uow_factory(
@@ -509,6 +508,7 @@ class PlatformContainer:
         conversation_service_factory: SessionScopedFactory[ConversationService],
         system_prompt_repository_factory: SessionScopedFactory[SystemPromptRepository],
         platform_repository: PlatformRepository,
+        followers_repository_factory: SessionScopedFactory[FollowersRepository],
     ) -> FollowAgeUnitOfWorkFactory:
         return SqlAlchemyFollowAgeUnitOfWorkFactory(
             session_factory_ro=self._session_factory_ro,
@@ -517,6 +517,7 @@ class PlatformContainer:
             conversation_service_factory=conversation_service_factory,
             system_prompt_repository_factory=system_prompt_repository_factory,
             platform_repository=platform_repository,
+            followers_repository_factory=followers_repository_factory,
         )
 
     def handle_follow_age_use_case(
@@ -526,11 +527,17 @@ class PlatformContainer:
         conversation_service_factory: SessionScopedFactory[ConversationService],
         system_prompt_repository_factory: SessionScopedFactory[SystemPromptRepository],
         platform_repository: PlatformRepository,
+        followers_repository_factory: SessionScopedFactory[FollowersRepository],
+        viewer_cache: ViewerCachePort,
     ) -> HandleFollowAgeUseCase:
         follow_age_uow_factory = self.follow_age_uow_factory(
-            chat_repository_factory, conversation_service_factory, system_prompt_repository_factory, platform_repository
+            chat_repository_factory,
+            conversation_service_factory,
+            system_prompt_repository_factory,
+            platform_repository,
+            followers_repository_factory,
         )
-        return HandleFollowAgeUseCase(generate_response_use_case_factory, follow_age_uow_factory, self._session_factory_ro)
+        return HandleFollowAgeUseCase(generate_response_use_case_factory, follow_age_uow_factory, self._session_factory_ro, viewer_cache)
 
     def followage_command_handler(
         self,
@@ -541,6 +548,8 @@ class PlatformContainer:
         conversation_service_factory: SessionScopedFactory[ConversationService],
         system_prompt_repository_factory: SessionScopedFactory[SystemPromptRepository],
         platform_repository: PlatformRepository,
+        followers_repository_factory: SessionScopedFactory[FollowersRepository],
+        viewer_cache: ViewerCachePort,
     ) -> FollowageCommandHandler:
         handle_follow_age_use_case = self.handle_follow_age_use_case(
             generate_response_use_case_factory,
@@ -548,6 +557,8 @@ class PlatformContainer:
             conversation_service_factory,
             system_prompt_repository_factory,
             platform_repository,
+            followers_repository_factory,
+            viewer_cache,
         )
         return FollowageCommandHandler(
             command_prefix=command_prefix,
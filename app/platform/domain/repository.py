@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator, Sequence
 from typing import Protocol
 
 from app.follow.application.models.follower import ChannelFollowerDTO
@@ -14,12 +15,14 @@ class PlatformRepository(Protocol):
 
     async def get_user_by_login(self, login: str) -> ViewerInfoDTO | None: ...
 
+    async def get_users_by_logins(self, logins: Sequence[str]) -> list[ViewerInfoDTO] | None: ...
+
     async def get_authenticated_user(self) -> ViewerInfoDTO | None: ...
 
     async def get_stream_info(self, channel_name: str) -> StreamInfoDTO | None: ...
 
     async def get_stream_status(self, broadcaster_id: str) -> StreamStatusDTO | None: ...
 
-    async def get_followage(self, channel_name: str, user_name: str) -> FollowageInfo | None: ...
+    async def get_followage_by_ids(self, broadcaster_id: str, user_id: str) -> FollowageInfo | None: ...
 
-    async def get_channel_followers(self, channel_name: str) -> list[ChannelFollowerDTO]: ...
+    def iter_channel_followers(self, channel_name: str) -> AsyncIterator[list[ChannelFollowerDTO]]: ...
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 from app.core.network.api.client import ApiClient
+from app.core.network.api.rate_limit import RateLimitBucket, RateLimitHeaders
 from app.platform.auth.platform_auth import PlatformAuth
 
 
 class TwitchHelixClient(ApiClient):
     _HEADER_CLIENT_ID = "Client-ID"
     _HEADER_AUTHORIZATION = "Authorization"
+    _RATE_LIMIT_HEADERS = RateLimitHeaders(limit="Ratelimit-Limit", remaining="Ratelimit-Remaining", reset="Ratelimit-Reset")
+    _MAX_CONCURRENCY = 8
+    _RATE_LIMIT_RESERVE = 5
 
     def __init__(self, auth: PlatformAuth):
-        super().__init__(base_url="https://api.twitch.tv/helix")
+        super().__init__(
+            base_url="https://api.twitch.tv/helix",
+            rate_limit_bucket=RateLimitBucket(self._RATE_LIMIT_HEADERS, self._MAX_CONCURRENCY, self._RATE_LIMIT_RESERVE),
+        )
         self._auth = auth
 
     def base_headers(self) -> dict[str, str] | None:
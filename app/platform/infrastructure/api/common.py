@@ -10,5 +10,8 @@ async def handle_api_response(response: ApiResponse, operation: str, logger: Log
     if response.status_code == 200:
         logger.log_debug(f"API операция '{operation}' выполнена успешно")
         return response.json_data
+    if response.status_code == 429:
+        logger.log_info(f"API операция '{operation}' пропущена: превышен лимит запросов")
+        raise Exception(f"API операция '{operation}' пропущена: превышен лимит запросов")
     logger.log_error(f"Ошибка в API операции '{operation}': {response.status_code}, {response.text}")
     raise Exception(f"API операция '{operation}' завершилась с ошибкой: {response.status_code}")
@@ -1,6 +1,9 @@
+from collections.abc import AsyncIterator, Sequence
+
 import httpx
 from pydantic import ValidationError
 
+from app.core.common.single_flight import SingleFlight
 from app.core.logger.domain.logger import Logger
 from app.core.network.api.client import ApiClient
 from app.follow.application.models.follower import ChannelFollowerDTO
@@ -17,9 +20,16 @@ from app.viewer.application.model.model import ViewerInfoDTO
 
 
 class PlatformRepositoryImpl(PlatformRepository):
+    _STREAM_STATUS_TTL_SECONDS = 15
+    _CHATTERS_TTL_SECONDS = 5
+    _FOLLOWERS_PAGE_SIZE = 100
+
     def __init__(self, client: ApiClient, logger: Logger):
         self._api_client = client
         self._logger = logger.create_child(__name__)
+        self._users_flight: SingleFlight[str, ViewerInfoDTO | None] = SingleFlight()
+        self._stream_status_flight: SingleFlight[str, StreamStatusDTO | None] = SingleFlight(self._STREAM_STATUS_TTL_SECONDS)
+        self._chatters_flight: SingleFlight[tuple[str, str], list[str] | None] = SingleFlight(self._CHATTERS_TTL_SECONDS)
 
     async def timeout_user(self, broadcaster_id: str, moderator_id: str, user_id: str, duration_seconds: int, reason: str) -> bool:
         response = await self._api_client.post(
@@ -38,6 +48,12 @@ class PlatformRepositoryImpl(PlatformRepository):
             return False
 
     async def get_stream_chatters(self, broadcaster_id: str, moderator_id: str) -> list[str]:
+        chatters = await self._chatters_flight.do(
+            (broadcaster_id, moderator_id), lambda: self._fetch_stream_chatters(broadcaster_id, moderator_id)
+        )
+        return list(chatters) if chatters is not None else []
+
+    async def _fetch_stream_chatters(self, broadcaster_id: str, moderator_id: str) -> list[str] | None:
         try:
             response = await self._api_client.get(
                 url="/chat/chatters", params={"broadcaster_id": broadcaster_id, "moderator_id": moderator_id}
@@ -47,15 +63,18 @@ class PlatformRepositoryImpl(PlatformRepository):
                 parsed: ChattersResponse = ChattersResponse.model_validate(data)
             except ValidationError as e:
                 self._logger.log_error(f"Валидация chatters для {broadcaster_id} не прошла: {e}")
-                return []
+                return None
 
             chatters = parsed.data
             return [ch.user_login for ch in chatters]
         except Exception as e:
             self._logger.log_error(f"Ошибка при получении списка зрителей: {e}")
-            return []
+            return None
 
     async def get_user_by_login(self, login: str) -> ViewerInfoDTO | None:
+        return await self._users_flight.do(login.lower(), lambda: self._fetch_user_by_login(login))
+
+    async def _fetch_user_by_login(self, login: str) -> ViewerInfoDTO | None:
         self._logger.log_debug(f"Получение информации о пользователе для логина: {login}")
         try:
             response = await self._api_client.get(url="/users", params={"login": login})
@@ -92,6 +111,22 @@ class PlatformRepositoryImpl(PlatformRepository):
             self._logger.log_error(f"Неожиданная ошибка при получении пользователя {login}: {e}")
             return None
 
+    async def get_users_by_logins(self, logins: Sequence[str]) -> list[ViewerInfoDTO] | None:
+        self._logger.log_debug(f"Получение информации о {len(logins)} пользователях")
+        try:
+            response = await self._api_client.get(url="/users", params={"login": list(logins)})
+            if response.status_code != 200:
+                self._logger.log_error(f"API ошибка при получении пользователей: {response.status_code}, {response.text}")
+                return None
+            parsed = UsersResponse.model_validate(response.json_data)
+            return [ViewerInfoDTO(id=user.id, login=user.login, display_name=user.display_name) for user in parsed.data]
+        except ValidationError as e:
+            self._logger.log_error(f"Валидация пользователей не прошла: {e}")
+            return None
+        except httpx.HTTPError as e:
+            self._logger.log_error(f"Ошибка соединения при получении пользователей: {e}")
+            return None
+
     async def get_authenticated_user(self) -> ViewerInfoDTO | None:
         self._logger.log_debug("Получение профиля по токену")
         try:
@@ -126,6 +161,9 @@ class PlatformRepositoryImpl(PlatformRepository):
             return None
 
     async def get_stream_status(self, broadcaster_id: str) -> StreamStatusDTO | None:
+        return await self._stream_status_flight.do(broadcaster_id, lambda: self._fetch_stream_status(broadcaster_id))
+
+    async def _fetch_stream_status(self, broadcaster_id: str) -> StreamStatusDTO | None:
         try:
             response = await self._api_client.get(url="/streams", params={"user_id": broadcaster_id})
             if response.status_code == 401:
@@ -184,7 +222,7 @@ class PlatformRepositoryImpl(PlatformRepository):
             return None
         return status.stream_data
 
-    async def _get_user_followage(self, broadcaster_id: str, user_id: str) -> FollowageInfo | None:
+    async def get_followage_by_ids(self, broadcaster_id: str, user_id: str) -> FollowageInfo | None:
         response = await self._api_client.get(url="/channels/followers", params={"broadcaster_id": broadcaster_id, "user_id": user_id})
         try:
             data = await handle_api_response(response, f"get_user_followage({broadcaster_id}, {user_id})", self._logger)
@@ -204,56 +242,33 @@ class PlatformRepositoryImpl(PlatformRepository):
             )
         return None
 
-    async def get_followage(self, channel_name: str, user_name: str) -> FollowageInfo | None:
-        broadcaster = await self.get_user_by_login(channel_name)
-        user = await self.get_user_by_login(user_name)
-        broadcaster_id = None if broadcaster is None else broadcaster.id
-        user_id = None if user is None else user.id
-        if not broadcaster_id or not user_id:
-            return None
-        return await self._get_user_followage(broadcaster_id=broadcaster_id, user_id=user_id)
-
-    async def _get_channel_followers(self, broadcaster_id: str) -> list[ChannelFollowerDTO]:
-        params = {"broadcaster_id": broadcaster_id, "first": 50}
-        followers: list[ChannelFollowerDTO] = []
-        cursor = None
+    async def iter_channel_followers(self, channel_name: str) -> AsyncIterator[list[ChannelFollowerDTO]]:
+        user = await self.get_user_by_login(channel_name)
+        if user is None:
+            raise Exception(f"Не удалось получить id канала {channel_name}")
+        params = {"broadcaster_id": user.id, "first": self._FOLLOWERS_PAGE_SIZE}
+        operation = f"get_channel_followers({user.id})"
 
         while True:
-            if cursor:
-                params["after"] = cursor
-            elif "after" in params:
-                params.pop("after")
-
             response = await self._api_client.get(url="/channels/followers", params=params)
+            data = await handle_api_response(response, operation, self._logger)
             try:
-                data = await handle_api_response(response, f"get_channel_followers({broadcaster_id})", self._logger)
                 parsed: FollowersResponse = FollowersResponse.model_validate(data)
-                followers_page: list[FollowerData] = parsed.data
-            except ValidationError:
-                break
+            except ValidationError as e:
+                raise Exception(f"API операция '{operation}' вернула некорректный ответ") from e
 
-            followers.extend(
-                [
+            if parsed.data:
+                yield [
                     ChannelFollowerDTO(
                         user_id=item.user_id,
                         user_name=item.user_login,
                         display_name=item.user_name,
                         followed_at=item.followed_at,
                     )
-                    for item in followers_page
+                    for item in parsed.data
                 ]
-            )
 
-            pagination = data.get("pagination") if isinstance(data, dict) else None
-            cursor = None if not pagination else pagination.get("cursor")
+            cursor = None if not parsed.pagination else parsed.pagination.get("cursor")
             if not cursor or not parsed.data:
                 break
-
-        return followers
-
-    async def get_channel_followers(self, channel_name: str) -> list[ChannelFollowerDTO]:
-        user = await self.get_user_by_login(channel_name)
-        broadcaster_id = None if user is None else user.id
-        if not broadcaster_id:
-            return []
-        return await self._get_channel_followers(broadcaster_id=broadcaster_id)
+            params["after"] = cursor
@@ -0,0 +1,33 @@
+import asyncio
+from datetime import UTC, datetime
+
+from app.core.logger.domain.logger import Logger
+from app.retention.application.usecase.maintain_partitions_use_case import MaintainPartitionsUseCase
+from app.task.domain.job import BackgroundJob
+
+
+class PartitionMaintenanceJob(BackgroundJob):
+    name = "maintain_partitions"
+    MAINTENANCE_INTERVAL_SECONDS = 6 * 60 * 60
+
+    def __init__(self, maintain_partitions_use_case: MaintainPartitionsUseCase, logger: Logger):
+        self._maintain_partitions_use_case = maintain_partitions_use_case
+        self._logger = logger.create_child(__name__)
+
+    def apply_channel(self, channel_name: str, bot_name: str):
+        pass
+
+    async def run(self):
+        while True:
+            try:
+                result = await asyncio.to_thread(self._maintain_partitions_use_case.handle, datetime.now(UTC))
+                for partition in result.created:
+                    self._logger.log_info(f"Создана партиция {partition.partition_name}")
+                for partition in result.archived:
+                    self._logger.log_info(f"Партиция {partition.partition_name} выгружена в архив и удалена")
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self._logger.log_exception("Ошибка обслуживания партиций", e)
+
+            await asyncio.sleep(self.MAINTENANCE_INTERVAL_SECONDS)
@@ -0,0 +1,9 @@
+from dataclasses import dataclass, field
+
+from app.retention.domain.model.partition import TablePartition
+
+
+@dataclass
+class PartitionMaintenanceResult:
+    created: list[TablePartition] = field(default_factory=list)
+    archived: list[TablePartition] = field(default_factory=list)
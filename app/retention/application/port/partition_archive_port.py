@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+from typing import BinaryIO
+
+from app.retention.domain.model.partition import TablePartition
+
+
+class PartitionArchivePort(ABC):
+    @abstractmethod
+    def open(self, partition: TablePartition) -> AbstractContextManager[BinaryIO]: ...
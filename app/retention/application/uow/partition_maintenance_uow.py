@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+from app.common.application.unit_of_work import UnitOfWork, UnitOfWorkFactory
+from app.retention.domain.repo import PartitionRepository
+
+
+class PartitionMaintenanceUnitOfWork(UnitOfWork, Protocol):
+    @property
+    def partition_repo(self) -> PartitionRepository: ...
+
+
+class PartitionMaintenanceUnitOfWorkFactory(UnitOfWorkFactory[PartitionMaintenanceUnitOfWork], Protocol):
+    pass
@@ -0,0 +1,53 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from app.retention.application.model.partition_maintenance_result import PartitionMaintenanceResult
+from app.retention.application.port.partition_archive_port import PartitionArchivePort
+from app.retention.application.uow.partition_maintenance_uow import PartitionMaintenanceUnitOfWorkFactory
+from app.retention.domain.model.partition import add_months, month_start
+
+
+class MaintainPartitionsUseCase:
+    def __init__(
+        self,
+        partition_maintenance_uow: PartitionMaintenanceUnitOfWorkFactory,
+        partition_archive: PartitionArchivePort,
+        table_names: Sequence[str],
+        months_ahead: int,
+        retention_months: int,
+    ):
+        self._partition_maintenance_uow = partition_maintenance_uow
+        self._partition_archive = partition_archive
+        self._table_names = table_names
+        self._months_ahead = months_ahead
+        self._retention_months = retention_months
+
+    def handle(self, current_time: datetime) -> PartitionMaintenanceResult:
+        result = PartitionMaintenanceResult()
+        current_month = month_start(current_time)
+
+        with self._partition_maintenance_uow.create() as uow:
+            for table_name in self._table_names:
+                for offset in range(self._months_ahead + 1):
+                    partition = uow.partition_repo.ensure_month_partition(table_name, add_months(current_month, offset))
+                    if partition:
+                        result.created.append(partition)
+
+        if self._retention_months <= 0:
+            return result
+
+        cutoff = add_months(current_month, -self._retention_months)
+        for table_name in self._table_names:
+            with self._partition_maintenance_uow.create() as uow:
+                partitions = uow.partition_repo.list_partitions(table_name)
+
+            for partition in partitions:
+                if partition.range_end > cutoff:
+                    continue
+                with self._partition_maintenance_uow.create() as uow:
+                    with self._partition_archive.open(partition) as target:
+                        uow.partition_repo.export_partition(partition, target)
+                    uow.partition_repo.drop_partition(partition)
+                result.archived.append(partition)
+
+        return result
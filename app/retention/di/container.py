@@ -0,0 +1,40 @@
+from sqlalchemy.orm import Session
+
+from app.chat.infrastructure.db.chat_message import ChatMessage
+from app.core.common.session.session_scoped_factory import SessionScopedFactory
+from app.core.config.domain.model.db import DatabaseConfig
+from app.economy.infrastructure.db.transaction_history import TransactionHistory
+from app.retention.application.port.partition_archive_port import PartitionArchivePort
+from app.retention.application.usecase.maintain_partitions_use_case import MaintainPartitionsUseCase
+from app.retention.domain.repo import PartitionRepository
+from app.retention.infrastructure.archive.gzip_partition_archive import GzipPartitionArchive
+from app.retention.infrastructure.partition_repository import PartitionRepositoryImpl
+from app.retention.infrastructure.uow.partition_maintenance_uow import SqlAlchemyPartitionMaintenanceUnitOfWorkFactory
+from core.types import SessionFactory
+
+PARTITIONED_TABLES = (ChatMessage.__tablename__, TransactionHistory.__tablename__)
+
+
+class RetentionContainer:
+    def __init__(self, session_factory_rw: SessionFactory, session_factory_ro: SessionFactory, db_config: DatabaseConfig):
+        self._session_factory_rw = session_factory_rw
+        self._session_factory_ro = session_factory_ro
+        self._db_config = db_config
+        self.partition_repository_factory: SessionScopedFactory[PartitionRepository] = SessionScopedFactory(self.partition_repository)
+        self.partition_archive: PartitionArchivePort = GzipPartitionArchive(db_config.partition_archive_dir)
+
+    def partition_repository(self, session: Session) -> PartitionRepository:
+        return PartitionRepositoryImpl(session)
+
+    def maintain_partitions_use_case(self) -> MaintainPartitionsUseCase:
+        return MaintainPartitionsUseCase(
+            partition_maintenance_uow=SqlAlchemyPartitionMaintenanceUnitOfWorkFactory(
+                session_factory_rw=self._session_factory_rw,
+                session_factory_ro=self._session_factory_ro,
+                partition_repository_factory=self.partition_repository_factory,
+            ),
+            partition_archive=self.partition_archive,
+            table_names=PARTITIONED_TABLES,
+            months_ahead=self._db_config.partition_months_ahead,
+            retention_months=self._db_config.partition_retention_months,
+        )
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class TablePartition:
+    table_name: str
+    partition_name: str
+    range_start: datetime
+    range_end: datetime
+
+
+def month_start(moment: datetime) -> datetime:
+    return moment.replace(tzinfo=None, day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
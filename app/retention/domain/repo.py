@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import BinaryIO
+
+from app.retention.domain.model.partition import TablePartition
+
+
+class PartitionRepository(ABC):
+    @abstractmethod
+    def list_partitions(self, table_name: str) -> list[TablePartition]: ...
+
+    @abstractmethod
+    def ensure_month_partition(self, table_name: str, month: datetime) -> TablePartition | None: ...
+
+    @abstractmethod
+    def export_partition(self, partition: TablePartition, target: BinaryIO) -> None: ...
+
+    @abstractmethod
+    def drop_partition(self, partition: TablePartition) -> None: ...
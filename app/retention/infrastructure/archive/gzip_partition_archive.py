@@ -0,0 +1,27 @@
+import gzip
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO
+
+from app.retention.application.port.partition_archive_port import PartitionArchivePort
+from app.retention.domain.model.partition import TablePartition
+
+
+class GzipPartitionArchive(PartitionArchivePort):
+    def __init__(self, archive_dir: str):
+        self._archive_dir = Path(archive_dir)
+
+    @contextmanager
+    def open(self, partition: TablePartition) -> Iterator[BinaryIO]:
+        directory = self._archive_dir / partition.table_name
+        directory.mkdir(parents=True, exist_ok=True)
+        target = directory / f"{partition.partition_name}.csv.gz"
+        pending = target.with_name(f"{target.name}.part")
+        try:
+            with gzip.open(pending, "wb") as stream:
+                yield stream
+        except BaseException:
+            pending.unlink(missing_ok=True)
+            raise
+        pending.replace(target)
@@ -0,0 +1,76 @@
+import re
+from datetime import datetime
+from typing import BinaryIO
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.retention.domain.model.partition import TablePartition, add_months
+from app.retention.domain.repo import PartitionRepository
+from core.db import disable_statement_timeout
+
+MONTH_SUFFIX = re.compile(r"_p(\d{4})_(\d{2})$")
+
+
+class PartitionRepositoryImpl(PartitionRepository):
+    def __init__(self, db: Session):
+        self._db = db
+
+    def _to_partition(self, table_name: str, month: datetime) -> TablePartition:
+        return TablePartition(
+            table_name=table_name,
+            partition_name=f"{table_name}_p{month:%Y_%m}",
+            range_start=month,
+            range_end=add_months(month, 1),
+        )
+
+    def list_partitions(self, table_name: str) -> list[TablePartition]:
+        stmt = text(
+            "SELECT child.relname FROM pg_inherits JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(:table_name) ORDER BY child.relname"
+        )
+        partitions = []
+        for name in self._db.execute(stmt, {"table_name": table_name}).scalars():
+            match = MONTH_SUFFIX.search(name)
+            if match and name == f"{table_name}{match.group(0)}":
+                partitions.append(self._to_partition(table_name, datetime(int(match.group(1)), int(match.group(2)), 1)))
+        return partitions
+
+    def ensure_month_partition(self, table_name: str, month: datetime) -> TablePartition | None:
+        partition = self._to_partition(table_name, month)
+        exists = self._db.execute(text("SELECT to_regclass(:name)"), {"name": partition.partition_name}).scalar()
+        if exists:
+            return None
+        bounds = f"FOR VALUES FROM ('{partition.range_start:%Y-%m-%d}') TO ('{partition.range_end:%Y-%m-%d}')"
+        default_partition = f"{table_name}_default"
+        has_default_rows = self._db.execute(
+            text(f"SELECT EXISTS (SELECT 1 FROM {default_partition} WHERE created_at >= :range_start AND created_at < :range_end)"),
+            {"range_start": partition.range_start, "range_end": partition.range_end},
+        ).scalar()
+        if not has_default_rows:
+            self._db.execute(text(f"CREATE TABLE {partition.partition_name} PARTITION OF {table_name} {bounds}"))
+            return partition
+
+        disable_statement_timeout(self._db)
+        self._db.execute(text(f"CREATE TABLE {partition.partition_name} (LIKE {table_name} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+        self._db.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {default_partition} WHERE created_at >= :range_start AND created_at < :range_end "
+                f"RETURNING *) INSERT INTO {partition.partition_name} SELECT * FROM moved"
+            ),
+            {"range_start": partition.range_start, "range_end": partition.range_end},
+        )
+        self._db.execute(text(f"ALTER TABLE {table_name} ATTACH PARTITION {partition.partition_name} {bounds}"))
+        return partition
+
+    def export_partition(self, partition: TablePartition, target: BinaryIO) -> None:
+        disable_statement_timeout(self._db)
+        cursor = self._db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {partition.partition_name} TO STDOUT WITH (FORMAT csv, HEADER)", target)
+        finally:
+            cursor.close()
+
+    def drop_partition(self, partition: TablePartition) -> None:
+        self._db.execute(text(f"ALTER TABLE {partition.table_name} DETACH PARTITION {partition.partition_name}"))
+        self._db.execute(text(f"DROP TABLE {partition.partition_name}"))
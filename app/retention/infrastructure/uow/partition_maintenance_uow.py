@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from sqlalchemy.orm import Session
+
+from app.common.infrastructure.sqlalchemy_uow import SqlAlchemyUnitOfWorkBase, SqlAlchemyUnitOfWorkFactory
+from app.core.common.session.session_scoped_factory import SessionScopedFactory
+from app.retention.application.uow.partition_maintenance_uow import PartitionMaintenanceUnitOfWork, PartitionMaintenanceUnitOfWorkFactory
+from app.retention.domain.repo import PartitionRepository
+from core.types import SessionFactory
+
+
+class SqlAlchemyPartitionMaintenanceUnitOfWork(SqlAlchemyUnitOfWorkBase, PartitionMaintenanceUnitOfWork):
+    def __init__(self, session: Session, partition_repo: PartitionRepository, read_only: bool):
+        super().__init__(session=session, read_only=read_only)
+        self._partition_repo = partition_repo
+
+    @property
+    def partition_repo(self) -> PartitionRepository:
+        return self._partition_repo
+
+
+class SqlAlchemyPartitionMaintenanceUnitOfWorkFactory(
+    SqlAlchemyUnitOfWorkFactory[PartitionMaintenanceUnitOfWork], PartitionMaintenanceUnitOfWorkFactory
+):
+    def __init__(
+        self,
+        session_factory_rw: SessionFactory,
+        session_factory_ro: SessionFactory,
+        partition_repository_factory: SessionScopedFactory[PartitionRepository],
+    ):
+        super().__init__(
+            session_factory_rw=session_factory_rw,
+            session_factory_ro=session_factory_ro,
+            builder=self._build_uow,
+        )
+        self._partition_repository_factory = partition_repository_factory
+
+    def _build_uow(self, db: Session, read_only: bool) -> PartitionMaintenanceUnitOfWork:
+        return SqlAlchemyPartitionMaintenanceUnitOfWork(
+            session=db,
+            partition_repo=self._partition_repository_factory.get(db),
+            read_only=read_only,
+        )
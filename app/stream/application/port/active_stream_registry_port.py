@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+from app.stream.domain.model.info import StreamInfo
+
+
+class ActiveStreamRegistryPort(ABC):
+    @abstractmethod
+    def is_loaded(self, channel_name: str) -> bool: ...
+
+    @abstractmethod
+    def get(self, channel_name: str) -> StreamInfo | None: ...
+
+    @abstractmethod
+    def set(self, channel_name: str, stream: StreamInfo | None) -> None: ...
+
+    @abstractmethod
+    def invalidate(self, channel_name: str) -> None: ...
@@ -3,11 +3,9 @@ from __future__ import annotations
 from typing import Protocol
 
 from app.ai.gen.conversation.domain.conversation_service import ConversationService
-from app.battle.application.usecase.battle_use_case import BattleUseCase
-from app.chat.application.usecase.chat_use_case import ChatUseCase
 from app.common.application.unit_of_work import UnitOfWork, UnitOfWorkFactory
 from app.economy.domain.economy_policy import EconomyPolicy
-from app.stream.domain.repo import StreamRepository
+from app.stream.domain.repo import StreamRepository, StreamStatisticsRepository
 from app.viewer.session.domain.repository import ViewerRepository
 
 
@@ -19,14 +17,11 @@ class StreamStatusUnitOfWork(UnitOfWork, Protocol):
     def viewer_repository(self) -> ViewerRepository: ...
 
     @property
-    def battle_use_case(self) -> BattleUseCase: ...
+    def stream_statistics_repository(self) -> StreamStatisticsRepository: ...
 
     @property
     def economy_policy(self) -> EconomyPolicy: ...
 
-    @property
-    def chat_use_case(self) -> ChatUseCase: ...
-
     @property
     def conversation_service(self) -> ConversationService: ...
 
@@ -1,15 +1,24 @@
 from app.core.logger.domain.logger import Logger
 from app.minigame.domain.minigame_repository import MinigameRepository
+from app.stream.application.port.active_stream_registry_port import ActiveStreamRegistryPort
 from app.stream.application.uow.restore_stream_context_uow import RestoreStreamContextUnitOfWorkFactory
 
 
 class HandleRestoreStreamContextUseCase:
-    def __init__(self, restore_stream_uow: RestoreStreamContextUnitOfWorkFactory, minigame_repository: MinigameRepository, logger: Logger):
+    def __init__(
+        self,
+        restore_stream_uow: RestoreStreamContextUnitOfWorkFactory,
+        minigame_repository: MinigameRepository,
+        active_stream_registry: ActiveStreamRegistryPort,
+        logger: Logger,
+    ):
         self._restore_stream_uow = restore_stream_uow
         self._minigame_repository = minigame_repository
+        self._active_stream_registry = active_stream_registry
         self.logger = logger.create_child(__name__)
 
     def handle(self, channel_name: str) -> None:
+        self._active_stream_registry.invalidate(channel_name)
         with self._restore_stream_uow.create(read_only=True) as uow:
             active_stream = uow.stream_repository.get_active_stream(channel_name)
 
@@ -1,14 +1,16 @@
-from collections import Counter
+from dataclasses import replace
 from datetime import UTC, datetime
 
 from app.ai.gen.llm.application.usecase.generate_response_use_case import GenerateResponseUseCase
-from app.chat.application.model.chat_summary_state import ChatSummaryState
+from app.chat.application.port.chat_transcript_sink_port import ChatTranscriptSinkPort
+from app.chat.application.usecase.incremental_chat_summary_use_case import IncrementalChatSummaryUseCase
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
 from app.core.logger.domain.logger import Logger
-from app.economy.domain.models import TransactionType
+from app.economy.domain.models import LedgerEntry, TransactionType
 from app.minigame.domain.minigame_repository import MinigameRepository
 from app.notification.domain.repository import NotificationRepository
 from app.platform.domain.repository import PlatformRepository
+from app.stream.application.port.active_stream_registry_port import ActiveStreamRegistryPort
 from app.stream.application.uow.stream_status_uow import StreamStatusUnitOfWorkFactory
 from app.stream.domain.model.info import StreamInfo
 from app.stream.domain.model.stat import StreamStatistics
@@ -22,22 +24,26 @@ class HandleStreamStatusUseCase:
         user_cache: ViewerCachePort,
         platform_repository: PlatformRepository,
         stream_status_uow: StreamStatusUnitOfWorkFactory,
+        active_stream_registry: ActiveStreamRegistryPort,
         minigame_repository: MinigameRepository,
         notification_repository: NotificationRepository,
         notification_group_id: int,
         generate_response_use_case_factory: SessionScopedFactory[GenerateResponseUseCase],
-        state: ChatSummaryState,
+        incremental_chat_summary_use_case: IncrementalChatSummaryUseCase,
+        chat_transcript_sink: ChatTranscriptSinkPort,
         session_ro_factory: SessionFactory,
         logger: Logger,
     ):
         self._user_cache = user_cache
         self._platform_repository = platform_repository
         self._stream_status_uow = stream_status_uow
+        self._active_stream_registry = active_stream_registry
         self._minigame_repository = minigame_repository
         self._notification_repository = notification_repository
         self._notification_group_id = notification_group_id
         self._generate_response_use_case_factory = generate_response_use_case_factory
-        self._state = state
+        self._incremental_chat_summary_use_case = incremental_chat_summary_use_case
+        self._chat_transcript_sink = chat_transcript_sink
         self._session_ro = session_ro_factory
         self._logger = logger.create_child(__name__)
 
@@ -71,17 +77,26 @@ class HandleStreamStatusUseCase:
             if active_stream.game_name != game_name or active_stream.title != title:
                 with self._stream_status_uow.create() as uow:
                     uow.stream_repository.update_stream_metadata(active_stream.id, game_name, title)
+                self._active_stream_registry.set(
+                    channel_name,
+                    replace(
+                        active_stream,
+                        game_name=game_name if game_name is not None else active_stream.game_name,
+                        title=title if title is not None else active_stream.title,
+                    ),
+                )
                 self._logger.log_info(f"Обновлены метаданные стрима: игра='{game_name}', название='{title}'")
 
     async def _handle_stream_start(self, channel_name: str, game_name: str | None, title: str | None):
         started_at = datetime.now(UTC)
         try:
             with self._stream_status_uow.create() as uow:
-                uow.stream_repository.start_new_stream(channel_name, started_at, game_name, title)
+                active_stream = uow.stream_repository.start_new_stream(channel_name, started_at, game_name, title)
+            self._active_stream_registry.set(channel_name, active_stream)
             self._minigame_repository.set_stream_start_time(channel_name, started_at)
             self._logger.log_info(f"handle stream start for {channel_name}: {started_at}")
             await self._stream_announcement(channel_name, game_name, title)
-            self._state.current_stream_summaries = []
+            self._incremental_chat_summary_use_case.reset(channel_name)
         except Exception as e:
             self._logger.log_exception("Ошибка при создании стрима:", e)
 
@@ -91,31 +106,18 @@ class HandleStreamStatusUseCase:
         with self._stream_status_uow.create() as uow:
             uow.stream_repository.end_stream(active_stream.id, finish_time)
 
-            active_sessions = uow.viewer_repository.get_active_sessions(active_stream.id)
-
-            for session in active_sessions:
-                session_duration = finish_time - session.session_start
-                session_minutes = int(session_duration.total_seconds() / 60)
-                total_minutes = session.total_minutes + session_minutes
-                uow.viewer_repository.finish_session(active_stream.id, session.channel_name, session.user_name, total_minutes, finish_time)
-
+            uow.viewer_repository.finish_sessions(active_stream.id, finish_time)
             total_viewers = uow.viewer_repository.get_unique_viewers_count(active_stream.id)
             uow.stream_repository.update_stream_total_viewers(active_stream.id, total_viewers)
             self._logger.log_info(f"Стрим завершен в БД: ID {active_stream.id}")
 
-        self._minigame_repository.reset_stream_state(channel_name)
+        self._active_stream_registry.set(channel_name, None)
 
-        with self._stream_status_uow.create(read_only=True) as uow:
-            battles = uow.battle_use_case.get_battles(channel_name, active_stream.started_at)
+        self._minigame_repository.reset_stream_state(channel_name)
 
+        await self._chat_transcript_sink.drain()
         with self._stream_status_uow.create(read_only=True) as uow:
-            chat_messages = uow.chat_use_case.get_chat_messages(
-                channel_name=channel_name,
-                from_time=active_stream.started_at,
-                to_time=finish_time,
-            )
-
-        stats = self._build_stream_statistics(chat_messages, battles)
+            stats = uow.stream_statistics_repository.get_stream_statistics(channel_name, active_stream.started_at, finish_time)
 
         try:
             await self._stream_summarize(
@@ -127,19 +129,6 @@ class HandleStreamStatusUseCase:
         except Exception as e:
             self._logger.log_exception("Ошибка при вызове stream_summarize:", e)
 
-    @staticmethod
-    def _build_stream_statistics(chat_messages, battles) -> StreamStatistics:
-        total_messages = len(chat_messages)
-        unique_users = len(set(msg.user_name for msg in chat_messages))
-        user_counts = Counter(msg.user_name for msg in chat_messages)
-        top_user = user_counts.most_common(1)[0][0] if user_counts else None
-
-        total_battles = len(battles)
-        winner_counts = Counter(b.winner for b in battles)
-        top_winner = winner_counts.most_common(1)[0][0] if battles else None
-
-        return StreamStatistics(total_messages, unique_users, top_user, total_battles, top_winner)
-
     async def _stream_announcement(self, channel_name: str, game_name: str | None, title: str | None):
         prompt = (
             f"Начался стрим. Категория: {game_name}, название: {title}. "
@@ -156,26 +145,9 @@ class HandleStreamStatusUseCase:
     async def _stream_summarize(self, stream_stat: StreamStatistics, channel_name: str, stream_start_dt, stream_end_dt):
         self._logger.log_info("Создание итогового отчёта о стриме")
 
-        if self._state.last_chat_summary_time is None:
-            self._state.last_chat_summary_time = stream_start_dt
-
-        with self._stream_status_uow.create(read_only=True) as uow:
-            last_messages = uow.chat_use_case.get_chat_messages(
-                channel_name=channel_name,
-                from_time=self._state.last_chat_summary_time,
-                to_time=stream_end_dt,
-            )
-
-        if last_messages:
-            chat_text = "\n".join(f"{m.user_name}: {m.content}" for m in last_messages)
-            prompt = (
-                f"Основываясь на сообщения в чате, подведи краткий итог общения в виде тезисов, без нумерации. Для отчёта. "
-                f"Зафиксируй наиболее смешные и наиболее важные моменты, которые обсуждались в чате. Желательно с никнеймами."
-                f"Вот сообщения: {chat_text}"
-            )
-            with self._session_ro() as session:
-                result = await self._generate_response_use_case_factory.get(session).generate_response(prompt, channel_name)
-            self._state.current_stream_summaries.append(result)
+        current_stream_summaries = await self._incremental_chat_summary_use_case.summarize_new(
+            channel_name, stream_start_dt, stream_end_dt, force=True
+        )
 
         duration = stream_end_dt - stream_start_dt
         hours, remainder = divmod(int(duration.total_seconds()), 3600)
@@ -193,12 +165,16 @@ class HandleStreamStatusUseCase:
         if stream_stat.top_user and stream_stat.top_user != "нет":
             reward_amount = 200
             with self._stream_status_uow.create() as uow:
-                uow.economy_policy.add_balance(
-                    channel_name=channel_name,
-                    user_name=stream_stat.top_user,
-                    amount=reward_amount,
-                    transaction_type=TransactionType.SPECIAL_EVENT,
-                    description="Награда за самую высокую активность в стриме",
+                uow.economy_policy.post_many(
+                    [
+                        LedgerEntry(
+                            channel_name=channel_name,
+                            user_name=stream_stat.top_user,
+                            amount=reward_amount,
+                            transaction_type=TransactionType.SPECIAL_EVENT,
+                            description="Награда за самую высокую активность в стриме",
+                        )
+                    ]
                 )
                 stream_stat_message += f"{stream_stat.top_user} получает награду {reward_amount} монет за активность!"
 
@@ -206,8 +182,8 @@ class HandleStreamStatusUseCase:
 
         prompt = f"Трансляция была завершена. Статистика:\n{stream_stat_message}"
 
-        if self._state.current_stream_summaries:
-            summary_text = "\n".join(self._state.current_stream_summaries)
+        if current_stream_summaries:
+            summary_text = "\n".join(current_stream_summaries)
             prompt += f"\n\nВыжимки из того, что происходило: {summary_text}"
 
         prompt += "\n\nНа основе предоставленной информации подведи краткий итог трансляции. По возможности с никнеймами."
@@ -217,7 +193,6 @@ class HandleStreamStatusUseCase:
         with self._stream_status_uow.create() as uow:
             uow.conversation_service.save_conversation_to_db(channel_name, prompt, result)
 
-        self._state.current_stream_summaries = []
-        self._state.last_chat_summary_time = None
+        self._incremental_chat_summary_use_case.reset(channel_name)
 
         await self._notification_repository.send_notification(chat_id=self._notification_group_id, text=result)
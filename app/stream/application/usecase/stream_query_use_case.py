@@ -1,6 +1,7 @@
 from datetime import UTC, datetime
 
 from app.chat.domain.repo import ChatRepository
+from app.common.domain.keyset import KeysetCursor, Page
 from app.stream.domain.model.detail import StreamDetail
 from app.stream.domain.model.info import StreamInfo
 from app.stream.domain.repo import StreamRepository
@@ -11,8 +12,8 @@ class StreamQueryUseCase:
         self._repo = repo
         self._chat_repository = chat_repository
 
-    def get_streams(self, skip: int, limit: int) -> tuple[list[StreamInfo], int]:
-        return self._repo.list_streams(skip, limit)
+    def get_streams(self, cursor: KeysetCursor | None, limit: int) -> Page[StreamInfo]:
+        return self._repo.list_streams(cursor, limit)
 
     def get_stream_detail(self, stream_id: int) -> StreamDetail | None:
         result = self._repo.get_stream_with_sessions(stream_id)
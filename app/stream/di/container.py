@@ -1,20 +1,40 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.chat.domain.repo import ChatRepository
 from app.chat.infrastructure.chat_repository import ChatRepositoryImpl
+from app.core.common.session.async_session_scoped_factory import AsyncSessionScopedFactory
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
+from app.stream.application.port.active_stream_registry_port import ActiveStreamRegistryPort
 from app.stream.application.usecase.stream_query_use_case import StreamQueryUseCase
-from app.stream.domain.repo import StreamRepository
+from app.stream.domain.repo import AsyncStreamRepository, StreamRepository, StreamStatisticsRepository
+from app.stream.infrastructure.async_stream_repository import AsyncStreamRepositoryImpl
+from app.stream.infrastructure.cache.active_stream_registry import ActiveStreamRegistry
+from app.stream.infrastructure.cached_stream_repository import CachedAsyncStreamRepository, CachedStreamRepository
 from app.stream.infrastructure.stream_repository import StreamRepositoryImpl
+from app.stream.infrastructure.stream_statistics_repository import StreamStatisticsRepositoryImpl
 
 
 class StreamContainer:
     def __init__(self):
+        self.active_stream_registry: ActiveStreamRegistryPort = ActiveStreamRegistry()
         self.stream_repository_factory: SessionScopedFactory[StreamRepository] = SessionScopedFactory(self._stream_repository)
+        self.async_stream_repository_factory: AsyncSessionScopedFactory[AsyncStreamRepository] = AsyncSessionScopedFactory(
+            self._async_stream_repository
+        )
         self.stream_use_case_factory: SessionScopedFactory[StreamQueryUseCase] = SessionScopedFactory(self._stream_use_case)
+        self.stream_statistics_repository_factory: SessionScopedFactory[StreamStatisticsRepository] = SessionScopedFactory(
+            self._stream_statistics_repository
+        )
 
     def _stream_repository(self, session: Session) -> StreamRepository:
-        return StreamRepositoryImpl(session)
+        return CachedStreamRepository(StreamRepositoryImpl(session), self.active_stream_registry)
+
+    def _async_stream_repository(self, session: AsyncSession) -> AsyncStreamRepository:
+        return CachedAsyncStreamRepository(AsyncStreamRepositoryImpl(session), self.active_stream_registry)
+
+    def _stream_statistics_repository(self, session: Session) -> StreamStatisticsRepository:
+        return StreamStatisticsRepositoryImpl(session)
 
     def _stream_use_case(self, session: Session) -> StreamQueryUseCase:
         stream_repository = self._stream_repository(session)
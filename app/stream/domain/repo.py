@@ -1,12 +1,14 @@
 from datetime import datetime
 from typing import Protocol
 
+from app.common.domain.keyset import KeysetCursor, Page
 from app.stream.domain.model.info import StreamInfo
 from app.stream.domain.model.session import StreamViewerSessionInfo
+from app.stream.domain.model.stat import StreamStatistics
 
 
 class StreamRepository(Protocol):
-    def start_new_stream(self, channel_name: str, started_at: datetime, game_name: str | None, title: str | None) -> None: ...
+    def start_new_stream(self, channel_name: str, started_at: datetime, game_name: str | None, title: str | None) -> StreamInfo: ...
 
     def get_active_stream(self, channel_name: str) -> StreamInfo | None: ...
 
@@ -18,6 +20,16 @@ class StreamRepository(Protocol):
 
     def update_max_concurrent_viewers_count(self, active_stream_id: int, viewers_count: int) -> None: ...
 
-    def list_streams(self, skip: int, limit: int) -> tuple[list[StreamInfo], int]: ...
+    def list_streams(self, cursor: KeysetCursor | None, limit: int) -> Page[StreamInfo]: ...
 
     def get_stream_with_sessions(self, stream_id: int) -> tuple[StreamInfo, list[StreamViewerSessionInfo]] | None: ...
+
+
+class StreamStatisticsRepository(Protocol):
+    def get_stream_statistics(self, channel_name: str, started_at: datetime, finished_at: datetime) -> StreamStatistics: ...
+
+
+class AsyncStreamRepository(Protocol):
+    async def get_active_stream(self, channel_name: str) -> StreamInfo | None: ...
+
+    async def update_max_concurrent_viewers_count(self, active_stream_id: int, viewers_count: int) -> None: ...
@@ -0,0 +1,28 @@
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.stream.domain.model.info import StreamInfo
+from app.stream.domain.repo import AsyncStreamRepository
+from app.stream.infrastructure.db.stream import Stream
+from app.stream.infrastructure.mappers.stream_mapper import map_stream_row
+
+
+class AsyncStreamRepositoryImpl(AsyncStreamRepository):
+    def __init__(self, db: AsyncSession):
+        self._db = db
+
+    async def get_active_stream(self, channel_name: str) -> StreamInfo | None:
+        stmt = select(Stream).where(Stream.channel_name == channel_name).where(Stream.is_active)
+        row = (await self._db.execute(stmt)).scalars().first()
+        if not row:
+            return None
+        return map_stream_row(row)
+
+    async def update_max_concurrent_viewers_count(self, active_stream_id: int, viewers_count: int) -> None:
+        stmt = (
+            update(Stream)
+            .where(Stream.id == active_stream_id)
+            .values(max_concurrent_viewers=viewers_count)
+            .execution_options(synchronize_session=False)
+        )
+        await self._db.execute(stmt)
@@ -0,0 +1,19 @@
+from app.stream.application.port.active_stream_registry_port import ActiveStreamRegistryPort
+from app.stream.domain.model.info import StreamInfo
+
+
+class ActiveStreamRegistry(ActiveStreamRegistryPort):
+    def __init__(self):
+        self._streams: dict[str, StreamInfo | None] = {}
+
+    def is_loaded(self, channel_name: str) -> bool:
+        return channel_name in self._streams
+
+    def get(self, channel_name: str) -> StreamInfo | None:
+        return self._streams.get(channel_name)
+
+    def set(self, channel_name: str, stream: StreamInfo | None) -> None:
+        self._streams[channel_name] = stream
+
+    def invalidate(self, channel_name: str) -> None:
+        self._streams.pop(channel_name, None)
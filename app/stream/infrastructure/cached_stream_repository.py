@@ -0,0 +1,57 @@
+from datetime import datetime
+
+from app.common.domain.keyset import KeysetCursor, Page
+from app.stream.application.port.active_stream_registry_port import ActiveStreamRegistryPort
+from app.stream.domain.model.info import StreamInfo
+from app.stream.domain.model.session import StreamViewerSessionInfo
+from app.stream.domain.repo import AsyncStreamRepository, StreamRepository
+
+
+class CachedStreamRepository(StreamRepository):
+    def __init__(self, delegate: StreamRepository, active_stream_registry: ActiveStreamRegistryPort):
+        self._delegate = delegate
+        self._active_stream_registry = active_stream_registry
+
+    def start_new_stream(self, channel_name: str, started_at: datetime, game_name: str | None, title: str | None) -> StreamInfo:
+        return self._delegate.start_new_stream(channel_name, started_at, game_name, title)
+
+    def get_active_stream(self, channel_name: str) -> StreamInfo | None:
+        if self._active_stream_registry.is_loaded(channel_name):
+            return self._active_stream_registry.get(channel_name)
+        active_stream = self._delegate.get_active_stream(channel_name)
+        self._active_stream_registry.set(channel_name, active_stream)
+        return active_stream
+
+    def end_stream(self, active_stream_id: int, finish_time: datetime) -> None:
+        self._delegate.end_stream(active_stream_id, finish_time)
+
+    def update_stream_total_viewers(self, stream_id: int, total_viewers: int) -> None:
+        self._delegate.update_stream_total_viewers(stream_id, total_viewers)
+
+    def update_stream_metadata(self, stream_id: int, game_name: str | None, title: str | None) -> None:
+        self._delegate.update_stream_metadata(stream_id, game_name, title)
+
+    def update_max_concurrent_viewers_count(self, active_stream_id: int, viewers_count: int) -> None:
+        self._delegate.update_max_concurrent_viewers_count(active_stream_id, viewers_count)
+
+    def list_streams(self, cursor: KeysetCursor | None, limit: int) -> Page[StreamInfo]:
+        return self._delegate.list_streams(cursor, limit)
+
+    def get_stream_with_sessions(self, stream_id: int) -> tuple[StreamInfo, list[StreamViewerSessionInfo]] | None:
+        return self._delegate.get_stream_with_sessions(stream_id)
+
+
+class CachedAsyncStreamRepository(AsyncStreamRepository):
+    def __init__(self, delegate: AsyncStreamRepository, active_stream_registry: ActiveStreamRegistryPort):
+        self._delegate = delegate
+        self._active_stream_registry = active_stream_registry
+
+    async def get_active_stream(self, channel_name: str) -> StreamInfo | None:
+        if self._active_stream_registry.is_loaded(channel_name):
+            return self._active_stream_registry.get(channel_name)
+        active_stream = await self._delegate.get_active_stream(channel_name)
+        self._active_stream_registry.set(channel_name, active_stream)
+        return active_stream
+
+    async def update_max_concurrent_viewers_count(self, active_stream_id: int, viewers_count: int) -> None:
+        await self._delegate.update_max_concurrent_viewers_count(active_stream_id, viewers_count)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.db import Base
@@ -8,6 +8,10 @@ from core.db import Base
 
 class Stream(Base):
     __tablename__ = "stream"
+    __table_args__ = (
+        Index("uq_stream_active_channel", "channel_name", unique=True, postgresql_where=text("is_active")),
+        Index("ix_stream_started_at", "started_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, nullable=False)
     channel_name: Mapped[str] = mapped_column(String, nullable=False)
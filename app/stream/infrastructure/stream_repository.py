@@ -1,8 +1,10 @@
 from datetime import datetime
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import desc, select
 from sqlalchemy.orm import Session
 
+from app.common.domain.keyset import KeysetCursor, Page
+from app.common.infrastructure.keyset import keyset_before
 from app.stream.domain.model.info import StreamInfo
 from app.stream.domain.model.session import StreamViewerSessionInfo
 from app.stream.domain.repo import StreamRepository
@@ -15,13 +17,15 @@ class StreamRepositoryImpl(StreamRepository):
     def __init__(self, db: Session):
         self._db = db
 
-    def start_new_stream(self, channel_name: str, started_at: datetime, game_name: str | None, title: str | None) -> None:
+    def start_new_stream(self, channel_name: str, started_at: datetime, game_name: str | None, title: str | None) -> StreamInfo:
         started_at_naive = started_at.replace(tzinfo=None)
         stream = Stream(channel_name=channel_name, started_at=started_at_naive, game_name=game_name, title=title, is_active=True)
         self._db.add(stream)
+        self._db.flush()
+        return map_stream_row(stream)
 
     def get_active_stream(self, channel_name: str) -> StreamInfo | None:
-        stmt = select(Stream).where(Stream.channel_name == channel_name).where(Stream.is_active.is_(True))
+        stmt = select(Stream).where(Stream.channel_name == channel_name).where(Stream.is_active)
         row = self._db.execute(stmt).scalars().first()
         if not row:
             return None
@@ -61,16 +65,12 @@ class StreamRepositoryImpl(StreamRepository):
             return
         stream.max_concurrent_viewers = viewers_count
 
-    def list_streams(self, skip: int, limit: int) -> tuple[list[StreamInfo], int]:
-        base_stmt = select(Stream)
-        count_stmt = select(func.count()).select_from(Stream)
-
-        total = self._db.execute(count_stmt).scalar_one()
-
-        stmt = base_stmt.order_by(Stream.started_at.desc()).offset(skip).limit(limit)
-        streams = self._db.execute(stmt).scalars().all()
-        items = [map_stream_row(row) for row in streams]
-        return items, total
+    def list_streams(self, cursor: KeysetCursor | None, limit: int) -> Page[StreamInfo]:
+        stmt = select(Stream).order_by(Stream.started_at.desc(), Stream.id.desc()).limit(limit + 1)
+        if cursor is not None:
+            stmt = stmt.where(keyset_before(Stream.started_at, Stream.id, cursor))
+        rows = [map_stream_row(row) for row in self._db.execute(stmt).scalars().all()]
+        return Page.from_rows(rows, limit, lambda stream: KeysetCursor(at=stream.started_at, id=stream.id))
 
     def get_stream_with_sessions(self, stream_id: int) -> tuple[StreamInfo, list[StreamViewerSessionInfo]] | None:
         stream_stmt = select(Stream).where(Stream.id == stream_id)
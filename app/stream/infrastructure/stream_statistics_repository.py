@@ -0,0 +1,57 @@
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.battle.infrastructure.db.battle_history import BattleHistory
+from app.chat.infrastructure.db.chat_message import ChatMessage
+from app.stream.domain.model.stat import StreamStatistics
+from app.stream.domain.repo import StreamStatisticsRepository
+
+
+class StreamStatisticsRepositoryImpl(StreamStatisticsRepository):
+    def __init__(self, db: Session):
+        self._db = db
+
+    def get_stream_statistics(self, channel_name: str, started_at: datetime, finished_at: datetime) -> StreamStatistics:
+        started_at_naive = started_at.replace(tzinfo=None)
+        finished_at_naive = finished_at.replace(tzinfo=None)
+
+        chatters = (
+            select(
+                ChatMessage.user_name,
+                func.count().label("messages"),
+                func.min(ChatMessage.created_at).label("first_message_at"),
+            )
+            .where(ChatMessage.channel_name == channel_name)
+            .where(ChatMessage.created_at >= started_at_naive)
+            .where(ChatMessage.created_at < finished_at_naive)
+            .group_by(ChatMessage.user_name)
+            .cte("chatters")
+        )
+        top_user = select(chatters.c.user_name).order_by(chatters.c.messages.desc(), chatters.c.first_message_at).limit(1).scalar_subquery()
+        chat_stmt = select(func.coalesce(func.sum(chatters.c.messages), 0), func.count(), top_user).select_from(chatters)
+        total_messages, unique_users, top_user_name = self._db.execute(chat_stmt).one()
+
+        winners = (
+            select(
+                BattleHistory.winner,
+                func.count().label("wins"),
+                func.min(BattleHistory.created_at).label("first_win_at"),
+            )
+            .where(BattleHistory.channel_name == channel_name)
+            .where(BattleHistory.created_at >= started_at_naive)
+            .group_by(BattleHistory.winner)
+            .cte("winners")
+        )
+        top_winner = select(winners.c.winner).order_by(winners.c.wins.desc(), winners.c.first_win_at).limit(1).scalar_subquery()
+        battle_stmt = select(func.coalesce(func.sum(winners.c.wins), 0), top_winner).select_from(winners)
+        total_battles, top_winner_name = self._db.execute(battle_stmt).one()
+
+        return StreamStatistics(
+            total_messages=int(total_messages),
+            unique_users=unique_users,
+            top_user=top_user_name,
+            total_battles=int(total_battles),
+            top_winner=top_winner_name,
+        )
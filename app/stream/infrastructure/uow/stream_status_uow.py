@@ -3,13 +3,11 @@ from __future__ import annotations
 from sqlalchemy.orm import Session
 
 from app.ai.gen.conversation.domain.conversation_service import ConversationService
-from app.battle.application.usecase.battle_use_case import BattleUseCase
-from app.chat.application.usecase.chat_use_case import ChatUseCase
 from app.common.infrastructure.sqlalchemy_uow import SqlAlchemyUnitOfWorkBase, SqlAlchemyUnitOfWorkFactory
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
 from app.economy.domain.economy_policy import EconomyPolicy
 from app.stream.application.uow.stream_status_uow import StreamStatusUnitOfWork, StreamStatusUnitOfWorkFactory
-from app.stream.domain.repo import StreamRepository
+from app.stream.domain.repo import StreamRepository, StreamStatisticsRepository
 from app.viewer.session.domain.repository import ViewerRepository
 from core.types import SessionFactory
 
@@ -20,18 +18,16 @@ class SqlAlchemyStreamStatusUnitOfWork(SqlAlchemyUnitOfWorkBase, StreamStatusUni
         session: Session,
         stream_repository: StreamRepository,
         viewer_repository: ViewerRepository,
-        battle_use_case: BattleUseCase,
+        stream_statistics_repository: StreamStatisticsRepository,
         economy_policy: EconomyPolicy,
-        chat_use_case: ChatUseCase,
         conversation_service: ConversationService,
         read_only: bool,
     ):
         super().__init__(session=session, read_only=read_only)
         self._stream_repository = stream_repository
         self._viewer_repository = viewer_repository
-        self._battle_use_case = battle_use_case
+        self._stream_statistics_repository = stream_statistics_repository
         self._economy_policy = economy_policy
-        self._chat_use_case = chat_use_case
         self._conversation_service = conversation_service
 
     @property
@@ -43,17 +39,13 @@ class SqlAlchemyStreamStatusUnitOfWork(SqlAlchemyUnitOfWorkBase, StreamStatusUni
         return self._viewer_repository
 
     @property
-    def battle_use_case(self) -> BattleUseCase:
-        return self._battle_use_case
+    def stream_statistics_repository(self) -> StreamStatisticsRepository:
+        return self._stream_statistics_repository
 
     @property
     def economy_policy(self) -> EconomyPolicy:
         return self._economy_policy
 
-    @property
-    def chat_use_case(self) -> ChatUseCase:
-        return self._chat_use_case
-
     @property
     def conversation_service(self) -> ConversationService:
         return self._conversation_service
@@ -66,9 +58,8 @@ class SqlAlchemyStreamStatusUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[Stream
         session_factory_ro: SessionFactory,
         stream_repository_factory: SessionScopedFactory[StreamRepository],
         viewer_repository_factory: SessionScopedFactory[ViewerRepository],
-        battle_use_case: BattleUseCase,
+        stream_statistics_repository_factory: SessionScopedFactory[StreamStatisticsRepository],
         economy_policy_factory: SessionScopedFactory[EconomyPolicy],
-        chat_use_case: ChatUseCase,
         conversation_service_factory: SessionScopedFactory[ConversationService],
     ):
         super().__init__(
@@ -78,9 +69,8 @@ class SqlAlchemyStreamStatusUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[Stream
         )
         self._stream_repository_factory = stream_repository_factory
         self._viewer_repository_factory = viewer_repository_factory
-        self._battle_use_case = battle_use_case
+        self._stream_statistics_repository_factory = stream_statistics_repository_factory
         self._economy_policy_factory = economy_policy_factory
-        self._chat_use_case = chat_use_case
         self._conversation_service_factory = conversation_service_factory
 
     def _build_uow(self, db: Session, read_only: bool) -> StreamStatusUnitOfWork:
@@ -88,9 +78,8 @@ class SqlAlchemyStreamStatusUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[Stream
             session=db,
             stream_repository=self._stream_repository_factory.get(db),
             viewer_repository=self._viewer_repository_factory.get(db),
-            battle_use_case=self._battle_use_case,
+            stream_statistics_repository=self._stream_statistics_repository_factory.get(db),
             economy_policy=self._economy_policy_factory.get(db),
-            chat_use_case=self._chat_use_case,
             conversation_service=self._conversation_service_factory.get(db),
             read_only=read_only,
         )
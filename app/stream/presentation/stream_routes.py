@@ -3,9 +3,10 @@ from dataclasses import asdict
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.params import Depends
 
+from app.core.network.api.pagination import decode_cursor, encode_cursor
 from app.stream.di.container import StreamContainer
 from app.stream.presentation.stream_schemas import StreamDetailResponse, StreamListResponse, StreamResponse
-from core.db import db_ro_session
+from core.db import db_replica_session
 
 router = APIRouter()
 
@@ -16,16 +17,17 @@ def get_stream_container(request: Request) -> StreamContainer:
 
 @router.get("", summary="Список стримов", response_model=StreamListResponse)
 async def get_streams(
-    skip: int = Query(0, ge=0, description="Количество пропускаемых записей"),
+    cursor: str | None = Query(None, description="Курсор следующей страницы из предыдущего ответа"),
     limit: int = Query(20, ge=1, le=100, description="Количество записей в ответе"),
     stream_container: StreamContainer = Depends(get_stream_container),
 ) -> StreamListResponse:
+    page_cursor = decode_cursor(cursor)
     try:
-        with db_ro_session() as session:
-            items, total = stream_container.stream_use_case_factory.get(session).get_streams(skip, limit)
+        with db_replica_session() as session:
+            page = stream_container.stream_use_case_factory.get(session).get_streams(page_cursor, limit)
         return StreamListResponse(
-            items=[StreamResponse.model_validate(asdict(item)) for item in items],
-            total=total,
+            items=[StreamResponse.model_validate(asdict(item)) for item in page.items],
+            next_cursor=encode_cursor(page.next_cursor),
         )
     except HTTPException:
         raise
@@ -38,7 +40,7 @@ async def get_stream_detail(
     stream_id: int,
     stream_container: StreamContainer = Depends(get_stream_container),
 ) -> StreamDetailResponse:
-    with db_ro_session() as session:
+    with db_replica_session() as session:
         stream_details = stream_container.stream_use_case_factory.get(session).get_stream_detail(stream_id)
     if not stream_details:
         raise HTTPException(status_code=404, detail="Стрим не найден")
@@ -45,4 +45,4 @@ class StreamDetailResponse(StreamResponse):
 
 class StreamListResponse(BaseModel):
     items: list[StreamResponse] = Field(..., description="Список стримов")
-    total: int = Field(..., description="Общее количество стримов в выборке")
+    next_cursor: str | None = Field(None, description="Курсор следующей страницы (null — страниц больше нет)")
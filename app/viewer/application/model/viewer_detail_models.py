@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 
+from app.common.domain.keyset import KeysetCursor
+
 
 @dataclass(frozen=True)
 class ViewerStreamBrief:
@@ -57,3 +59,4 @@ class ViewerDetailResult:
     user_info: ViewerDetailInfo
     balance: ViewerBalanceInfo
     sessions: list[ViewerSessionDetail]
+    sessions_next_cursor: KeysetCursor | None
@@ -1,7 +1,10 @@
 from typing import Protocol
 
+from app.common.domain.keyset import KeysetCursor, Page
 from app.viewer.application.model.viewer_detail_models import ViewerSessionDetail
 
 
 class ViewerDetailSessionsPort(Protocol):
-    def get_user_sessions(self, channel_name: str, user_name: str) -> list[ViewerSessionDetail]: ...
+    def get_user_sessions(
+        self, channel_name: str, user_name: str, cursor: KeysetCursor | None, limit: int
+    ) -> Page[ViewerSessionDetail]: ...
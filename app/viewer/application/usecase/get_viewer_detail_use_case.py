@@ -1,3 +1,4 @@
+from app.common.domain.keyset import KeysetCursor
 from app.viewer.application.model.viewer_detail_models import ViewerDetailResult
 from app.viewer.application.port.viewer_detail_balance_port import ViewerDetailBalancePort
 from app.viewer.application.port.viewer_detail_info_port import ViewerDetailInfoPort
@@ -15,8 +16,13 @@ class GetViewerDetailUseCase:
         self._balance_port = balance_port
         self._sessions_port = sessions_port
 
-    def handle(self, channel_name: str, user_name: str) -> ViewerDetailResult:
+    def handle(self, channel_name: str, user_name: str, sessions_cursor: KeysetCursor | None, sessions_limit: int) -> ViewerDetailResult:
         user_info = self._info_port.get(channel_name, user_name)
         balance = self._balance_port.get_balance(channel_name, user_name)
-        sessions = self._sessions_port.get_user_sessions(channel_name, user_name)
-        return ViewerDetailResult(user_info=user_info, balance=balance, sessions=sessions)
+        sessions = self._sessions_port.get_user_sessions(channel_name, user_name, sessions_cursor, sessions_limit)
+        return ViewerDetailResult(
+            user_info=user_info,
+            balance=balance,
+            sessions=sessions.items,
+            sessions_next_cursor=sessions.next_cursor,
+        )
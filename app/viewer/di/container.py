@@ -1,24 +1,41 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.common.session.async_session_scoped_factory import AsyncSessionScopedFactory
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
 from app.economy.domain.economy_policy import EconomyPolicy
 from app.follow.domain.repo import FollowersRepository
 from app.viewer.application.usecase.get_viewer_detail_use_case import GetViewerDetailUseCase
+from app.viewer.domain.repo import ViewerIdentityRepository
 from app.viewer.infrastructure.adapter.economy_viewer_balance_adapter import EconomyViewerBalanceAdapter
 from app.viewer.infrastructure.adapter.follow_viewer_detail_info_adapter import FollowViewerDetailInfoAdapter
 from app.viewer.infrastructure.adapter.viewer_viewer_sessions_adapter import ViewerViewerSessionsAdapter
+from app.viewer.infrastructure.viewer_identity_repository import ViewerIdentityRepositoryImpl
 from app.viewer.session.application.usecase.get_user_sessions_use_case import GetUserSessionsUseCase
-from app.viewer.session.domain.repository import ViewerRepository
+from app.viewer.session.domain.repository import AsyncViewerRepository, ViewerRepository
+from app.viewer.session.infrastructure.async_session_repository import AsyncViewerRepositoryImpl
 from app.viewer.session.infrastructure.session_repository import ViewerRepositoryImpl
 
 
 class ViewerContainer:
     def __init__(self):
         self.viewer_repository_factory: SessionScopedFactory[ViewerRepository] = SessionScopedFactory(self._viewer_repository)
+        self.async_viewer_repository_factory: AsyncSessionScopedFactory[AsyncViewerRepository] = AsyncSessionScopedFactory(
+            self._async_viewer_repository
+        )
+        self.viewer_identity_repository_factory: SessionScopedFactory[ViewerIdentityRepository] = SessionScopedFactory(
+            self._viewer_identity_repository
+        )
 
     def _viewer_repository(self, session: Session) -> ViewerRepository:
         return ViewerRepositoryImpl(session)
 
+    def _viewer_identity_repository(self, session: Session) -> ViewerIdentityRepository:
+        return ViewerIdentityRepositoryImpl(session)
+
+    def _async_viewer_repository(self, session: AsyncSession) -> AsyncViewerRepository:
+        return AsyncViewerRepositoryImpl(session)
+
     def _get_user_sessions_use_case(self, session: Session) -> GetUserSessionsUseCase:
         viewer_repository = self._viewer_repository(session)
         return GetUserSessionsUseCase(viewer_repository)
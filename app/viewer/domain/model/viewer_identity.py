@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class ViewerIdentity:
+    login: str
+    user_id: str
+    display_name: str
+    updated_at: datetime | None = None
@@ -0,0 +1,10 @@
+from collections.abc import Sequence
+from typing import Protocol
+
+from app.viewer.domain.model.viewer_identity import ViewerIdentity
+
+
+class ViewerIdentityRepository(Protocol):
+    def get_by_logins(self, logins: Sequence[str]) -> list[ViewerIdentity]: ...
+
+    def save_all(self, identities: Sequence[ViewerIdentity]) -> None: ...
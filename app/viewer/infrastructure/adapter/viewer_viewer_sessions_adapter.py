@@ -1,3 +1,4 @@
+from app.common.domain.keyset import KeysetCursor, Page
 from app.viewer.application.model.viewer_detail_models import ViewerSessionDetail, ViewerStreamBrief
 from app.viewer.application.port.viewer_detail_sessions_port import ViewerDetailSessionsPort
 from app.viewer.session.application.model.viewer_session import ViewerSessionDTO
@@ -8,9 +9,9 @@ class ViewerViewerSessionsAdapter(ViewerDetailSessionsPort):
     def __init__(self, viewer_query_service: GetUserSessionsUseCase):
         self._viewer_service = viewer_query_service
 
-    def get_user_sessions(self, channel_name: str, user_name: str) -> list[ViewerSessionDetail]:
-        user_sessions = self._viewer_service.get_user_sessions(channel_name, user_name)
-        return [self._to_session_detail(session) for session in user_sessions]
+    def get_user_sessions(self, channel_name: str, user_name: str, cursor: KeysetCursor | None, limit: int) -> Page[ViewerSessionDetail]:
+        page = self._viewer_service.get_user_sessions(channel_name, user_name, cursor, limit)
+        return Page(items=[self._to_session_detail(session) for session in page.items], next_cursor=page.next_cursor)
 
     def _to_session_detail(self, session: ViewerSessionDTO) -> ViewerSessionDetail:
         stream = None
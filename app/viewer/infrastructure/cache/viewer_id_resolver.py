@@ -0,0 +1,114 @@
+import asyncio
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from itertools import islice
+
+from app.core.common.session.session_scoped_factory import SessionScopedFactory
+from app.core.logger.domain.logger import Logger
+from app.platform.domain.repository import PlatformRepository
+from app.viewer.application.port.viewer_cache_port import ViewerCachePort
+from app.viewer.domain.model.viewer_identity import ViewerIdentity
+from app.viewer.domain.repo import ViewerIdentityRepository
+from core.types import SessionFactory
+
+_LOGIN_PATTERN = re.compile(r"^[a-z0-9_]{1,25}$")
+
+
+class ViewerIdResolver(ViewerCachePort):
+    _MAX_ENTRIES = 10_000
+    _POSITIVE_TTL_SECONDS = 6 * 60 * 60
+    _NEGATIVE_TTL_SECONDS = 10 * 60
+    _PERSISTED_TTL = timedelta(days=30)
+    _BATCH_SIZE = 100
+    _BATCH_WINDOW_SECONDS = 0.02
+
+    def __init__(
+        self,
+        platform_repository: PlatformRepository,
+        session_factory_ro: SessionFactory,
+        session_factory_rw: SessionFactory,
+        viewer_identity_repository_factory: SessionScopedFactory[ViewerIdentityRepository],
+        logger: Logger,
+    ):
+        self._platform_repository = platform_repository
+        self._session_ro = session_factory_ro
+        self._session_rw = session_factory_rw
+        self._viewer_identity_repository_factory = viewer_identity_repository_factory
+        self._logger = logger.create_child(__name__)
+        self._entries: OrderedDict[str, tuple[str | None, float]] = OrderedDict()
+        self._pending: dict[str, asyncio.Future[str | None]] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    async def get_viewer_id(self, login: str) -> str | None:
+        login = login.strip().lower()
+        if not _LOGIN_PATTERN.match(login):
+            return None
+
+        entry = self._entries.get(login)
+        if entry is not None:
+            user_id, expires_at = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(login)
+                return user_id
+            del self._entries[login]
+
+        future = self._pending.get(login)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[login] = future
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush())
+        return await asyncio.shield(future)
+
+    async def warmup(self, login: str) -> None:
+        await self.get_viewer_id(login)
+
+    async def _flush(self) -> None:
+        await asyncio.sleep(self._BATCH_WINDOW_SECONDS)
+        self._flush_task = None
+        while self._pending:
+            batch = {login: self._pending.pop(login) for login in list(islice(self._pending, self._BATCH_SIZE))}
+            try:
+                resolved = await self._lookup(list(batch))
+            except Exception as e:
+                self._logger.log_error(f"Ошибка при получении id для {len(batch)} пользователей: {e}")
+                resolved = {}
+            for login, future in batch.items():
+                if login in resolved:
+                    user_id = resolved[login]
+                    self._remember(login, user_id, self._POSITIVE_TTL_SECONDS if user_id else self._NEGATIVE_TTL_SECONDS)
+                if not future.done():
+                    future.set_result(resolved.get(login))
+
+    async def _lookup(self, logins: Sequence[str]) -> dict[str, str | None]:
+        with self._session_ro() as session:
+            persisted = self._viewer_identity_repository_factory.get(session).get_by_logins(logins)
+        fresh_after = datetime.now(UTC) - self._PERSISTED_TTL
+        resolved: dict[str, str | None] = {
+            identity.login: identity.user_id for identity in persisted if identity.updated_at and identity.updated_at >= fresh_after
+        }
+
+        missing = [login for login in logins if login not in resolved]
+        if not missing:
+            return resolved
+        users = await self._platform_repository.get_users_by_logins(missing)
+        if users is None:
+            return resolved
+
+        identities = [ViewerIdentity(login=user.login.lower(), user_id=user.id, display_name=user.display_name) for user in users]
+        if identities:
+            with self._session_rw() as session:
+                self._viewer_identity_repository_factory.get(session).save_all(identities)
+        found = {identity.login: identity.user_id for identity in identities}
+        for login in missing:
+            resolved[login] = found.get(login)
+        return resolved
+
+    def _remember(self, login: str, user_id: str | None, ttl_seconds: float) -> None:
+        self._entries[login] = (user_id, time.monotonic() + ttl_seconds)
+        self._entries.move_to_end(login)
+        while len(self._entries) > self._MAX_ENTRIES:
+            self._entries.popitem(last=False)
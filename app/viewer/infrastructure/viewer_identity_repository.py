@@ -0,0 +1,51 @@
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.stream.infrastructure.mappers.stream_mapper import normalize_datetime
+from app.viewer.domain.model.viewer_identity import ViewerIdentity
+from app.viewer.domain.repo import ViewerIdentityRepository
+from app.viewer.infrastructure.db.viewer_identity import ViewerIdentityRow
+
+
+class ViewerIdentityRepositoryImpl(ViewerIdentityRepository):
+    def __init__(self, db: Session):
+        self._db = db
+
+    def get_by_logins(self, logins: Sequence[str]) -> list[ViewerIdentity]:
+        if not logins:
+            return []
+        stmt = select(ViewerIdentityRow).where(ViewerIdentityRow.login.in_(logins))
+        return [
+            ViewerIdentity(
+                login=row.login,
+                user_id=row.user_id,
+                display_name=row.display_name,
+                updated_at=normalize_datetime(row.updated_at),
+            )
+            for row in self._db.execute(stmt).scalars()
+        ]
+
+    def save_all(self, identities: Sequence[ViewerIdentity]) -> None:
+        if not identities:
+            return
+        now = datetime.now(UTC).replace(tzinfo=None)
+        renamed = delete(ViewerIdentityRow).where(
+            ViewerIdentityRow.user_id.in_([identity.user_id for identity in identities]),
+            ViewerIdentityRow.login.not_in([identity.login for identity in identities]),
+        )
+        self._db.execute(renamed)
+        stmt = insert(ViewerIdentityRow).values(
+            [
+                {"login": identity.login, "user_id": identity.user_id, "display_name": identity.display_name, "updated_at": now}
+                for identity in identities
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ViewerIdentityRow.login],
+            set_={"user_id": stmt.excluded.user_id, "display_name": stmt.excluded.display_name, "updated_at": stmt.excluded.updated_at},
+        )
+        self._db.execute(stmt)
@@ -44,3 +44,4 @@ class ViewerSessionItem(BaseModel):
 class ViewerDetailResponse(ViewerResponse):
     balance: int
     sessions: list[ViewerSessionItem] = Field(default_factory=list, description="Сессии просмотра пользователя")
+    sessions_next_cursor: str | None = Field(None, description="Курсор следующей страницы сессий (null — страниц больше нет)")
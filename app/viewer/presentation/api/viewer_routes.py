@@ -1,7 +1,8 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 from fastapi.params import Depends
 
 from app.bot.presentation.api.bot_twitch_routes import get_economy_container, get_follow_container, get_viewer_container
+from app.core.network.api.pagination import decode_cursor, encode_cursor
 from app.economy.di.container import EconomyContainer
 from app.follow.di.container import FollowContainer
 from app.viewer.application.model.viewer_detail_models import ViewerSessionDetail
@@ -11,7 +12,7 @@ from app.viewer.presentation.api.model.viewer_schemas import (
     ViewerSessionItem,
     ViewerSessionStreamInfo,
 )
-from core.db import db_ro_session
+from core.db import db_replica_session
 
 router = APIRouter(prefix="/viewers", tags=["Viewers"])
 
@@ -20,15 +21,18 @@ router = APIRouter(prefix="/viewers", tags=["Viewers"])
 async def get_viewer_detail(
     channel_name: str,
     user_name: str,
+    sessions_cursor: str | None = Query(None, description="Курсор следующей страницы сессий из предыдущего ответа"),
+    sessions_limit: int = Query(50, ge=1, le=200, description="Количество сессий в ответе"),
     economy_container: EconomyContainer = Depends(get_economy_container),
     follow_container: FollowContainer = Depends(get_follow_container),
     viewer_container: ViewerContainer = Depends(get_viewer_container),
 ):
-    with db_ro_session() as session:
+    page_cursor = decode_cursor(sessions_cursor)
+    with db_replica_session() as session:
         economy_policy = economy_container.economy_policy(session)
         followers_repo = follow_container.followers_repository(session)
         get_viewer_detail_use_case = viewer_container.get_viewer_detail_use_case(followers_repo, economy_policy, session)
-        result = get_viewer_detail_use_case.handle(channel_name, user_name)
+        result = get_viewer_detail_use_case.handle(channel_name, user_name, page_cursor, sessions_limit)
 
     def to_session_item(s: ViewerSessionDetail):
         stream_info = None
@@ -71,4 +75,5 @@ async def get_viewer_detail(
         updated_at=result.user_info.updated_at,
         balance=result.balance.balance,
         sessions=sessions_response,
+        sessions_next_cursor=encode_cursor(result.sessions_next_cursor),
     )
@@ -1,23 +1,25 @@
 from __future__ import annotations
 
-from typing import Protocol
+from collections.abc import Callable
+from typing import Protocol, TypeVar
 
-from app.common.application.unit_of_work import UnitOfWork, UnitOfWorkFactory
+from app.common.application.unit_of_work import AsyncUnitOfWork, AsyncUnitOfWorkFactory
 from app.economy.domain.economy_policy import EconomyPolicy
-from app.stream.domain.repo import StreamRepository
-from app.viewer.session.domain.repository import ViewerRepository
+from app.stream.domain.repo import AsyncStreamRepository
+from app.viewer.session.domain.repository import AsyncViewerRepository
 
+T = TypeVar("T")
 
-class ViewerTimeUnitOfWork(UnitOfWork, Protocol):
-    @property
-    def viewer_repository(self) -> ViewerRepository: ...
 
+class ViewerTimeUnitOfWork(AsyncUnitOfWork, Protocol):
     @property
-    def economy_policy(self) -> EconomyPolicy: ...
+    def viewer_repository(self) -> AsyncViewerRepository: ...
 
     @property
-    def stream_repository(self) -> StreamRepository: ...
+    def stream_repository(self) -> AsyncStreamRepository: ...
+
+    async def run_with_economy_policy(self, fn: Callable[[EconomyPolicy], T]) -> T: ...
 
 
-class ViewerTimeUnitOfWorkFactory(UnitOfWorkFactory[ViewerTimeUnitOfWork], Protocol):
+class ViewerTimeUnitOfWorkFactory(AsyncUnitOfWorkFactory[ViewerTimeUnitOfWork], Protocol):
     pass
@@ -1,3 +1,4 @@
+from app.common.domain.keyset import KeysetCursor, Page
 from app.stream.domain.model.info import StreamInfo
 from app.viewer.session.application.model.viewer_session import StreamInfoDTO, ViewerSessionDTO
 from app.viewer.session.domain.model.models import ViewerSession
@@ -37,6 +38,6 @@ class GetUserSessionsUseCase:
             stream=self._to_stream_dto(session.stream),
         )
 
-    def get_user_sessions(self, channel_name: str, user_name: str) -> list[ViewerSessionDTO]:
-        sessions = self._viewer_repository.get_user_sessions(channel_name, user_name)
-        return [self._to_session_dto(session) for session in sessions]
+    def get_user_sessions(self, channel_name: str, user_name: str, cursor: KeysetCursor | None, limit: int) -> Page[ViewerSessionDTO]:
+        page = self._viewer_repository.get_user_sessions(channel_name, user_name, cursor, limit)
+        return Page(items=[self._to_session_dto(session) for session in page.items], next_cursor=page.next_cursor)
@@ -1,105 +1,91 @@
-from datetime import UTC, datetime
+from dataclasses import replace
+from datetime import timedelta
 
-from app.economy.domain.models import TransactionType
+from app.economy.domain.models import LedgerEntry, TransactionType
 from app.platform.domain.repository import PlatformRepository
+from app.stream.application.port.active_stream_registry_port import ActiveStreamRegistryPort
 from app.viewer.application.port.viewer_cache_port import ViewerCachePort
 from app.viewer.session.application.model.viewer_time import ViewerTimeDTO
 from app.viewer.session.application.uow.viewer_time_uow import ViewerTimeUnitOfWorkFactory
+from app.viewer.session.domain.model.watch_time_reward import STREAM_TIME_REWARDS, ViewerRewardProgress, next_reward_minutes
 
 
 class RewardViewerTimeUseCase:
-    STREAM_TIME_REWARDS = {30: 25, 60: 50, 90: 100, 120: 150, 150: 250, 180: 350}
-
     def __init__(
-        self, reward_viewer_time_uow: ViewerTimeUnitOfWorkFactory, user_cache: ViewerCachePort, platform_repository: PlatformRepository
+        self,
+        reward_viewer_time_uow: ViewerTimeUnitOfWorkFactory,
+        user_cache: ViewerCachePort,
+        platform_repository: PlatformRepository,
+        active_stream_registry: ActiveStreamRegistryPort,
     ):
         self._reward_viewer_time_uow = reward_viewer_time_uow
+        self._active_stream_registry = active_stream_registry
         self._user_cache = user_cache
         self._platform_repository = platform_repository
 
     async def handle(self, viewer_time: ViewerTimeDTO):
-        with self._reward_viewer_time_uow.create(read_only=True) as uow:
-            active_stream = uow.stream_repository.get_active_stream(viewer_time.channel_name)
+        async with self._reward_viewer_time_uow.create(read_only=True) as uow:
+            active_stream = await uow.stream_repository.get_active_stream(viewer_time.channel_name)
 
         if not active_stream:
             return
 
-        with self._reward_viewer_time_uow.create() as uow:
-            inactive_users = []
-            inactive_sessions = uow.viewer_repository.get_inactive_sessions(active_stream.id, viewer_time.occurred_at)
-            for session in inactive_sessions:
-                inactive_users.append(session.user_name)
-                session_duration = datetime.now(UTC) - session.session_start
-                session_minutes = int(session_duration.total_seconds() / 60)
-                total_minutes = session.total_minutes + session_minutes
-                uow.viewer_repository.finish_session(
-                    stream_id=active_stream.id,
-                    channel_name=session.channel_name,
-                    user_name=session.user_name,
-                    total_minutes=total_minutes,
-                    current_time=viewer_time.occurred_at,
-                )
+        async with self._reward_viewer_time_uow.create() as uow:
+            await uow.viewer_repository.finish_sessions(active_stream.id, viewer_time.occurred_at, inactive_only=True)
 
         broadcaster_id = await self._user_cache.get_viewer_id(viewer_time.channel_name)
         moderator_id = await self._user_cache.get_viewer_id(viewer_time.bot_nick or viewer_time.channel_name)
         chatters = await self._platform_repository.get_stream_chatters(broadcaster_id, moderator_id)
         if chatters:
-            with self._reward_viewer_time_uow.create() as uow:
-                for user_name in chatters:
-                    normalized_user_name = user_name.lower()
-                    session = uow.viewer_repository.get_viewer_session(active_stream.id, viewer_time.channel_name, normalized_user_name)
-                    if session:
-                        uow.viewer_repository.update_last_activity(
-                            stream_id=active_stream.id,
-                            channel_name=viewer_time.channel_name,
-                            user_name=user_name,
-                            current_time=viewer_time.occurred_at,
-                        )
-                    else:
-                        uow.viewer_repository.create_view_session(
-                            stream_id=active_stream.id,
-                            channel_name=viewer_time.channel_name,
-                            user_name=user_name,
-                            current_time=viewer_time.occurred_at,
-                        )
+            async with self._reward_viewer_time_uow.create() as uow:
+                await uow.viewer_repository.heartbeat(active_stream.id, viewer_time.channel_name, chatters, viewer_time.occurred_at)
 
-        with self._reward_viewer_time_uow.create(read_only=True) as uow:
-            viewers_count = uow.viewer_repository.get_stream_watchers_count(active_stream.id)
+        async with self._reward_viewer_time_uow.create(read_only=True) as uow:
+            viewers_count = await uow.viewer_repository.get_stream_watchers_count(active_stream.id)
 
         if viewers_count > active_stream.max_concurrent_viewers:
-            with self._reward_viewer_time_uow.create() as uow:
-                uow.stream_repository.update_max_concurrent_viewers_count(active_stream.id, viewers_count)
-
-        with self._reward_viewer_time_uow.create() as uow:
-            viewer_sessions = uow.viewer_repository.get_viewer_sessions(active_stream.id)
-            for session in viewer_sessions:
-                available_rewards = []
+            async with self._reward_viewer_time_uow.create() as uow:
+                await uow.stream_repository.update_max_concurrent_viewers_count(active_stream.id, viewers_count)
+            self._active_stream_registry.set(viewer_time.channel_name, replace(active_stream, max_concurrent_viewers=viewers_count))
 
+        async with self._reward_viewer_time_uow.create() as uow:
+            due_sessions = await uow.viewer_repository.get_due_reward_sessions(active_stream.id, viewer_time.occurred_at)
+            progress: list[ViewerRewardProgress] = []
+            entries: list[LedgerEntry] = []
+            for session in due_sessions:
                 if session.is_watching and session.session_start:
-                    duration = datetime.now(UTC) - session.session_start
+                    duration = viewer_time.occurred_at - session.session_start
                     current_session_minutes = int(duration.total_seconds() / 60)
                 else:
                     current_session_minutes = 0
 
                 total_minutes = session.total_minutes + current_session_minutes
-                claimed_rewards = set(session.get_claimed_rewards_list())
-
-                for minutes_threshold in sorted(self.STREAM_TIME_REWARDS.keys()):
-                    if total_minutes >= minutes_threshold and minutes_threshold not in claimed_rewards:
-                        reward_amount = self.STREAM_TIME_REWARDS[minutes_threshold]
-                        available_rewards.append((minutes_threshold, reward_amount))
-
-                for minutes_threshold, reward_amount in available_rewards:
-                    claimed_list = session.get_claimed_rewards_list()
-                    claimed_list.append(minutes_threshold)
-                    rewards = ",".join(map(str, sorted(claimed_list)))
-                    uow.viewer_repository.update_session_rewards(
-                        session_id=session.id, rewards=rewards, current_time=viewer_time.occurred_at
+                claimed_rewards = session.get_claimed_rewards_list()
+                minutes_threshold = session.next_reward_minutes
+                while minutes_threshold is not None and total_minutes >= minutes_threshold:
+                    claimed_rewards.append(minutes_threshold)
+                    entries.append(
+                        LedgerEntry(
+                            channel_name=viewer_time.channel_name,
+                            user_name=session.user_name,
+                            amount=STREAM_TIME_REWARDS[minutes_threshold],
+                            transaction_type=TransactionType.VIEWER_TIME_REWARD,
+                            description=f"Награда за {minutes_threshold} минут просмотра стрима",
+                        )
                     )
-                    uow.economy_policy.add_balance(
-                        channel_name=viewer_time.channel_name,
-                        user_name=session.user_name,
-                        amount=reward_amount,
-                        transaction_type=TransactionType.VIEWER_TIME_REWARD,
-                        description=f"Награда за {minutes_threshold} минут просмотра стрима",
+                    minutes_threshold = next_reward_minutes(minutes_threshold)
+
+                next_reward_at = None
+                if minutes_threshold is not None and session.is_watching and session.session_start:
+                    next_reward_at = session.session_start + timedelta(minutes=minutes_threshold - session.total_minutes)
+                progress.append(
+                    ViewerRewardProgress(
+                        session_id=session.id,
+                        rewards_claimed=",".join(map(str, sorted(claimed_rewards))),
+                        next_reward_minutes=minutes_threshold,
+                        next_reward_at=next_reward_at,
                     )
+                )
+
+            await uow.viewer_repository.update_reward_progress(progress, viewer_time.occurred_at)
+            await uow.run_with_economy_policy(lambda economy_policy: economy_policy.post_many(entries))
@@ -20,6 +20,8 @@ class ViewerSession:
     created_at: datetime | None = None
     updated_at: datetime | None = None
     stream: StreamInfo | None = None
+    next_reward_minutes: int | None = None
+    next_reward_at: datetime | None = None
 
     def get_claimed_rewards_list(self) -> list:
         if not self.rewards_claimed:
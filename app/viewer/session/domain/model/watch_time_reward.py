@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+STREAM_TIME_REWARDS = {30: 25, 60: 50, 90: 100, 120: 150, 150: 250, 180: 350}
+FIRST_REWARD_MINUTES = min(STREAM_TIME_REWARDS)
+
+
+def next_reward_minutes(claimed_minutes: int) -> int | None:
+    return min((minutes for minutes in STREAM_TIME_REWARDS if minutes > claimed_minutes), default=None)
+
+
+@dataclass(frozen=True)
+class ViewerRewardProgress:
+    session_id: int
+    rewards_claimed: str
+    next_reward_minutes: int | None
+    next_reward_at: datetime | None
@@ -1,28 +1,37 @@
+from collections.abc import Iterable, Sequence
 from datetime import datetime
 from typing import Protocol
 
+from app.common.domain.keyset import KeysetCursor, Page
 from app.viewer.session.domain.model.models import ViewerSession
+from app.viewer.session.domain.model.watch_time_reward import ViewerRewardProgress
 
 
 class ViewerRepository(Protocol):
-    def get_viewer_session(self, stream_id: int, channel_name: str, user_name: str) -> ViewerSession | None: ...
+    def heartbeat(self, stream_id: int, channel_name: str, user_names: Iterable[str], current_time: datetime) -> None: ...
 
-    def create_view_session(self, stream_id: int, channel_name: str, user_name: str, current_time: datetime) -> ViewerSession: ...
+    def finish_sessions(self, stream_id: int, current_time: datetime, inactive_only: bool = False) -> int: ...
 
-    def update_last_activity(self, stream_id: int, channel_name: str, user_name: str, current_time: datetime): ...
+    def get_unique_viewers_count(self, stream_id: int) -> int: ...
 
-    def get_inactive_sessions(self, stream_id: int, current_time: datetime) -> list[ViewerSession]: ...
+    def get_viewer_sessions(self, stream_id: int) -> list[ViewerSession]: ...
 
-    def finish_session(self, stream_id: int, channel_name: str, user_name: str, total_minutes: int, current_time: datetime): ...
+    def get_due_reward_sessions(self, stream_id: int, current_time: datetime) -> list[ViewerSession]: ...
 
-    def get_active_sessions(self, stream_id: int) -> list[ViewerSession]: ...
+    def update_reward_progress(self, progress: Sequence[ViewerRewardProgress], current_time: datetime) -> None: ...
 
-    def get_unique_viewers_count(self, stream_id: int) -> int: ...
+    def get_user_sessions(self, channel_name: str, user_name: str, cursor: KeysetCursor | None, limit: int) -> Page[ViewerSession]: ...
 
-    def get_viewer_sessions(self, stream_id: int) -> list[ViewerSession]: ...
+    def get_stream_watchers_count(self, stream_id: int) -> int: ...
 
-    def update_session_rewards(self, session_id: int, rewards: str, current_time: datetime): ...
 
-    def get_user_sessions(self, channel_name: str, user_name: str) -> list[ViewerSession]: ...
+class AsyncViewerRepository(Protocol):
+    async def heartbeat(self, stream_id: int, channel_name: str, user_names: Iterable[str], current_time: datetime) -> None: ...
 
-    def get_stream_watchers_count(self, stream_id: int) -> int: ...
+    async def finish_sessions(self, stream_id: int, current_time: datetime, inactive_only: bool = False) -> int: ...
+
+    async def get_due_reward_sessions(self, stream_id: int, current_time: datetime) -> list[ViewerSession]: ...
+
+    async def update_reward_progress(self, progress: Sequence[ViewerRewardProgress], current_time: datetime) -> None: ...
+
+    async def get_stream_watchers_count(self, stream_id: int) -> int: ...
@@ -0,0 +1,44 @@
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.viewer.session.domain.model.models import ViewerSession
+from app.viewer.session.domain.model.watch_time_reward import ViewerRewardProgress
+from app.viewer.session.domain.repository import AsyncViewerRepository
+from app.viewer.session.infrastructure.mappers.viewer_session_mapper import map_viewer_session_row
+from app.viewer.session.infrastructure.session_statements import (
+    due_reward_sessions_statement,
+    finish_sessions_statement,
+    heartbeat_statement,
+    reward_progress_statement,
+    stream_watchers_count_statement,
+)
+
+
+class AsyncViewerRepositoryImpl(AsyncViewerRepository):
+    def __init__(self, db: AsyncSession):
+        self._db = db
+
+    async def heartbeat(self, stream_id: int, channel_name: str, user_names: Iterable[str], current_time: datetime) -> None:
+        heartbeat = heartbeat_statement(stream_id, channel_name, user_names, current_time)
+        if heartbeat is None:
+            return
+        stmt, rows = heartbeat
+        await self._db.execute(stmt, rows)
+
+    async def finish_sessions(self, stream_id: int, current_time: datetime, inactive_only: bool = False) -> int:
+        result = await self._db.execute(finish_sessions_statement(stream_id, current_time, inactive_only))
+        return result.rowcount
+
+    async def get_due_reward_sessions(self, stream_id: int, current_time: datetime) -> list[ViewerSession]:
+        rows = (await self._db.execute(due_reward_sessions_statement(stream_id, current_time))).scalars().all()
+        return [map_viewer_session_row(row) for row in rows]
+
+    async def update_reward_progress(self, progress: Sequence[ViewerRewardProgress], current_time: datetime) -> None:
+        stmt = reward_progress_statement(progress, current_time)
+        if stmt is not None:
+            await self._db.execute(stmt)
+
+    async def get_stream_watchers_count(self, stream_id: int) -> int:
+        return (await self._db.execute(stream_watchers_count_statement(stream_id))).scalar_one()
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.stream.infrastructure.db.stream import Stream
@@ -9,6 +9,14 @@ from core.db import Base
 
 class StreamViewerSession(Base):
     __tablename__ = "stream_viewer_session"
+    UNIQUE_VIEWER_CONSTRAINT = "uq_stream_viewer_session_user"
+    __table_args__ = (
+        UniqueConstraint("stream_id", "channel_name", "user_name", name=UNIQUE_VIEWER_CONSTRAINT),
+        Index("ix_stream_viewer_session_next_reward", "stream_id", "next_reward_at"),
+        Index("ix_stream_viewer_session_channel_user_start", "channel_name", "user_name", "session_start"),
+        Index("ix_stream_viewer_session_channel_start", "channel_name", "session_start", "id"),
+        Index("ix_stream_viewer_session_watching", "stream_id", "last_activity", postgresql_where=text("is_watching")),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, nullable=False)
 
@@ -26,6 +34,8 @@ class StreamViewerSession(Base):
 
     rewards_claimed: Mapped[str] = mapped_column(Text, default="", nullable=False)
     last_reward_claimed: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    next_reward_minutes: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    next_reward_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -0,0 +1,25 @@
+from app.stream.domain.model.info import StreamInfo
+from app.stream.infrastructure.mappers.stream_mapper import normalize_datetime
+from app.viewer.session.domain.model.models import ViewerSession
+from app.viewer.session.infrastructure.db.model.viewer_session import StreamViewerSession
+
+
+def map_viewer_session_row(row: StreamViewerSession, stream: StreamInfo | None = None) -> ViewerSession:
+    return ViewerSession(
+        id=row.id,
+        stream_id=row.stream_id,
+        channel_name=row.channel_name,
+        user_name=row.user_name,
+        session_start=normalize_datetime(row.session_start),
+        session_end=normalize_datetime(row.session_end),
+        total_minutes=row.total_minutes,
+        last_activity=normalize_datetime(row.last_activity),
+        is_watching=row.is_watching,
+        rewards_claimed=row.rewards_claimed,
+        last_reward_claimed=normalize_datetime(row.last_reward_claimed),
+        created_at=normalize_datetime(row.created_at),
+        updated_at=normalize_datetime(row.updated_at),
+        stream=stream,
+        next_reward_minutes=row.next_reward_minutes,
+        next_reward_at=normalize_datetime(row.next_reward_at),
+    )
@@ -1,113 +1,42 @@
-from datetime import datetime, timedelta
+from collections.abc import Iterable, Sequence
+from datetime import datetime
 
 from sqlalchemy import desc, func, select
 from sqlalchemy.orm import Session, joinedload
 
-from app.stream.infrastructure.mappers.stream_mapper import map_stream_row, normalize_datetime
+from app.common.domain.keyset import KeysetCursor, Page
+from app.common.infrastructure.keyset import keyset_before
+from app.stream.infrastructure.mappers.stream_mapper import map_stream_row
 from app.viewer.session.domain.model.models import ViewerSession
+from app.viewer.session.domain.model.watch_time_reward import ViewerRewardProgress
 from app.viewer.session.domain.repository import ViewerRepository
 from app.viewer.session.infrastructure.db.model.viewer_session import StreamViewerSession
+from app.viewer.session.infrastructure.mappers.viewer_session_mapper import map_viewer_session_row
+from app.viewer.session.infrastructure.session_statements import (
+    due_reward_sessions_statement,
+    finish_sessions_statement,
+    heartbeat_statement,
+    reward_progress_statement,
+    stream_watchers_count_statement,
+)
 
 
 class ViewerRepositoryImpl(ViewerRepository):
-    ACTIVITY_TIMEOUT_MINUTES = 5
-
     def __init__(self, db: Session):
         self._db = db
 
     def _to_viewer_session(self, row: StreamViewerSession) -> ViewerSession:
-        return ViewerSession(
-            id=row.id,
-            stream_id=row.stream_id,
-            channel_name=row.channel_name,
-            user_name=row.user_name,
-            session_start=normalize_datetime(row.session_start),
-            session_end=normalize_datetime(row.session_end),
-            total_minutes=row.total_minutes,
-            last_activity=normalize_datetime(row.last_activity),
-            is_watching=row.is_watching,
-            rewards_claimed=row.rewards_claimed,
-            last_reward_claimed=normalize_datetime(row.last_reward_claimed),
-            created_at=normalize_datetime(row.created_at),
-            updated_at=normalize_datetime(row.updated_at),
-            stream=map_stream_row(row.stream) if row.stream else None,
-        )
-
-    def get_viewer_session(self, stream_id: int, channel_name: str, user_name: str) -> ViewerSession | None:
-        stmt = (
-            select(StreamViewerSession)
-            .where(StreamViewerSession.stream_id == stream_id)
-            .where(StreamViewerSession.user_name == user_name)
-            .where(StreamViewerSession.channel_name == channel_name)
-        )
-        row = self._db.execute(stmt).scalars().first()
-        if not row:
-            return None
-        return self._to_viewer_session(row)
-
-    def create_view_session(self, stream_id: int, channel_name: str, user_name: str, current_time: datetime):
-        session_start_naive = current_time.replace(tzinfo=None)
-
-        session = StreamViewerSession(
-            stream_id=stream_id,
-            channel_name=channel_name,
-            user_name=user_name,
-            session_start=session_start_naive,
-            last_activity=session_start_naive,
-            is_watching=True,
-        )
-        self._db.add(session)
+        return map_viewer_session_row(row, map_stream_row(row.stream) if row.stream else None)
 
-    def update_last_activity(self, stream_id: int, channel_name: str, user_name: str, current_time: datetime):
-        session_start_naive = current_time.replace(tzinfo=None)
-
-        stmt = (
-            select(StreamViewerSession)
-            .where(StreamViewerSession.stream_id == stream_id)
-            .where(StreamViewerSession.user_name == user_name)
-            .where(StreamViewerSession.channel_name == channel_name)
-        )
-        session = self._db.execute(stmt).scalars().first()
-        if not session:
+    def heartbeat(self, stream_id: int, channel_name: str, user_names: Iterable[str], current_time: datetime) -> None:
+        heartbeat = heartbeat_statement(stream_id, channel_name, user_names, current_time)
+        if heartbeat is None:
             return
-        session.last_activity = session_start_naive
-        session.is_watching = True
+        stmt, rows = heartbeat
+        self._db.execute(stmt, rows)
 
-    def get_inactive_sessions(self, stream_id: int, current_time: datetime) -> list[ViewerSession]:
-        current_time_naive = current_time.replace(tzinfo=None)
-
-        cutoff_time = current_time_naive - timedelta(minutes=self.ACTIVITY_TIMEOUT_MINUTES)
-        stmt = (
-            select(StreamViewerSession)
-            .where(StreamViewerSession.stream_id == stream_id)
-            .where(StreamViewerSession.is_watching.is_(True))
-            .where(StreamViewerSession.last_activity < cutoff_time)
-        )
-        rows = self._db.execute(stmt).scalars().all()
-        return [self._to_viewer_session(row) for row in rows]
-
-    def finish_session(self, stream_id: int, channel_name: str, user_name: str, total_minutes: int, current_time: datetime):
-        current_time_naive = current_time.replace(tzinfo=None)
-
-        stmt = (
-            select(StreamViewerSession)
-            .where(StreamViewerSession.stream_id == stream_id)
-            .where(StreamViewerSession.user_name == user_name)
-            .where(StreamViewerSession.channel_name == channel_name)
-        )
-        session = self._db.execute(stmt).scalars().first()
-        if not session:
-            return
-        session.total_minutes = total_minutes
-        session.session_end = current_time_naive
-        session.is_watching = False
-
-    def get_active_sessions(self, stream_id: int) -> list[ViewerSession]:
-        stmt = (
-            select(StreamViewerSession).where(StreamViewerSession.stream_id == stream_id).where(StreamViewerSession.is_watching.is_(True))
-        )
-        rows = self._db.execute(stmt).scalars().all()
-        return [self._to_viewer_session(row) for row in rows]
+    def finish_sessions(self, stream_id: int, current_time: datetime, inactive_only: bool = False) -> int:
+        return self._db.execute(finish_sessions_statement(stream_id, current_time, inactive_only)).rowcount
 
     def get_unique_viewers_count(self, stream_id: int) -> int:
         stmt = select(func.count(func.distinct(StreamViewerSession.user_name))).where(StreamViewerSession.stream_id == stream_id)
@@ -118,32 +47,28 @@ class ViewerRepositoryImpl(ViewerRepository):
         rows = self._db.execute(stmt).scalars().all()
         return [self._to_viewer_session(row) for row in rows]
 
-    def update_session_rewards(self, session_id: int, rewards: str, current_time: datetime):
-        current_time_naive = current_time.replace(tzinfo=None)
+    def get_due_reward_sessions(self, stream_id: int, current_time: datetime) -> list[ViewerSession]:
+        rows = self._db.execute(due_reward_sessions_statement(stream_id, current_time)).scalars().all()
+        return [self._to_viewer_session(row) for row in rows]
 
-        stmt = select(StreamViewerSession).where(StreamViewerSession.id == session_id)
-        row = self._db.execute(stmt).scalars().first()
-        if not row:
-            return
-        row.rewards_claimed = rewards
-        row.last_reward_claimed = current_time_naive
+    def update_reward_progress(self, progress: Sequence[ViewerRewardProgress], current_time: datetime) -> None:
+        stmt = reward_progress_statement(progress, current_time)
+        if stmt is not None:
+            self._db.execute(stmt)
 
-    def get_user_sessions(self, channel_name: str, user_name: str) -> list[ViewerSession]:
+    def get_user_sessions(self, channel_name: str, user_name: str, cursor: KeysetCursor | None, limit: int) -> Page[ViewerSession]:
         stmt = (
             select(StreamViewerSession)
             .options(joinedload(StreamViewerSession.stream))
             .where(StreamViewerSession.channel_name == channel_name)
             .where(StreamViewerSession.user_name == user_name)
-            .order_by(desc(StreamViewerSession.session_start))
+            .order_by(desc(StreamViewerSession.session_start), desc(StreamViewerSession.id))
+            .limit(limit + 1)
         )
-        rows = self._db.execute(stmt).scalars().all()
-        return [self._to_viewer_session(row) for row in rows]
+        if cursor is not None:
+            stmt = stmt.where(keyset_before(StreamViewerSession.session_start, StreamViewerSession.id, cursor, nulls_first=True))
+        rows = [self._to_viewer_session(row) for row in self._db.execute(stmt).scalars().all()]
+        return Page.from_rows(rows, limit, lambda session: KeysetCursor(at=session.session_start, id=session.id))
 
     def get_stream_watchers_count(self, stream_id: int) -> int:
-        stmt = (
-            select(func.count())
-            .select_from(StreamViewerSession)
-            .where(StreamViewerSession.stream_id == stream_id)
-            .where(StreamViewerSession.is_watching.is_(True))
-        )
-        return self._db.execute(stmt).scalar_one()
+        return self._db.execute(stream_watchers_count_statement(stream_id)).scalar_one()
@@ -0,0 +1,137 @@
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta
+
+from sqlalchemy import DateTime, Integer, Select, Text, Update, case, cast, column, func, literal, select, update, values
+from sqlalchemy.dialects.postgresql import Insert, insert
+
+from app.viewer.session.domain.model.watch_time_reward import FIRST_REWARD_MINUTES, ViewerRewardProgress
+from app.viewer.session.infrastructure.db.model.viewer_session import StreamViewerSession
+
+ACTIVITY_TIMEOUT_MINUTES = 5
+
+
+def heartbeat_statement(
+    stream_id: int, channel_name: str, user_names: Iterable[str], current_time: datetime
+) -> tuple[Insert, list[dict]] | None:
+    current_time_naive = current_time.replace(tzinfo=None)
+    unique_user_names = sorted({user_name.lower() for user_name in user_names})
+    if not unique_user_names:
+        return None
+
+    rows = [
+        {
+            "stream_id": stream_id,
+            "channel_name": channel_name,
+            "user_name": user_name,
+            "session_start": current_time_naive,
+            "last_activity": current_time_naive,
+            "is_watching": True,
+            "total_minutes": 0,
+            "rewards_claimed": "",
+            "next_reward_minutes": FIRST_REWARD_MINUTES,
+            "next_reward_at": current_time_naive + timedelta(minutes=FIRST_REWARD_MINUTES),
+            "created_at": current_time_naive,
+            "updated_at": current_time_naive,
+        }
+        for user_name in unique_user_names
+    ]
+    stmt = insert(StreamViewerSession)
+    stmt = stmt.on_conflict_do_update(
+        constraint=StreamViewerSession.UNIQUE_VIEWER_CONSTRAINT,
+        set_={
+            "session_start": case(
+                (StreamViewerSession.is_watching.is_(True), StreamViewerSession.session_start),
+                else_=stmt.excluded.session_start,
+            ),
+            "next_reward_at": case(
+                (StreamViewerSession.is_watching.is_(True), StreamViewerSession.next_reward_at),
+                (StreamViewerSession.next_reward_minutes.is_(None), None),
+                else_=stmt.excluded.session_start
+                + func.make_interval(0, 0, 0, 0, 0, StreamViewerSession.next_reward_minutes - StreamViewerSession.total_minutes),
+            ),
+            "last_activity": stmt.excluded.last_activity,
+            "is_watching": True,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    return stmt, rows
+
+
+def finish_sessions_statement(stream_id: int, current_time: datetime, inactive_only: bool) -> Update:
+    current_time_naive = current_time.replace(tzinfo=None)
+
+    session_minutes = func.floor(func.extract("epoch", literal(current_time_naive, DateTime) - StreamViewerSession.session_start) / 60)
+    total_minutes = StreamViewerSession.total_minutes + func.coalesce(cast(session_minutes, Integer), 0)
+    stmt = (
+        update(StreamViewerSession)
+        .where(StreamViewerSession.stream_id == stream_id)
+        .where(StreamViewerSession.is_watching)
+        .values(
+            total_minutes=total_minutes,
+            next_reward_at=case((StreamViewerSession.next_reward_minutes <= total_minutes, current_time_naive), else_=None),
+            session_end=current_time_naive,
+            is_watching=False,
+            updated_at=current_time_naive,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if inactive_only:
+        cutoff_time = current_time_naive - timedelta(minutes=ACTIVITY_TIMEOUT_MINUTES)
+        stmt = stmt.where(StreamViewerSession.last_activity < cutoff_time)
+    return stmt
+
+
+def due_reward_sessions_statement(stream_id: int, current_time: datetime) -> Select:
+    current_time_naive = current_time.replace(tzinfo=None)
+
+    return (
+        select(StreamViewerSession)
+        .where(StreamViewerSession.stream_id == stream_id)
+        .where(StreamViewerSession.next_reward_at <= current_time_naive)
+        .with_for_update(skip_locked=True)
+    )
+
+
+def reward_progress_statement(progress: Sequence[ViewerRewardProgress], current_time: datetime) -> Update | None:
+    if not progress:
+        return None
+    current_time_naive = current_time.replace(tzinfo=None)
+
+    progress_values = values(
+        column("id", Integer),
+        column("rewards_claimed", Text),
+        column("next_reward_minutes", Integer),
+        column("next_reward_at", DateTime),
+        name="reward_progress",
+    ).data(
+        [
+            (
+                item.session_id,
+                item.rewards_claimed,
+                item.next_reward_minutes,
+                item.next_reward_at.replace(tzinfo=None) if item.next_reward_at else None,
+            )
+            for item in progress
+        ]
+    )
+    return (
+        update(StreamViewerSession)
+        .where(StreamViewerSession.id == progress_values.c.id)
+        .values(
+            rewards_claimed=progress_values.c.rewards_claimed,
+            next_reward_minutes=cast(progress_values.c.next_reward_minutes, Integer),
+            next_reward_at=cast(progress_values.c.next_reward_at, DateTime),
+            last_reward_claimed=current_time_naive,
+            updated_at=current_time_naive,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def stream_watchers_count_statement(stream_id: int) -> Select:
+    return (
+        select(func.count())
+        .select_from(StreamViewerSession)
+        .where(StreamViewerSession.stream_id == stream_id)
+        .where(StreamViewerSession.is_watching)
+    )
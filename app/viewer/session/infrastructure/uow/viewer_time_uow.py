@@ -1,50 +1,55 @@
 from __future__ import annotations
 
-from sqlalchemy.orm import Session
+from collections.abc import Callable
+from typing import TypeVar
 
-from app.common.infrastructure.sqlalchemy_uow import SqlAlchemyUnitOfWorkBase, SqlAlchemyUnitOfWorkFactory
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.infrastructure.sqlalchemy_uow import SqlAlchemyAsyncUnitOfWorkBase, SqlAlchemyAsyncUnitOfWorkFactory
+from app.core.common.session.async_session_scoped_factory import AsyncSessionScopedFactory
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
 from app.economy.domain.economy_policy import EconomyPolicy
-from app.stream.domain.repo import StreamRepository
+from app.stream.domain.repo import AsyncStreamRepository
 from app.viewer.session.application.uow.viewer_time_uow import ViewerTimeUnitOfWork, ViewerTimeUnitOfWorkFactory
-from app.viewer.session.domain.repository import ViewerRepository
-from core.types import SessionFactory
+from app.viewer.session.domain.repository import AsyncViewerRepository
+from core.types import AsyncSessionFactory
+
+T = TypeVar("T")
 
 
-class SqlAlchemyViewerTimeUnitOfWork(SqlAlchemyUnitOfWorkBase, ViewerTimeUnitOfWork):
+class SqlAlchemyViewerTimeUnitOfWork(SqlAlchemyAsyncUnitOfWorkBase, ViewerTimeUnitOfWork):
     def __init__(
         self,
-        session: Session,
-        viewer_repository: ViewerRepository,
-        economy_policy: EconomyPolicy,
-        stream_repository: StreamRepository,
+        session: AsyncSession,
+        viewer_repository: AsyncViewerRepository,
+        economy_policy_factory: SessionScopedFactory[EconomyPolicy],
+        stream_repository: AsyncStreamRepository,
         read_only: bool,
     ):
         super().__init__(session=session, read_only=read_only)
         self._viewer_repository = viewer_repository
-        self._economy_policy = economy_policy
+        self._economy_policy_factory = economy_policy_factory
         self._stream_repository = stream_repository
 
     @property
-    def viewer_repository(self) -> ViewerRepository:
+    def viewer_repository(self) -> AsyncViewerRepository:
         return self._viewer_repository
 
     @property
-    def economy_policy(self) -> EconomyPolicy:
-        return self._economy_policy
-
-    @property
-    def stream_repository(self) -> StreamRepository:
+    def stream_repository(self) -> AsyncStreamRepository:
         return self._stream_repository
 
+    async def run_with_economy_policy(self, fn: Callable[[EconomyPolicy], T]) -> T:
+        return await self.run_sync(lambda db: fn(self._economy_policy_factory.get(db)))
+
 
-class SqlAlchemyViewerTimeUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[ViewerTimeUnitOfWork], ViewerTimeUnitOfWorkFactory):
+class SqlAlchemyViewerTimeUnitOfWorkFactory(SqlAlchemyAsyncUnitOfWorkFactory[ViewerTimeUnitOfWork], ViewerTimeUnitOfWorkFactory):
     def __init__(
         self,
-        session_factory_rw: SessionFactory,
-        session_factory_ro: SessionFactory,
-        stream_repository_factory: SessionScopedFactory[StreamRepository],
-        viewer_repository_factory: SessionScopedFactory[ViewerRepository],
+        session_factory_rw: AsyncSessionFactory,
+        session_factory_ro: AsyncSessionFactory,
+        stream_repository_factory: AsyncSessionScopedFactory[AsyncStreamRepository],
+        viewer_repository_factory: AsyncSessionScopedFactory[AsyncViewerRepository],
         economy_policy_factory: SessionScopedFactory[EconomyPolicy],
     ):
         super().__init__(
@@ -56,11 +61,11 @@ class SqlAlchemyViewerTimeUnitOfWorkFactory(SqlAlchemyUnitOfWorkFactory[ViewerTi
         self._viewer_repository_factory = viewer_repository_factory
         self._economy_policy_factory = economy_policy_factory
 
-    def _build_uow(self, db: Session, read_only: bool) -> ViewerTimeUnitOfWork:
+    def _build_uow(self, db: AsyncSession, read_only: bool) -> ViewerTimeUnitOfWork:
         return SqlAlchemyViewerTimeUnitOfWork(
             session=db,
             stream_repository=self._stream_repository_factory.get(db),
             viewer_repository=self._viewer_repository_factory.get(db),
-            economy_policy=self._economy_policy_factory.get(db),
+            economy_policy_factory=self._economy_policy_factory,
             read_only=read_only,
         )
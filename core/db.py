@@ -1,6 +1,10 @@
-from contextlib import AbstractContextManager, contextmanager
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import AbstractContextManager, asynccontextmanager, contextmanager
 
-from sqlalchemy import create_engine
+from sqlalchemy import Connection, Engine, create_engine, make_url, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -11,11 +15,89 @@ Base = declarative_base()
 _engine = None
 _SessionLocal = None
 
+_async_engine: AsyncEngine | None = None
+_AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
+
+_replica_engine: Engine | None = None
+_ReplicaSessionLocal: sessionmaker[Session] | None = None
+
+ASYNC_DRIVER = "postgresql+asyncpg"
+
+REPLICA_CHECK_INTERVAL_SECONDS = 5
+REPLICA_STATE_TTL_SECONDS = 3 * REPLICA_CHECK_INTERVAL_SECONDS
+REPLICA_CONNECT_TIMEOUT_SECONDS = 3
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() THEN NULL "
+    "WHEN NOT EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE COALESCE(status, 'streaming') = 'streaming') THEN NULL "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class ReplicaState:
+    def __init__(self, max_lag_seconds: int):
+        self._max_lag_seconds = max_lag_seconds
+        self._usable = False
+        self._checked_at: float | None = None
+
+    @property
+    def usable(self) -> bool:
+        return self._usable and not self.is_stale()
+
+    def is_stale(self) -> bool:
+        return self._checked_at is None or time.monotonic() - self._checked_at >= REPLICA_STATE_TTL_SECONDS
+
+    def update(self, lag_seconds: float | None) -> None:
+        self._usable = lag_seconds is not None and lag_seconds <= self._max_lag_seconds
+        self._checked_at = time.monotonic()
+
+
+_replica_state: ReplicaState | None = None
+
+
+def disable_statement_timeout(connection: Connection | Session) -> None:
+    connection.execute(text("SET LOCAL statement_timeout = 0"))
+
+
+def _engine_options(config: DatabaseConfig) -> dict:
+    return {
+        "echo": False,
+        "pool_size": config.pool_size,
+        "max_overflow": config.max_overflow,
+        "pool_pre_ping": config.pool_pre_ping,
+        "pool_recycle": config.pool_recycle_seconds,
+    }
+
+
+def _create_engine(url: str, config: DatabaseConfig, connect_timeout_seconds: int | None = None) -> Engine:
+    connect_args = {"options": f"-c statement_timeout={config.statement_timeout_ms}"}
+    if connect_timeout_seconds is not None:
+        connect_args["connect_timeout"] = connect_timeout_seconds
+    return create_engine(url, connect_args=connect_args, **_engine_options(config))
+
+
+def _create_async_engine(url: str, config: DatabaseConfig) -> AsyncEngine:
+    return create_async_engine(
+        make_url(url).set(drivername=ASYNC_DRIVER),
+        connect_args={"server_settings": {"statement_timeout": str(config.statement_timeout_ms)}},
+        **_engine_options(config),
+    )
+
 
 def init_db(config: DatabaseConfig):
-    global _engine, _SessionLocal
-    _engine = create_engine(config.url, echo=False)
+    global _engine, _SessionLocal, _async_engine, _AsyncSessionLocal
+    global _replica_engine, _ReplicaSessionLocal, _replica_state
+    _engine = _create_engine(config.url, config)
     _SessionLocal = sessionmaker(autocommit=False, autoflush=True, bind=_engine)
+    _async_engine = _create_async_engine(config.url, config)
+    _AsyncSessionLocal = async_sessionmaker(bind=_async_engine, autoflush=True, expire_on_commit=False)
+
+    if config.replica_url:
+        _replica_engine = _create_engine(config.replica_url, config, REPLICA_CONNECT_TIMEOUT_SECONDS)
+        _ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=True, bind=_replica_engine)
+        _replica_state = ReplicaState(config.replica_max_lag_seconds)
+    else:
+        _replica_engine = _ReplicaSessionLocal = _replica_state = None
 
 
 def get_engine():
@@ -24,12 +106,53 @@ def get_engine():
     return _engine
 
 
+def get_async_engine() -> AsyncEngine:
+    if _async_engine is None:
+        raise RuntimeError("Database not initialized. Call init_db first")
+    return _async_engine
+
+
+def get_async_session_local() -> async_sessionmaker[AsyncSession]:
+    if _AsyncSessionLocal is None:
+        raise RuntimeError("Database not initialized. Call init_db first")
+    return _AsyncSessionLocal
+
+
 def get_session_local():
     if _SessionLocal is None:
         raise RuntimeError("Database not initialized. Call init_db first")
     return _SessionLocal
 
 
+def refresh_replica_state() -> None:
+    if _replica_state is None or _replica_engine is None:
+        return
+    try:
+        with _replica_engine.connect() as connection:
+            lag_seconds = connection.execute(REPLICA_LAG_QUERY).scalar()
+    except Exception:
+        lag_seconds = None
+    _replica_state.update(lag_seconds)
+
+
+async def monitor_replica() -> None:
+    if _replica_state is None:
+        return
+    while True:
+        await asyncio.to_thread(refresh_replica_state)
+        await asyncio.sleep(REPLICA_CHECK_INTERVAL_SECONDS)
+
+
+def _replica_usable() -> bool:
+    return _replica_state is not None and _replica_state.usable
+
+
+def get_replica_session_local():
+    if _replica_usable():
+        return _ReplicaSessionLocal
+    return get_session_local()
+
+
 def get_db():
     db = get_session_local()()
     try:
@@ -71,6 +194,15 @@ def db_ro_session() -> AbstractContextManager[Session]:
         db.close()
 
 
+@contextmanager
+def db_replica_session() -> AbstractContextManager[Session]:
+    db = get_replica_session_local()()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 @contextmanager
 def db_rw_session() -> AbstractContextManager[Session]:
     db = get_session_local()()
@@ -82,3 +214,20 @@ def db_rw_session() -> AbstractContextManager[Session]:
         raise
     finally:
         db.close()
+
+
+@asynccontextmanager
+async def async_db_ro_session() -> AsyncIterator[AsyncSession]:
+    async with get_async_session_local()() as db:
+        yield db
+
+
+@asynccontextmanager
+async def async_db_rw_session() -> AsyncIterator[AsyncSession]:
+    async with get_async_session_local()() as db:
+        try:
+            yield db
+            await db.commit()
+        except:
+            await db.rollback()
+            raise
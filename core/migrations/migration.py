@@ -0,0 +1,28 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from sqlalchemy import Connection, text
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+
+
+class MigrationError(Exception):
+    pass
+
+
+def constraint_exists(connection: Connection, name: str) -> bool:
+    return connection.execute(text("SELECT 1 FROM pg_constraint WHERE conname = :name"), {"name": name}).scalar() is not None
+
+
+def table_exists(connection: Connection, name: str) -> bool:
+    return connection.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar() is not None
+
+
+def count_duplicates(connection: Connection, table: str, columns: str, where: str = "TRUE") -> int:
+    stmt = text(f"SELECT count(*) FROM (SELECT 1 FROM {table} WHERE {where} GROUP BY {columns} HAVING count(*) > 1) AS duplicates")
+    return connection.execute(stmt).scalar()
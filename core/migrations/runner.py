@@ -0,0 +1,52 @@
+from datetime import datetime
+
+from sqlalchemy import Engine, text
+
+from core.db import disable_statement_timeout
+from core.migrations.migration import Migration
+from core.migrations.versions import MIGRATIONS
+
+MIGRATIONS_LOCK_ID = 872_310_001
+
+
+def _ensure_migrations_table(engine: Engine) -> None:
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE IF NOT EXISTS schema_migrations ("
+                "version INTEGER PRIMARY KEY, name VARCHAR NOT NULL, applied_at TIMESTAMP NOT NULL)"
+            )
+        )
+
+
+def get_applied_versions(engine: Engine) -> set[int]:
+    _ensure_migrations_table(engine)
+    with engine.connect() as connection:
+        return set(connection.execute(text("SELECT version FROM schema_migrations")).scalars())
+
+
+def get_pending_migrations(engine: Engine) -> list[Migration]:
+    applied = get_applied_versions(engine)
+    return [migration for migration in MIGRATIONS if migration.version not in applied]
+
+
+def apply_migrations(engine: Engine) -> list[Migration]:
+    _ensure_migrations_table(engine)
+    applied: list[Migration] = []
+    with engine.connect() as lock_connection:
+        lock_connection.execute(text("SELECT pg_advisory_lock(:lock_id)"), {"lock_id": MIGRATIONS_LOCK_ID})
+        lock_connection.commit()
+        try:
+            for migration in get_pending_migrations(engine):
+                with engine.begin() as connection:
+                    disable_statement_timeout(connection)
+                    migration.upgrade(connection)
+                    connection.execute(
+                        text("INSERT INTO schema_migrations (version, name, applied_at) VALUES (:version, :name, :applied_at)"),
+                        {"version": migration.version, "name": migration.name, "applied_at": datetime.utcnow()},
+                    )
+                applied.append(migration)
+        finally:
+            lock_connection.execute(text("SELECT pg_advisory_unlock(:lock_id)"), {"lock_id": MIGRATIONS_LOCK_ID})
+            lock_connection.commit()
+    return applied
@@ -0,0 +1,28 @@
+from core.migrations.migration import Migration
+from core.migrations.versions import (
+    m0001_viewer_session_unique,
+    m0002_viewer_session_reward_progress,
+    m0003_query_index_pack,
+    m0004_partition_chat_and_transactions,
+    m0005_user_balance_version,
+    m0006_user_balance_last_active_at,
+    m0007_user_game_stats,
+    m0008_chat_summarizer_settings,
+    m0009_chat_summary_progress,
+    m0010_viewer_identity,
+    m0011_viewer_session_channel_start,
+)
+
+MIGRATIONS: list[Migration] = [
+    m0001_viewer_session_unique.migration,
+    m0002_viewer_session_reward_progress.migration,
+    m0003_query_index_pack.migration,
+    m0004_partition_chat_and_transactions.migration,
+    m0005_user_balance_version.migration,
+    m0006_user_balance_last_active_at.migration,
+    m0007_user_game_stats.migration,
+    m0008_chat_summarizer_settings.migration,
+    m0009_chat_summary_progress.migration,
+    m0010_viewer_identity.migration,
+    m0011_viewer_session_channel_start.migration,
+]
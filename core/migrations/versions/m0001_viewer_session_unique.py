@@ -0,0 +1,39 @@
+from sqlalchemy import Connection, text
+
+from core.migrations.migration import Migration, constraint_exists
+
+
+def upgrade(connection: Connection) -> None:
+    if constraint_exists(connection, "uq_stream_viewer_session_user"):
+        return
+    connection.execute(
+        text(
+            "UPDATE stream_viewer_session s SET total_minutes = merged.total_minutes, session_start = merged.session_start, "
+            "session_end = merged.session_end, last_activity = merged.last_activity, is_watching = merged.is_watching, "
+            "rewards_claimed = merged.rewards_claimed, last_reward_claimed = merged.last_reward_claimed, "
+            "updated_at = merged.updated_at "
+            "FROM (SELECT min(id) AS id, sum(total_minutes) AS total_minutes, "
+            "(array_agg(session_start ORDER BY is_watching DESC, last_activity DESC NULLS LAST))[1] AS session_start, "
+            "(array_agg(session_end ORDER BY is_watching DESC, last_activity DESC NULLS LAST))[1] AS session_end, "
+            "max(last_activity) AS last_activity, bool_or(is_watching) AS is_watching, "
+            "(SELECT coalesce(string_agg(reward, ',' ORDER BY CAST(reward AS INTEGER)), '') FROM ("
+            "SELECT DISTINCT unnest(string_to_array(string_agg(rewards_claimed, ','), ',')) AS reward) rewards "
+            "WHERE reward <> '') AS rewards_claimed, "
+            "max(last_reward_claimed) AS last_reward_claimed, max(updated_at) AS updated_at "
+            "FROM stream_viewer_session GROUP BY stream_id, channel_name, user_name HAVING count(*) > 1) merged "
+            "WHERE s.id = merged.id"
+        )
+    )
+    connection.execute(
+        text(
+            "DELETE FROM stream_viewer_session s USING stream_viewer_session d "
+            "WHERE s.stream_id = d.stream_id AND s.channel_name = d.channel_name "
+            "AND s.user_name = d.user_name AND s.id > d.id"
+        )
+    )
+    connection.execute(
+        text("ALTER TABLE stream_viewer_session ADD CONSTRAINT uq_stream_viewer_session_user UNIQUE (stream_id, channel_name, user_name)")
+    )
+
+
+migration = Migration(version=1, name="viewer_session_unique", upgrade=upgrade)
@@ -0,0 +1,34 @@
+from sqlalchemy import Connection, text
+
+from core.migrations.migration import Migration
+
+STREAM_TIME_REWARD_THRESHOLDS = [30, 60, 90, 120, 150, 180]
+
+
+def upgrade(connection: Connection) -> None:
+    connection.execute(text("ALTER TABLE stream_viewer_session ADD COLUMN IF NOT EXISTS next_reward_minutes INTEGER"))
+    connection.execute(text("ALTER TABLE stream_viewer_session ADD COLUMN IF NOT EXISTS next_reward_at TIMESTAMP"))
+    connection.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_stream_viewer_session_next_reward ON stream_viewer_session (stream_id, next_reward_at)")
+    )
+    connection.execute(
+        text(
+            "UPDATE stream_viewer_session s SET next_reward_minutes = ("
+            "SELECT min(t) FROM unnest(CAST(:thresholds AS INTEGER[])) AS t "
+            "WHERE NOT CAST(t AS TEXT) = ANY(string_to_array(s.rewards_claimed, ','))"
+            ") FROM stream WHERE stream.id = s.stream_id AND stream.is_active AND s.next_reward_minutes IS NULL"
+        ),
+        {"thresholds": STREAM_TIME_REWARD_THRESHOLDS},
+    )
+    connection.execute(
+        text(
+            "UPDATE stream_viewer_session s SET next_reward_at = CASE "
+            "WHEN s.is_watching THEN s.session_start + make_interval(mins => s.next_reward_minutes - s.total_minutes) "
+            "WHEN s.total_minutes >= s.next_reward_minutes THEN now() AT TIME ZONE 'UTC' END "
+            "FROM stream WHERE stream.id = s.stream_id AND stream.is_active "
+            "AND s.next_reward_minutes IS NOT NULL AND s.next_reward_at IS NULL"
+        )
+    )
+
+
+migration = Migration(version=2, name="viewer_session_reward_progress", upgrade=upgrade)
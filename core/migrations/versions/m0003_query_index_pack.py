@@ -0,0 +1,44 @@
+from sqlalchemy import Connection, text
+
+from core.migrations.migration import Migration, MigrationError, constraint_exists, count_duplicates
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_user_balance_channel_balance ON user_balance (channel_name, balance)",
+    "CREATE INDEX IF NOT EXISTS ix_transaction_history_channel_user_created ON transaction_history (channel_name, user_name, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_transaction_history_channel_created ON transaction_history (channel_name, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_chat_message_log_channel_created ON chat_message_log (channel_name, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_chat_message_log_created ON chat_message_log (created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_stream_viewer_session_channel_user_start "
+    "ON stream_viewer_session (channel_name, user_name, session_start)",
+    "CREATE INDEX IF NOT EXISTS ix_stream_viewer_session_watching ON stream_viewer_session (stream_id, last_activity) WHERE is_watching",
+    "CREATE INDEX IF NOT EXISTS ix_stream_started_at ON stream (started_at)",
+    "CREATE INDEX IF NOT EXISTS ix_bet_history_channel_user ON bet_history (channel_name, user_name)",
+    "CREATE INDEX IF NOT EXISTS ix_battle_history_channel_created ON battle_history (channel_name, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_battle_history_channel_opponent_1 ON battle_history (channel_name, opponent_1)",
+    "CREATE INDEX IF NOT EXISTS ix_battle_history_channel_opponent_2 ON battle_history (channel_name, opponent_2)",
+    "CREATE INDEX IF NOT EXISTS ix_twitch_messages_channel_created ON twitch_messages (channel_name, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_user_equipment_channel_user_expires ON user_equipment (channel_name, user_name, expires_at)",
+    "CREATE INDEX IF NOT EXISTS ix_channel_follower_channel_user_name ON channel_follower (channel_name, user_name)",
+    "CREATE INDEX IF NOT EXISTS ix_channel_follower_active_followed ON channel_follower (channel_name, followed_at) WHERE is_active",
+    "CREATE INDEX IF NOT EXISTS ix_channel_follower_unfollowed ON channel_follower (channel_name, unfollowed_at) WHERE NOT is_active",
+    "CREATE INDEX IF NOT EXISTS ix_word_history_channel_created ON word_history (channel_name, created_at)",
+]
+
+
+def upgrade(connection: Connection) -> None:
+    if not constraint_exists(connection, "uq_user_balance_channel_user"):
+        duplicates = count_duplicates(connection, "user_balance", "channel_name, user_name")
+        if duplicates:
+            raise MigrationError(f"user_balance содержит {duplicates} дублирующихся пар (channel_name, user_name), объедините их вручную")
+        connection.execute(text("ALTER TABLE user_balance ADD CONSTRAINT uq_user_balance_channel_user UNIQUE (channel_name, user_name)"))
+
+    duplicates = count_duplicates(connection, "stream", "channel_name", where="is_active")
+    if duplicates:
+        raise MigrationError(f"Найдено {duplicates} каналов с несколькими активными стримами, завершите лишние стримы вручную")
+    connection.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS uq_stream_active_channel ON stream (channel_name) WHERE is_active"))
+
+    for index in INDEXES:
+        connection.execute(text(index))
+
+
+migration = Migration(version=3, name="query_index_pack", upgrade=upgrade)
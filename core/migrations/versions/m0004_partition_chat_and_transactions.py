@@ -0,0 +1,84 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import Connection, text
+
+from app.retention.domain.model.partition import add_months, month_start
+from core.migrations.migration import Migration, table_exists
+
+MONTHS_AHEAD = 2
+
+PARTITIONED_TABLES = {
+    "chat_message_log": [
+        "CREATE INDEX IF NOT EXISTS ix_chat_message_log_channel_created ON chat_message_log (channel_name, created_at)",
+        "CREATE INDEX IF NOT EXISTS ix_chat_message_log_created ON chat_message_log (created_at)",
+    ],
+    "transaction_history": [
+        "CREATE INDEX IF NOT EXISTS ix_transaction_history_channel_user_created "
+        "ON transaction_history (channel_name, user_name, created_at)",
+        "CREATE INDEX IF NOT EXISTS ix_transaction_history_channel_created ON transaction_history (channel_name, created_at)",
+    ],
+}
+
+
+def _create_month_partitions(connection: Connection, table: str, first_month: datetime, last_month: datetime) -> None:
+    month = first_month
+    while month <= last_month:
+        next_month = add_months(month, 1)
+        connection.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {table}_p{month:%Y_%m} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{next_month:%Y-%m-%d}')"
+            )
+        )
+        month = next_month
+
+
+def _create_default_partition(connection: Connection, table: str) -> None:
+    connection.execute(text(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"))
+
+
+def _is_partitioned(connection: Connection, table: str) -> bool:
+    return connection.execute(text("SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass(:name)"), {"name": table}).scalar()
+
+
+def _convert_to_partitioned(connection: Connection, table: str, last_month: datetime) -> None:
+    legacy = f"{table}_unpartitioned"
+    connection.execute(text(f"ALTER TABLE {table} RENAME TO {legacy}"))
+    primary_key = connection.execute(
+        text("SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(:name) AND contype = 'p'"), {"name": legacy}
+    ).scalar()
+    if primary_key:
+        connection.execute(text(f"ALTER TABLE {legacy} DROP CONSTRAINT {primary_key}"))
+    indexes = connection.execute(
+        text("SELECT indexrelid::regclass::text FROM pg_index WHERE indrelid = to_regclass(:name)"), {"name": legacy}
+    ).scalars()
+    for index in list(indexes):
+        connection.execute(text(f"DROP INDEX {index}"))
+
+    connection.execute(text(f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)"))
+    connection.execute(text(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, created_at)"))
+    sequence = connection.execute(text("SELECT pg_get_serial_sequence(:name, 'id')"), {"name": legacy}).scalar()
+    if sequence:
+        connection.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id"))
+
+    oldest = connection.execute(text(f"SELECT min(created_at) FROM {legacy}")).scalar()
+    _create_month_partitions(connection, table, month_start(oldest) if oldest else last_month, last_month)
+    connection.execute(text(f"INSERT INTO {table} SELECT * FROM {legacy}"))
+    connection.execute(text(f"DROP TABLE {legacy}"))
+
+
+def upgrade(connection: Connection) -> None:
+    current_month = month_start(datetime.now(UTC))
+    last_month = add_months(current_month, MONTHS_AHEAD)
+    for table, indexes in PARTITIONED_TABLES.items():
+        if not table_exists(connection, table):
+            continue
+        if not _is_partitioned(connection, table):
+            _convert_to_partitioned(connection, table, last_month)
+        _create_month_partitions(connection, table, current_month, last_month)
+        _create_default_partition(connection, table)
+        for index in indexes:
+            connection.execute(text(index))
+
+
+migration = Migration(version=4, name="partition_chat_and_transactions", upgrade=upgrade)
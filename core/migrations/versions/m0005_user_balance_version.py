@@ -0,0 +1,10 @@
+from sqlalchemy import Connection, text
+
+from core.migrations.migration import Migration
+
+
+def upgrade(connection: Connection) -> None:
+    connection.execute(text("ALTER TABLE user_balance ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 0"))
+
+
+migration = Migration(version=5, name="user_balance_version", upgrade=upgrade)
@@ -0,0 +1,18 @@
+from sqlalchemy import Connection, text
+
+from core.migrations.migration import Migration
+
+
+def upgrade(connection: Connection) -> None:
+    connection.execute(text("ALTER TABLE user_balance ADD COLUMN IF NOT EXISTS last_active_at TIMESTAMP WITHOUT TIME ZONE"))
+    connection.execute(
+        text(
+            "UPDATE user_balance AS ub SET last_active_at = activity.last_active_at "
+            "FROM (SELECT channel_name, user_name, max(created_at) AS last_active_at "
+            "FROM transaction_history GROUP BY channel_name, user_name) AS activity "
+            "WHERE ub.channel_name = activity.channel_name AND ub.user_name = activity.user_name AND ub.last_active_at IS NULL"
+        )
+    )
+
+
+migration = Migration(version=6, name="user_balance_last_active_at", upgrade=upgrade)
@@ -0,0 +1,42 @@
+from sqlalchemy import Connection, text
+
+from core.migrations.migration import Migration
+
+
+def upgrade(connection: Connection) -> None:
+    connection.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS user_game_stats ("
+            "channel_name VARCHAR NOT NULL, "
+            "user_name VARCHAR NOT NULL, "
+            "total_bets BIGINT NOT NULL DEFAULT 0, "
+            "jackpots BIGINT NOT NULL DEFAULT 0, "
+            "total_battles BIGINT NOT NULL DEFAULT 0, "
+            "battle_wins BIGINT NOT NULL DEFAULT 0, "
+            "updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, "
+            "PRIMARY KEY (channel_name, user_name))"
+        )
+    )
+    connection.execute(
+        text(
+            "WITH bets AS ("
+            "SELECT channel_name, user_name, count(*) AS total_bets, count(*) FILTER (WHERE result_type = 'jackpot') AS jackpots "
+            "FROM bet_history GROUP BY channel_name, user_name), "
+            "fighters AS ("
+            "SELECT channel_name, opponent_1 AS user_name, winner FROM battle_history "
+            "UNION ALL SELECT channel_name, opponent_2, winner FROM battle_history WHERE opponent_2 <> opponent_1), "
+            "battles AS ("
+            "SELECT channel_name, user_name, count(*) AS total_battles, count(*) FILTER (WHERE winner = user_name) AS battle_wins "
+            "FROM fighters GROUP BY channel_name, user_name) "
+            "INSERT INTO user_game_stats (channel_name, user_name, total_bets, jackpots, total_battles, battle_wins, updated_at) "
+            "SELECT channel_name, user_name, COALESCE(total_bets, 0), COALESCE(jackpots, 0), "
+            "COALESCE(total_battles, 0), COALESCE(battle_wins, 0), timezone('UTC', now()) "
+            "FROM bets FULL JOIN battles USING (channel_name, user_name) "
+            "ON CONFLICT (channel_name, user_name) DO UPDATE SET "
+            "total_bets = EXCLUDED.total_bets, jackpots = EXCLUDED.jackpots, "
+            "total_battles = EXCLUDED.total_battles, battle_wins = EXCLUDED.battle_wins, updated_at = EXCLUDED.updated_at"
+        )
+    )
+
+
+migration = Migration(version=7, name="user_game_stats", upgrade=upgrade)
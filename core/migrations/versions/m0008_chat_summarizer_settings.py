@@ -0,0 +1,19 @@
+from sqlalchemy import Connection, text
+
+from core.migrations.migration import Migration
+
+
+def upgrade(connection: Connection) -> None:
+    connection.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS chat_summarizer_settings ("
+            "channel_name VARCHAR(255) PRIMARY KEY, "
+            "chunk_tokens INTEGER NOT NULL, "
+            "parallelism INTEGER NOT NULL, "
+            "assistant VARCHAR(255), "
+            "updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL)"
+        )
+    )
+
+
+migration = Migration(version=8, name="chat_summarizer_settings", upgrade=upgrade)
@@ -0,0 +1,20 @@
+from sqlalchemy import Connection, text
+
+from core.migrations.migration import Migration
+
+
+def upgrade(connection: Connection) -> None:
+    connection.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS chat_summary_progress ("
+            "channel_name VARCHAR(255) PRIMARY KEY, "
+            "last_message_created_at TIMESTAMP WITHOUT TIME ZONE, "
+            "last_message_id INTEGER, "
+            "summarized_at TIMESTAMP WITHOUT TIME ZONE, "
+            "summaries JSON NOT NULL, "
+            "updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL)"
+        )
+    )
+
+
+migration = Migration(version=9, name="chat_summary_progress", upgrade=upgrade)
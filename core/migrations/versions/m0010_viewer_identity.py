@@ -0,0 +1,19 @@
+from sqlalchemy import Connection, text
+
+from core.migrations.migration import Migration
+
+
+def upgrade(connection: Connection) -> None:
+    connection.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS viewer_identity ("
+            "login VARCHAR(255) PRIMARY KEY, "
+            "user_id VARCHAR(64) NOT NULL, "
+            "display_name VARCHAR(255) NOT NULL, "
+            "updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL)"
+        )
+    )
+    connection.execute(text("CREATE INDEX IF NOT EXISTS ix_viewer_identity_user_id ON viewer_identity (user_id)"))
+
+
+migration = Migration(version=10, name="viewer_identity", upgrade=upgrade)
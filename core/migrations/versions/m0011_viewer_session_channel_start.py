@@ -0,0 +1,12 @@
+from sqlalchemy import Connection, text
+
+from core.migrations.migration import Migration
+
+
+def upgrade(connection: Connection) -> None:
+    connection.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_stream_viewer_session_channel_start ON stream_viewer_session (channel_name, session_start, id)")
+    )
+
+
+migration = Migration(version=11, name="viewer_session_channel_start", upgrade=upgrade)
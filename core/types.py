@@ -1,8 +1,13 @@
-from contextlib import AbstractContextManager
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from typing import Any, Protocol
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
 class SessionFactory(Protocol):
     def __call__(self, *args: Any, **kwargs: Any) -> AbstractContextManager[Session]: ...
+
+
+class AsyncSessionFactory(Protocol):
+    def __call__(self, *args: Any, **kwargs: Any) -> AbstractAsyncContextManager[AsyncSession]: ...
@@ -1,3 +1,7 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
@@ -11,15 +15,18 @@ from app.battle.di.container import BattleContainer
 from app.betting.di.container import BettingContainer
 from app.bot.bot_manager_factory import BotManagerFactory
 from app.bot.presentation.api import bot_routes, bot_twitch_routes
-from app.chat.application.model.chat_summary_state import ChatSummaryState
 from app.chat.di.container import ChatContainer
 from app.chat.presentation import chat_routes
 from app.core.common.session.session_scoped_factory import SessionScopedFactory
 from app.core.di.application_container import ApplicationContainer
 from app.economy.di.container import EconomyContainer
+from app.economy.presentation import economy_routes
 from app.equipment.di.container import EquipmentContainer
+from app.export.di.container import ExportContainer
+from app.export.presentation import export_routes
 from app.follow.di.container import FollowContainer
 from app.follow.presentation import followers_routes
+from app.game_stats.di.container import GameStatsContainer
 from app.joke.di.container import JokeContainer
 from app.joke.presentation.api import joke_routes
 from app.minigame.di.container import MinigameContainer
@@ -37,14 +44,15 @@ from app.platform.command.battle.application.battle_command_handler import Battl
 from app.platform.command.battle.application.handle_battle_use_case import HandleBattleUseCase
 from app.platform.command.domain.command_router import CommandRouter
 from app.platform.di.container import PlatformContainer
+from app.retention.di.container import RetentionContainer
 from app.shop.di.container import ShopContainer
 from app.shop.presentation.api import shop_routes
 from app.stream.di.container import StreamContainer
 from app.stream.presentation import stream_routes
 from app.viewer.di.container import ViewerContainer
-from app.viewer.infrastructure.cache.viewer_cache_service import ViewerCacheService
+from app.viewer.infrastructure.cache.viewer_id_resolver import ViewerIdResolver
 from app.viewer.presentation.api import viewer_routes
-from core.db import db_ro_session, db_rw_session, init_db
+from core.db import async_db_ro_session, async_db_rw_session, db_ro_session, db_rw_session, init_db, monitor_replica
 
 
 class Application:
@@ -60,6 +68,7 @@ class Application:
             description=self._APPLICATION_DESCRIPTION,
             version=self._VERSION,
             docs_url=self._DOCS_URL,
+            lifespan=self._lifespan,
         )
 
         self._setup_middleware()
@@ -67,6 +76,15 @@ class Application:
         self._setup_health_checks()
         self._setup_state()
 
+    @asynccontextmanager
+    async def _lifespan(self, _: FastAPI) -> AsyncIterator[None]:
+        replica_monitor = asyncio.create_task(monitor_replica())
+        try:
+            yield
+        finally:
+            replica_monitor.cancel()
+            await self.fast_api.state.export_container.export_runner.shutdown()
+
     def _setup_middleware(self):
         self.fast_api.add_middleware(
             CORSMiddleware,
@@ -91,9 +109,12 @@ class Application:
         shop_container = ShopContainer()
         stream_container = StreamContainer()
         chat_container = ChatContainer(session_factory_rw=db_rw_session, session_factory_ro=db_ro_session, logger=self.container.logger)
-        economy_container = EconomyContainer(session_factory_rw=db_rw_session, session_factory_ro=db_ro_session)
+        economy_container = EconomyContainer(
+            session_factory_rw=db_rw_session, session_factory_ro=db_ro_session, logger=self.container.logger
+        )
         follow_container = FollowContainer()
-        betting_container = BettingContainer()
+        game_stats_container = GameStatsContainer()
+        betting_container = BettingContainer(game_stats_repository_factory=game_stats_container.game_stats_repository_factory)
         ask_container = AskContainer(session_factory_rw=db_rw_session, session_factory_ro=db_ro_session)
 
         self.fast_api.state.ai_container = ai_container
@@ -101,14 +122,22 @@ class Application:
         self.fast_api.state.stream_container = stream_container
         self.fast_api.state.economy_container = economy_container
         self.fast_api.state.follow_container = follow_container
+        self.fast_api.state.export_container = ExportContainer(self.container.config.db)
         equipment_container = EquipmentContainer(session_factory_rw=db_rw_session, session_factory_ro=db_ro_session)
 
         minigame_container = MinigameContainer(
             session_factory_ro=db_ro_session, session_factory_rw=db_rw_session, logger=self.container.logger
         )
         notification_container = NotificationContainer(self.container.config.telegram.bot_token)
-        battle_container = BattleContainer(session_factory_rw=db_rw_session, session_factory_ro=db_ro_session)
+        battle_container = BattleContainer(
+            session_factory_rw=db_rw_session,
+            session_factory_ro=db_ro_session,
+            game_stats_repository_factory=game_stats_container.game_stats_repository_factory,
+        )
         viewer_container = ViewerContainer()
+        retention_container = RetentionContainer(
+            session_factory_rw=db_rw_session, session_factory_ro=db_ro_session, db_config=self.container.config.db
+        )
 
         platform_container = PlatformContainer(
             client_id=self.container.config.twitch.client_id,
@@ -118,14 +147,19 @@ class Application:
             logger=self.container.logger,
         )
         platform_repository = platform_container.platform_repository()
-        viewer_cache = ViewerCacheService(platform_repository)
+        viewer_cache = ViewerIdResolver(
+            platform_repository=platform_repository,
+            session_factory_ro=db_ro_session,
+            session_factory_rw=db_rw_session,
+            viewer_identity_repository_factory=viewer_container.viewer_identity_repository_factory,
+            logger=self.container.logger,
+        )
 
         moderation_service = TimeoutUseCase(
             platform_repository=platform_repository,
             viewer_cache=viewer_cache,
             logger=self.container.logger,
         )
-        chat_summary_state = ChatSummaryState()
 
         self.fast_api.state.viewer_container = viewer_container
         self.fast_api.state.platform_container = platform_container
@@ -140,6 +174,8 @@ class Application:
             conversation_service_factory=ai_container.conversation_service_factory,
             system_prompt_repository_factory=ai_container.system_prompt_repository_factory,
             platform_repository=platform_repository,
+            followers_repository_factory=follow_container.followers_repository_factory,
+            viewer_cache=viewer_cache,
         )
 
         ask_command_handler = AskCommandHandler(
@@ -267,8 +303,7 @@ class Application:
             command_prefix=self.container.config.bot.prefix,
             command_name=self.container.config.bot.command_stats,
             economy_policy_factory=economy_container.economy_policy_factory,
-            betting_service_factory=betting_container.betting_service_factory,
-            battle_use_case=battle_container.battle_use_case(),
+            game_stats_repository_factory=game_stats_container.game_stats_repository_factory,
             chat_use_case=chat_container.chat_use_case(),
         )
 
@@ -328,7 +363,6 @@ class Application:
         command_router.register_command_handler(self.container.config.bot.command_rps, rps_command_handler)
 
         chat_message_uow_factory = chat_container.chat_message_uow_factory(
-            economy_policy_factory=economy_container.economy_policy_factory,
             stream_repository_factory=stream_container.stream_repository_factory,
             viewer_repository_factory=viewer_container.viewer_repository_factory,
             conversation_service_factory=ai_container.conversation_service_factory,
@@ -341,6 +375,7 @@ class Application:
                 get_intent_from_text_use_case_factory=ai_container.get_intent_from_text_use_case_factory,
                 prompt_service=ai_container.prompt_service,
                 generate_response_use_case_factory=ai_container.generate_response_use_case_factory,
+                activity_ledger=economy_container.activity_ledger,
                 db_ro_session=db_ro_session,
             ),
             handle_reply_use_case=HandleReplyUseCase(
@@ -358,17 +393,23 @@ class Application:
         bot_manager_factory = BotManagerFactory(
             session_factory_rw=db_rw_session,
             session_factory_ro=db_ro_session,
+            async_session_factory_rw=async_db_rw_session,
+            async_session_factory_ro=async_db_ro_session,
             platform_repository=platform_repository,
             stream_repository_factory=stream_container.stream_repository_factory,
+            async_stream_repository_factory=stream_container.async_stream_repository_factory,
+            active_stream_registry=stream_container.active_stream_registry,
             minigame_repository=minigame_repository,
             platform_chat_client=platform_chat_client,
             chat_repository_factory=chat_container.chat_repository_factory,
+            summarizer_settings_repository_factory=chat_container.summarizer_settings_repository_factory,
+            chat_summary_progress_repository_factory=chat_container.chat_summary_progress_repository_factory,
             generate_response_use_case_factory=ai_container.generate_response_use_case_factory,
-            chat_summary_state=chat_summary_state,
             conversation_service_factory=ai_container.conversation_service_factory,
             jokes_configuration_repository_factory=SessionScopedFactory(joke_container.jokes_configuration_repository),
             viewer_repository_factory=viewer_container.viewer_repository_factory,
-            battle_use_case=battle_container.battle_use_case(),
+            async_viewer_repository_factory=viewer_container.async_viewer_repository_factory,
+            stream_statistics_repository_factory=stream_container.stream_statistics_repository_factory,
             economy_policy_factory=economy_container.economy_policy_factory,
             notification_repository=notification_container.notification_repository(),
             notification_group_id=self.container.config.telegram.group_id,
@@ -385,7 +426,11 @@ class Application:
             followers_repository_factory=follow_container.followers_repository_factory,
             platform_auth=platform_container.platform_auth,
             api_client=platform_container.api_client,
+            intent_detector=ai_container.intent_detector,
             viewer_cache=viewer_cache,
+            chat_transcript_sink=chat_container.chat_transcript_sink,
+            activity_ledger=economy_container.activity_ledger,
+            maintain_partitions_use_case=retention_container.maintain_partitions_use_case(),
             logger=self.container.logger,
         )
         bot_manager = bot_manager_factory.create()
@@ -402,6 +447,8 @@ class Application:
         self.fast_api.include_router(joke_routes.router, prefix="/api/v1/jokes", tags=["Jokes"])
         self.fast_api.include_router(stream_routes.router, prefix="/api/v1/streams", tags=["Streams"])
         self.fast_api.include_router(followers_routes.router, prefix="/api/v1/followers", tags=["Followers"])
+        self.fast_api.include_router(economy_routes.router, prefix="/api/v1/economy", tags=["Economy"])
+        self.fast_api.include_router(export_routes.router, prefix="/api/v1/exports", tags=["Export"])
         self.fast_api.include_router(viewer_routes.router, prefix="/api/v1", tags=["Users"])
         self.fast_api.include_router(shop_routes.router, prefix="/api/v1/shop", tags=["Shop"])
         self.fast_api.include_router(llm_routes.router, prefix="/api/v1/assistant", tags=["Assistant"])
@@ -0,0 +1,263 @@
+import json
+import sys
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from sqlalchemy import Engine, create_engine, event, text
+from sqlalchemy.orm import Session
+
+import scripts.db_init  # noqa: F401
+from app.ai.gen.conversation.infrastructure.conversation_repository import ConversationRepositoryImpl
+from app.battle.infrastructure.battle_repository import BattleRepositoryImpl
+from app.betting.infrastructure.betting_repository import BettingRepositoryImpl
+from app.chat.domain.model.chat_cursor import ChatCursor
+from app.chat.infrastructure.chat_repository import ChatRepositoryImpl
+from app.common.domain.keyset import KeysetCursor
+from app.core.di.application_container import ApplicationContainer
+from app.economy.infrastructure.economy_repository import EconomyRepositoryImpl
+from app.economy.infrastructure.transaction_history_repository import TransactionHistoryRepositoryImpl
+from app.equipment.infrastructure.equipment_repository import EquipmentRepositoryImpl
+from app.equipment.infrastructure.mapper.user_equipment_mapper import UserEquipmentMapper
+from app.export.domain.model.export_request import ExportDataset, ExportFileFormat, ExportRequest
+from app.export.infrastructure.export_repository import ExportRepositoryImpl
+from app.follow.infrastructure.followers_repository import FollowersRepositoryImpl
+from app.game_stats.infrastructure.game_stats_repository import GameStatsRepositoryImpl
+from app.minigame.infrastructure.word_history_repository import WordHistoryRepositoryImpl
+from app.retention.di.container import PARTITIONED_TABLES
+from app.retention.domain.model.partition import add_months, month_start
+from app.retention.infrastructure.partition_repository import MONTH_SUFFIX, PartitionRepositoryImpl
+from app.shop.infrastructure.mapper.shop_item_mapper import ShopItemMapper
+from app.stream.infrastructure.stream_repository import StreamRepositoryImpl
+from app.stream.infrastructure.stream_statistics_repository import StreamStatisticsRepositoryImpl
+from app.viewer.session.infrastructure.session_repository import ViewerRepositoryImpl
+from core.db import Base
+from core.migrations.runner import apply_migrations
+
+SCHEMA = "query_plan_check"
+CHANNELS = 20
+USERS_PER_CHANNEL = 2000
+NOW = datetime(2025, 1, 31, 12, 0)
+
+SEED = [
+    "INSERT INTO user_balance (channel_name, user_name, balance, total_earned, total_spent, message_count, created_at, updated_at) "
+    "SELECT 'channel_' || c, 'user_' || u, (random() * 10000)::int, 0, 0, 0, :now, :now "
+    "FROM generate_series(1, :channels) c, generate_series(1, :users) u",
+    "INSERT INTO transaction_history (channel_name, user_name, transaction_type, amount, balance_before, balance_after, created_at) "
+    "SELECT 'channel_' || (i % :channels + 1), 'user_' || (i % :users + 1), 'DAILY_BONUS', 100, 0, 100, "
+    "CAST(:now AS TIMESTAMP) - make_interval(mins => i % 86400) FROM generate_series(1, 400000) i",
+    "INSERT INTO chat_message_log (channel_name, user_name, content, created_at) "
+    "SELECT 'channel_' || (i % :channels + 1), 'user_' || (i % :users + 1), 'message ' || i, "
+    "CAST(:now AS TIMESTAMP) - make_interval(secs => i * 10) FROM generate_series(1, 400000) i",
+    "INSERT INTO twitch_messages (channel_name, role, content, created_at) "
+    "SELECT 'channel_' || (i % :channels + 1), 'USER', 'message ' || i, CAST(:now AS TIMESTAMP) - make_interval(mins => i) "
+    "FROM generate_series(1, 100000) i",
+    "INSERT INTO stream (channel_name, started_at, ended_at, total_viewers, max_concurrent_viewers, is_active, created_at, updated_at) "
+    "SELECT 'channel_' || (i % :channels + 1), CAST(:now AS TIMESTAMP) - make_interval(hours => i), "
+    "CASE WHEN i > :channels THEN CAST(:now AS TIMESTAMP) - make_interval(hours => i - 1) END, 0, 0, i <= :channels, :now, :now "
+    "FROM generate_series(1, 20000) i",
+    "INSERT INTO stream_viewer_session (stream_id, channel_name, user_name, session_start, total_minutes, last_activity, "
+    "is_watching, rewards_claimed, next_reward_minutes, next_reward_at, created_at, updated_at) "
+    "SELECT s.id, s.channel_name, 'user_' || u, s.started_at, 0, s.started_at, s.is_active, '', 30, "
+    "CASE WHEN s.is_active THEN s.started_at + interval '30 minutes' END, :now, :now "
+    "FROM stream s, generate_series(1, 20) u",
+    "INSERT INTO bet_history (channel_name, user_name, slot_result, result_type, rarity_level, created_at) "
+    "SELECT 'channel_' || (i % :channels + 1), 'user_' || (i % :users + 1), 'a | b | c', 'miss', 'COMMON', :now "
+    "FROM generate_series(1, 200000) i",
+    "INSERT INTO battle_history (channel_name, opponent_1, opponent_2, winner, result_text, created_at) "
+    "SELECT 'channel_' || (i % :channels + 1), 'user_' || (i % :users + 1), 'user_' || ((i * 7) % :users + 1), "
+    "'user_' || (i % :users + 1), 'result', CAST(:now AS TIMESTAMP) - make_interval(mins => i) FROM generate_series(1, 200000) i",
+    "INSERT INTO channel_follower (channel_name, user_id, user_name, display_name, followed_at, first_seen_at, last_seen_at, "
+    "unfollowed_at, is_active, created_at, updated_at) "
+    "SELECT 'channel_' || c, u::text, 'user_' || u, 'User ' || u, :now, :now, :now, "
+    "CASE WHEN u % 10 = 0 THEN CAST(:now AS TIMESTAMP) END, u % 10 <> 0, :now, :now "
+    "FROM generate_series(1, :channels) c, generate_series(1, :users) u",
+    "INSERT INTO shop_items (channel_name, name, price, effects, is_active, created_at, updated_at) "
+    "SELECT 'channel_' || c, 'item_' || i, 100, '{}', true, :now, :now FROM generate_series(1, :channels) c, generate_series(1, 10) i",
+    "INSERT INTO user_equipment (channel_name, user_name, shop_item_id, expires_at, created_at) "
+    "SELECT 'channel_' || (i % :channels + 1), 'user_' || (i % :users + 1), (i % 200) + 1, "
+    "CAST(:now AS TIMESTAMP) + make_interval(days => i % 30 - 15), :now FROM generate_series(1, 200000) i",
+    "INSERT INTO user_game_stats (channel_name, user_name, total_bets, jackpots, total_battles, battle_wins, updated_at) "
+    "SELECT 'channel_' || c, 'user_' || u, 100, 1, 10, 5, :now FROM generate_series(1, :channels) c, generate_series(1, :users) u",
+    "INSERT INTO word_history (channel_name, word, created_at) "
+    "SELECT 'channel_' || (i % :channels + 1), 'word_' || i, CAST(:now AS TIMESTAMP) - make_interval(mins => i) "
+    "FROM generate_series(1, 100000) i",
+]
+
+SEEDED_TABLES = {
+    "user_balance",
+    "transaction_history",
+    "chat_message_log",
+    "twitch_messages",
+    "stream",
+    "stream_viewer_session",
+    "bet_history",
+    "battle_history",
+    "channel_follower",
+    "user_equipment",
+    "word_history",
+    "user_game_stats",
+}
+
+CHANNEL = "channel_3"
+USER = "user_42"
+STREAM_ID = 3
+
+
+def export_check(dataset: ExportDataset) -> Callable[[Session], object]:
+    request = ExportRequest(dataset=dataset, file_format=ExportFileFormat.PARQUET, channel_name=CHANNEL, date_from=None, date_to=None)
+    return lambda db: next(iter(ExportRepositoryImpl(db).iter_batches(request, 1000)), None)
+
+
+CHECKS: dict[str, Callable[[Session], object]] = {
+    "economy.get_balance": lambda db: EconomyRepositoryImpl(db).get_balance(CHANNEL, USER),
+    "economy.lock_balances": lambda db: EconomyRepositoryImpl(db).lock_balances(CHANNEL, [USER, "user_43"]),
+    "economy.list_leaderboard_entries": lambda db: EconomyRepositoryImpl(db).list_leaderboard_entries(CHANNEL),
+    "economy.list_transactions": lambda db: TransactionHistoryRepositoryImpl(db).list_transactions(
+        CHANNEL, USER, KeysetCursor(at=NOW, id=1000), 50
+    ),
+    "chat.list_between": lambda db: ChatRepositoryImpl(db).list_between(CHANNEL, NOW - timedelta(hours=1), NOW),
+    "chat.list_page": lambda db: ChatRepositoryImpl(db).list_page(
+        CHANNEL, NOW - timedelta(hours=1), NOW, ChatCursor(NOW - timedelta(minutes=30), 1), 500
+    ),
+    "chat.count_page": lambda db: ChatRepositoryImpl(db).count_page(
+        CHANNEL, NOW - timedelta(hours=1), NOW, ChatCursor(NOW - timedelta(minutes=30), 1)
+    ),
+    "chat.list_last": lambda db: ChatRepositoryImpl(db).list_last(CHANNEL, 50),
+    "chat.count_between": lambda db: ChatRepositoryImpl(db).count_between(CHANNEL, NOW - timedelta(hours=1), NOW),
+    "chat.get_last_chat_messages_since": lambda db: ChatRepositoryImpl(db).get_last_chat_messages_since(CHANNEL, NOW - timedelta(hours=1)),
+    "chat.top_chat_users": lambda db: ChatRepositoryImpl(db).top_chat_users(10, NOW - timedelta(hours=1), NOW),
+    "conversation.get_last_messages": lambda db: ConversationRepositoryImpl(db).get_last_messages(CHANNEL),
+    "stream.list_streams": lambda db: StreamRepositoryImpl(db).list_streams(KeysetCursor(at=NOW, id=1000), 50),
+    "stream.get_active_stream": lambda db: StreamRepositoryImpl(db).get_active_stream(CHANNEL),
+    "stream.get_stream_statistics": lambda db: StreamStatisticsRepositoryImpl(db).get_stream_statistics(
+        CHANNEL, NOW - timedelta(hours=6), NOW
+    ),
+    "stream.get_stream_with_sessions": lambda db: StreamRepositoryImpl(db).get_stream_with_sessions(STREAM_ID),
+    "viewer.finish_sessions": lambda db: ViewerRepositoryImpl(db).finish_sessions(STREAM_ID, NOW, inactive_only=True),
+    "viewer.get_due_reward_sessions": lambda db: ViewerRepositoryImpl(db).get_due_reward_sessions(STREAM_ID, NOW),
+    "viewer.get_stream_watchers_count": lambda db: ViewerRepositoryImpl(db).get_stream_watchers_count(STREAM_ID),
+    "viewer.get_unique_viewers_count": lambda db: ViewerRepositoryImpl(db).get_unique_viewers_count(STREAM_ID),
+    "viewer.get_user_sessions": lambda db: ViewerRepositoryImpl(db).get_user_sessions(CHANNEL, USER, None, 50),
+    "betting.get_user_bets": lambda db: BettingRepositoryImpl(db).get_user_bets(CHANNEL, USER),
+    "battle.get_user_battles": lambda db: BattleRepositoryImpl(db).get_user_battles(CHANNEL, USER),
+    "game_stats.get_users_stats": lambda db: GameStatsRepositoryImpl(db).get_users_stats(CHANNEL, [USER, USER.upper()]),
+    "battle.get_battles": lambda db: BattleRepositoryImpl(db).get_battles(CHANNEL, NOW - timedelta(hours=1)),
+    "equipment.list_user_equipment": lambda db: EquipmentRepositoryImpl(db, UserEquipmentMapper(ShopItemMapper())).list_user_equipment(
+        CHANNEL, USER
+    ),
+    "follow.get_by_user_name": lambda db: FollowersRepositoryImpl(db).get_by_user_name(CHANNEL, USER),
+    "follow.list_active": lambda db: FollowersRepositoryImpl(db).list_active(CHANNEL, None, 50),
+    "follow.list_unfollowed_since": lambda db: FollowersRepositoryImpl(db).list_unfollowed_since(CHANNEL, None, 50),
+    "follow.get_active_followed_at": lambda db: FollowersRepositoryImpl(db).get_active_followed_at(CHANNEL, ["41", "42", "43"]),
+    "follow.mark_unfollowed_not_seen_since": lambda db: FollowersRepositoryImpl(db).mark_unfollowed_not_seen_since(CHANNEL, NOW),
+    "minigame.list_recent_words": lambda db: WordHistoryRepositoryImpl(db).list_recent_words(CHANNEL, 50),
+    "export.chat_messages": export_check(ExportDataset.CHAT_MESSAGES),
+    "export.transactions": export_check(ExportDataset.TRANSACTIONS),
+    "export.viewer_sessions": export_check(ExportDataset.VIEWER_SESSIONS),
+}
+
+SORT_FREE_CHECKS = {"export.chat_messages", "export.transactions", "export.viewer_sessions"}
+
+
+def prepare_schema(engine: Engine) -> set[str]:
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    Base.metadata.create_all(engine)
+    apply_migrations(engine)
+    with Session(engine) as db, db.begin():
+        partition_repository = PartitionRepositoryImpl(db)
+        for table_name in PARTITIONED_TABLES:
+            for offset in range(-3, 2):
+                partition_repository.ensure_month_partition(table_name, add_months(month_start(NOW), offset))
+    params = {"now": NOW, "channels": CHANNELS, "users": USERS_PER_CHANNEL}
+    with engine.begin() as connection:
+        for statement in SEED:
+            connection.execute(text(statement), params)
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("ANALYZE"))
+        empty_relations = connection.execute(
+            text("SELECT relname FROM pg_class WHERE relnamespace = to_regnamespace(:schema) AND relkind = 'r' AND reltuples <= 0"),
+            {"schema": SCHEMA},
+        )
+        return set(empty_relations.scalars())
+
+
+def capture_statements(engine: Engine, check: Callable[[Session], object]) -> list[tuple[str, object, bool]]:
+    captured: list[tuple[str, object, bool]] = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE", "WITH")):
+            captured.append((statement, parameters, bool(context.execution_options.get("stream_results"))))
+
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        event.listen(connection, "before_cursor_execute", on_execute)
+        try:
+            check(Session(bind=connection))
+        finally:
+            event.remove(connection, "before_cursor_execute", on_execute)
+            transaction.rollback()
+    return captured
+
+
+def has_sort(node: dict) -> bool:
+    return node.get("Node Type") == "Sort" or any(has_sort(child) for child in node.get("Plans", []))
+
+
+def find_seq_scans(node: dict, empty_relations: set[str]) -> list[str]:
+    found = []
+    relation_name = node.get("Relation Name", "")
+    relation = MONTH_SUFFIX.sub("", relation_name)
+    if node.get("Node Type") == "Seq Scan" and relation in SEEDED_TABLES and relation_name not in empty_relations:
+        found.append(relation)
+    for child in node.get("Plans", []):
+        found.extend(find_seq_scans(child, empty_relations))
+    return found
+
+
+def explain(engine: Engine, statement: str, parameters: object, server_side_cursor: bool) -> dict:
+    if server_side_cursor:
+        statement = f"DECLARE query_plan_check CURSOR FOR {statement}"
+    with engine.connect() as connection:
+        plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def main() -> int:
+    app_container = ApplicationContainer()
+    engine = create_engine(app_container.config.db.url, connect_args={"options": f"-c search_path={SCHEMA}"})
+    failures = 0
+    try:
+        print(f"Подготовка схемы {SCHEMA}...")
+        empty_relations = prepare_schema(engine)
+        for name, check in CHECKS.items():
+            for statement, parameters, server_side_cursor in capture_statements(engine, check):
+                plan = explain(engine, statement, parameters, server_side_cursor)
+                seq_scans = find_seq_scans(plan, empty_relations)
+                if seq_scans:
+                    failures += 1
+                    print(f"FAIL {name}: последовательное сканирование {', '.join(sorted(set(seq_scans)))}")
+                    print(f"     {' '.join(statement.split())}")
+                elif name in SORT_FREE_CHECKS and has_sort(plan):
+                    failures += 1
+                    print(f"FAIL {name}: сортировка без подходящего индекса")
+                    print(f"     {' '.join(statement.split())}")
+                else:
+                    print(f"OK   {name}")
+    finally:
+        with engine.begin() as connection:
+            connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        engine.dispose()
+
+    if failures:
+        print(f"Найдено запросов с последовательным сканированием или сортировкой: {failures}")
+        return 1
+    print("Все запросы используют индексы")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,17 +14,22 @@ from app.auth.infrastructure.password_hasher import BcryptPasswordHasher
 from app.battle.infrastructure.db.battle_history import BattleHistory
 from app.betting.infrastructure.db.bet_history import BetHistory
 from app.chat.infrastructure.db.chat_message import ChatMessage
+from app.chat.infrastructure.db.chat_summary_progress import ChatSummaryProgressRow
+from app.chat.infrastructure.db.summarizer_settings import SummarizerSettingsRow
 from app.core.di.application_container import ApplicationContainer
 from app.economy.infrastructure.db.transaction_history import TransactionHistory
 from app.economy.infrastructure.db.user_balance import UserBalance
 from app.equipment.infrastructure.db.user_equipment import UserEquipment
 from app.follow.infrastructure.db.follower import ChannelFollowerRow
+from app.game_stats.infrastructure.db.user_game_stats import UserGameStatsRow
 from app.joke.infrastructure.db.configuration import JokesConfigurationRow
 from app.minigame.infrastructure.db.word_history import WordHistory
 from app.shop.infrastructure.db.model.shop_item import ShopItem
 from app.stream.infrastructure.db.stream import Stream
+from app.viewer.infrastructure.db.viewer_identity import ViewerIdentityRow
 from app.viewer.session.infrastructure.db.model.viewer_session import StreamViewerSession
 from core.db import db_ro_session, db_rw_session, get_engine, init_db
+from core.migrations.runner import apply_migrations
 
 
 def test_connection():
@@ -51,8 +56,11 @@ def create_tables():
         with get_engine().begin() as connection:
             AIMessage.__table__.create(bind=connection, checkfirst=True)
             ChatMessage.__table__.create(bind=connection, checkfirst=True)
+            SummarizerSettingsRow.__table__.create(bind=connection, checkfirst=True)
+            ChatSummaryProgressRow.__table__.create(bind=connection, checkfirst=True)
             BattleHistory.__table__.create(bind=connection, checkfirst=True)
             BetHistory.__table__.create(bind=connection, checkfirst=True)
+            UserGameStatsRow.__table__.create(bind=connection, checkfirst=True)
             UserBalance.__table__.create(bind=connection, checkfirst=True)
             TransactionHistory.__table__.create(bind=connection, checkfirst=True)
             UserEquipment.__table__.create(bind=connection, checkfirst=True)
@@ -62,6 +70,7 @@ def create_tables():
             User.__table__.create(bind=connection, checkfirst=True)
             AccessToken.__table__.create(bind=connection, checkfirst=True)
             ChannelFollowerRow.__table__.create(bind=connection, checkfirst=True)
+            ViewerIdentityRow.__table__.create(bind=connection, checkfirst=True)
             SystemPromptRow.__table__.create(bind=connection, checkfirst=True)
             ShopItem.__table__.create(bind=connection, checkfirst=True)
             JokesConfigurationRow.__table__.create(bind=connection, checkfirst=True)
@@ -77,6 +86,18 @@ def create_tables():
         print(f"Ошибка при создании таблиц: {e}")
 
 
+def apply_schema_migrations():
+    try:
+        applied = apply_migrations(get_engine())
+        if applied:
+            for migration in applied:
+                print(f"Применена миграция {migration.version:04d}_{migration.name}")
+        else:
+            print("Схема базы данных актуальна, миграций для применения нет")
+    except Exception as e:
+        print(f"Ошибка при применении миграций: {e}")
+
+
 def create_admin():
     try:
         password_hasher = BcryptPasswordHasher()
@@ -118,4 +139,5 @@ if __name__ == "__main__":
     init_db(app_container.config.db)
     test_connection()
     create_tables()
+    apply_schema_migrations()
     create_admin()
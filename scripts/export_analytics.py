@@ -0,0 +1,42 @@
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+from app.core.di.application_container import ApplicationContainer
+from app.export.di.container import export_dataset_use_case
+from app.export.domain.model.export_request import ExportDataset, ExportFileFormat, ExportRequest
+from core.db import init_db, refresh_replica_state
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Выгрузка аналитики канала в Parquet/XLSX")
+    parser.add_argument("dataset", type=ExportDataset, choices=list(ExportDataset), help="Набор данных")
+    parser.add_argument("channel", help="Имя канала")
+    parser.add_argument(
+        "--format", dest="file_format", type=ExportFileFormat, choices=list(ExportFileFormat), default=ExportFileFormat.PARQUET
+    )
+    parser.add_argument("--from", dest="date_from", type=datetime.fromisoformat, default=None, help="Начало периода (ISO 8601)")
+    parser.add_argument("--to", dest="date_to", type=datetime.fromisoformat, default=None, help="Конец периода (ISO 8601)")
+    parser.add_argument("--output", type=Path, default=None, help="Путь к файлу выгрузки")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    request = ExportRequest(
+        dataset=args.dataset,
+        file_format=args.file_format,
+        channel_name=args.channel,
+        date_from=args.date_from,
+        date_to=args.date_to,
+    )
+    target = args.output or Path(f"{request.dataset.value}_{request.channel_name}.{request.file_format.value}")
+
+    init_db(ApplicationContainer().config.db)
+    refresh_replica_state()
+    result = export_dataset_use_case().handle(request, target)
+    print(f"Выгружено строк: {result.rows} -> {result.path}")
+
+
+if __name__ == "__main__":
+    main()